@@ -87,7 +87,7 @@ class FinancialPlannerTools:
         # RSU calculator
         rsu_config = self.spec.get('restrictedStockUnits', {})
         self.rsu_calculator = RSUCalculator(
-            previous_grants=rsu_config.get('previousGrants', []).copy(),
+            previous_grants=rsu_config.get('previousGrants', []),
             first_year=first_year,
             last_year=last_working_year,
             first_year_stock_price=rsu_config.get('currentStockPrice', 0),
@@ -9,6 +9,9 @@ The calculation is organized into three distinct loops:
 3. Post-withdrawal years - retirement without disbursements
 """
 
+from functools import lru_cache
+from types import MappingProxyType
+
 from model.PlanData import YearlyData, PlanData
 from tax.FederalDetails import FederalDetails
 from tax.StateDetails import StateDetails
@@ -18,6 +21,28 @@ from tax.MedicareDetails import MedicareDetails
 from calc.rsu_calculator import RSUCalculator
 
 
+@lru_cache(maxsize=64)
+def _hsa_withdrawal_targets(initial_withdrawal: float, growth: float, first_year: int,
+                            last_working_year: int, last_planning_year: int,
+                            medicare_eligibility_year: int) -> MappingProxyType:
+    """Build the yearly HSA withdrawal targets, before capping at the balance.
+    
+    The withdrawal is inflated each year after the first and doubled at
+    Medicare eligibility in retirement (medical expenses typically increase).
+    Plans with the same inputs share one read-only table.
+    """
+    targets = {}
+    withdrawal = initial_withdrawal
+    for year in range(first_year, last_planning_year + 1):
+        is_retired = year > last_working_year
+        if is_retired or year > first_year:
+            withdrawal = withdrawal * growth
+            if is_retired and year == medicare_eligibility_year:
+                withdrawal = withdrawal * 2
+        targets[year] = withdrawal
+    return MappingProxyType(targets)
+
+
 class PlanCalculator:
     """Calculator that builds complete plan data in three phases.
     
@@ -124,6 +149,30 @@ class PlanCalculator:
         # Life insurance
         life_premium = spec.get('companyProvidedLifeInsurance', {}).get('annualPremium', 0)
         
+        # ESPP and RSU income depend only on the spec, not on the loop state.
+        # An explicit esppIncome in the spec overrides the first year's value.
+        has_first_year_espp_income = 'esppIncome' in income_spec
+        first_year_espp_income = income_spec.get('esppIncome', 0)
+        espp_taxable = self.espp.taxable_from_spec(spec)
+        rsu_vested_values = self.rsu_calculator.vested_value
+        
+        # Year-over-year growth multipliers, computed once and shared by all three loops
+        salary_growth = 1 + salary_increase_rate
+        medical_growth = 1 + medical_inflation
+        bracket_growth = 1 + inflation_rate
+        local_tax_growth = 1 + local_tax_inflation
+        expense_growth = 1 + expense_inflation
+        travel_growth = 1 + travel_inflation
+        premium_growth = 1 + premium_inflation
+        hsa_withdrawal_growth = 1 + hsa_withdrawal_inflation
+        
+        # Tax methods called every year in all three loops, looked up once
+        federal_tax_burden = self.federal.taxBurden
+        federal_deductions = self.federal.totalDeductions
+        federal_ltcg_tax = self.federal.longTermCapitalGainsTax
+        state_tax_burden = self.state.taxBurden
+        state_stcg_tax = self.state.shortTermCapitalGainsTax
+        
         # Initialize plan data
         plan = PlanData(
             first_year=first_year,
@@ -140,7 +189,6 @@ class PlanCalculator:
         current_travel_expenses = initial_travel_expenses
         current_insurance_premium = initial_insurance_premium
         current_medicare_premium = initial_medicare_premium
-        current_hsa_withdrawal = initial_hsa_withdrawal
         current_max_hsa = 0  # Will be set from last working year for retirement contributions
         
         # Track balances
@@ -153,6 +201,11 @@ class PlanCalculator:
         disbursement_start = last_working_year + 1
         disbursement_end = disbursement_start + disbursement_years - 1
         
+        # HSA withdrawal target for every year before capping at the balance
+        hsa_withdrawal_targets = _hsa_withdrawal_targets(
+            initial_hsa_withdrawal, hsa_withdrawal_growth, first_year,
+            last_working_year, last_planning_year, medicare_eligibility_year)
+        
         # ============================================================
         # LOOP 1: Working Years
         # ============================================================
@@ -165,15 +218,14 @@ class PlanCalculator:
             
             # Apply inflation from prior year (except first year)
             if year > first_year:
-                current_salary = current_salary * (1 + salary_increase_rate)
-                current_medical = current_medical * (1 + medical_inflation)
-                current_employer_hsa = current_employer_hsa * (1 + inflation_rate)
-                current_local_tax = current_local_tax * (1 + local_tax_inflation)
-                current_annual_expenses = current_annual_expenses * (1 + expense_inflation)
-                current_travel_expenses = current_travel_expenses * (1 + travel_inflation)
-                current_insurance_premium = current_insurance_premium * (1 + premium_inflation)
-                current_medicare_premium = current_medicare_premium * (1 + premium_inflation)
-                current_hsa_withdrawal = current_hsa_withdrawal * (1 + hsa_withdrawal_inflation)
+                current_salary = current_salary * salary_growth
+                current_medical = current_medical * medical_growth
+                current_employer_hsa = current_employer_hsa * bracket_growth
+                current_local_tax = current_local_tax * local_tax_growth
+                current_annual_expenses = current_annual_expenses * expense_growth
+                current_travel_expenses = current_travel_expenses * travel_growth
+                current_insurance_premium = current_insurance_premium * premium_growth
+                current_medicare_premium = current_medicare_premium * premium_growth
                 
                 # Calculate appreciation amounts before applying growth
                 yd.appreciation_taxable = balance_taxable * taxable_appreciation
@@ -203,13 +255,13 @@ class PlanCalculator:
             yd.total_deferral = yd.base_deferral + yd.bonus_deferral
             
             # ESPP income
-            if year == first_year and 'esppIncome' in income_spec:
-                yd.espp_income = income_spec.get('esppIncome', 0)
+            if year == first_year and has_first_year_espp_income:
+                yd.espp_income = first_year_espp_income
             else:
-                yd.espp_income = self.espp.taxable_from_spec(spec)
+                yd.espp_income = espp_taxable
             
             # RSU income
-            yd.rsu_vested_value = self.rsu_calculator.vested_value.get(year, 0)
+            yd.rsu_vested_value = rsu_vested_values.get(year, 0)
             
             # Realized capital gains (withdrawn from taxable account)
             yd.short_term_capital_gains = balance_taxable * short_term_cg_percent
@@ -230,11 +282,11 @@ class PlanCalculator:
             # State tax (for SALT itemized deduction)
             # gross_income already includes LTCG now
             state_taxable = yd.gross_income - yd.total_deferral
-            preliminary_state_tax = self.state.taxBurden(state_taxable, yd.medical_dental_vision, 
+            preliminary_state_tax = state_tax_burden(state_taxable, yd.medical_dental_vision, 
                                                           year=year, employer_hsa_contribution=yd.employer_hsa)
             
             # Federal deductions
-            deductions = self.federal.totalDeductions(year, yd.employer_hsa, 
+            deductions = federal_deductions(year, yd.employer_hsa, 
                                                        preliminary_state_tax, yd.local_tax)
             
             yd.standard_deduction = deductions['standardDeduction']
@@ -248,10 +300,10 @@ class PlanCalculator:
             yd.adjusted_gross_income = yd.gross_income - yd.total_deductions - yd.total_deferral
             
             # Federal taxes
-            federal_result = self.federal.taxBurden(yd.adjusted_gross_income, year)
+            federal_result = federal_tax_burden(yd.adjusted_gross_income, year)
             yd.ordinary_income_tax = federal_result.totalFederalTax
             yd.marginal_bracket = federal_result.marginalBracket
-            yd.long_term_capital_gains_tax = self.federal.longTermCapitalGainsTax(
+            yd.long_term_capital_gains_tax = federal_ltcg_tax(
                 yd.adjusted_gross_income, yd.long_term_capital_gains, year)
             yd.federal_tax = yd.ordinary_income_tax + yd.long_term_capital_gains_tax
             
@@ -264,7 +316,7 @@ class PlanCalculator:
             
             # State taxes
             yd.state_income_tax = preliminary_state_tax
-            yd.state_short_term_capital_gains_tax = self.state.shortTermCapitalGainsTax(yd.short_term_capital_gains)
+            yd.state_short_term_capital_gains_tax = state_stcg_tax(yd.short_term_capital_gains)
             yd.state_tax = yd.state_income_tax + yd.state_short_term_capital_gains_tax
             
             # Total taxes and take home
@@ -312,7 +364,7 @@ class PlanCalculator:
             balance_deferred_comp += yd.deferred_comp_contribution
             
             # HSA withdrawal (tax-free for qualified medical expenses)
-            yd.hsa_withdrawal = min(current_hsa_withdrawal, balance_hsa)  # Can't withdraw more than balance
+            yd.hsa_withdrawal = min(hsa_withdrawal_targets[year], balance_hsa)  # Can't withdraw more than balance
             balance_hsa -= yd.hsa_withdrawal
             
             yd.balance_ira = balance_401k
@@ -367,20 +419,16 @@ class PlanCalculator:
             balance_401k = balance_401k + yd.appreciation_ira
             balance_hsa = balance_hsa + yd.appreciation_hsa
             
-            current_local_tax = current_local_tax * (1 + local_tax_inflation)
-            current_annual_expenses = current_annual_expenses * (1 + expense_inflation)
+            current_local_tax = current_local_tax * local_tax_growth
+            current_annual_expenses = current_annual_expenses * expense_growth
             # Apply retirement multiplier in first retirement year, then normal inflation
             if year == disbursement_start:
                 current_travel_expenses = current_travel_expenses * travel_retirement_multiplier
             else:
-                current_travel_expenses = current_travel_expenses * (1 + travel_inflation)
-            current_insurance_premium = current_insurance_premium * (1 + premium_inflation)
-            current_medicare_premium = current_medicare_premium * (1 + premium_inflation)
-            current_hsa_withdrawal = current_hsa_withdrawal * (1 + hsa_withdrawal_inflation)
-            # Double HSA withdrawal at Medicare eligibility (medical expenses typically increase)
-            if year == medicare_eligibility_year:
-                current_hsa_withdrawal = current_hsa_withdrawal * 2
-            current_max_hsa = current_max_hsa * (1 + inflation_rate)  # Inflate HSA limit
+                current_travel_expenses = current_travel_expenses * travel_growth
+            current_insurance_premium = current_insurance_premium * premium_growth
+            current_medicare_premium = current_medicare_premium * premium_growth
+            current_max_hsa = current_max_hsa * bracket_growth  # Inflate HSA limit
             
             yd.local_tax = current_local_tax
             # Track appropriate premium based on Medicare eligibility
@@ -388,9 +436,7 @@ class PlanCalculator:
                 yd.medical_premium = current_medicare_premium
             else:
                 yd.medical_premium = current_insurance_premium
-            
-            # HSA contributions allowed until Medicare eligibility (age 65)
-            if year < medicare_eligibility_year:
+                # HSA contributions allowed until Medicare eligibility (age 65)
                 yd.max_hsa = current_max_hsa
                 yd.employee_hsa = current_max_hsa  # Full contribution in retirement (no employer)
                 yd.hsa_contribution = yd.employee_hsa
@@ -408,7 +454,7 @@ class PlanCalculator:
             yd.gross_income = yd.deferred_comp_disbursement + yd.short_term_capital_gains + yd.long_term_capital_gains
             
             # Federal deductions (standard deduction + HSA if before Medicare)
-            deductions = self.federal.totalDeductions(year, 0, 0, yd.local_tax)
+            deductions = federal_deductions(year, 0, 0, yd.local_tax)
             yd.standard_deduction = deductions['standardDeduction']
             # Include HSA contribution in total deductions if before Medicare eligibility
             yd.total_deductions = yd.standard_deduction + yd.employee_hsa
@@ -417,17 +463,17 @@ class PlanCalculator:
             yd.adjusted_gross_income = yd.gross_income - yd.total_deductions
             
             # Federal taxes
-            federal_result = self.federal.taxBurden(yd.adjusted_gross_income, year)
+            federal_result = federal_tax_burden(yd.adjusted_gross_income, year)
             yd.ordinary_income_tax = federal_result.totalFederalTax
             yd.marginal_bracket = federal_result.marginalBracket
-            yd.long_term_capital_gains_tax = self.federal.longTermCapitalGainsTax(
+            yd.long_term_capital_gains_tax = federal_ltcg_tax(
                 yd.adjusted_gross_income, yd.long_term_capital_gains, year)
             yd.federal_tax = yd.ordinary_income_tax + yd.long_term_capital_gains_tax
             
             # State taxes
             state_taxable = yd.gross_income + yd.long_term_capital_gains
-            yd.state_income_tax = self.state.taxBurden(state_taxable, 0, year=year, employer_hsa_contribution=0)
-            yd.state_short_term_capital_gains_tax = self.state.shortTermCapitalGainsTax(yd.short_term_capital_gains)
+            yd.state_income_tax = state_tax_burden(state_taxable, 0, year=year, employer_hsa_contribution=0)
+            yd.state_short_term_capital_gains_tax = state_stcg_tax(yd.short_term_capital_gains)
             yd.state_tax = yd.state_income_tax + yd.state_short_term_capital_gains_tax
             
             # Total taxes and take home (no FICA in retirement)
@@ -455,7 +501,7 @@ class PlanCalculator:
             balance_hsa += yd.hsa_contribution
             
             # HSA withdrawal (tax-free for qualified medical expenses)
-            yd.hsa_withdrawal = min(current_hsa_withdrawal, balance_hsa)  # Can't withdraw more than balance
+            yd.hsa_withdrawal = min(hsa_withdrawal_targets[year], balance_hsa)  # Can't withdraw more than balance
             balance_hsa -= yd.hsa_withdrawal
             
             yd.balance_ira = balance_401k
@@ -492,17 +538,13 @@ class PlanCalculator:
             balance_401k = balance_401k + yd.appreciation_ira
             balance_hsa = balance_hsa + yd.appreciation_hsa
             
-            current_local_tax = current_local_tax * (1 + local_tax_inflation)
-            current_annual_expenses = current_annual_expenses * (1 + expense_inflation)
+            current_local_tax = current_local_tax * local_tax_growth
+            current_annual_expenses = current_annual_expenses * expense_growth
             # Normal inflation for travel (retirement multiplier was applied in first retirement year)
-            current_travel_expenses = current_travel_expenses * (1 + travel_inflation)
-            current_insurance_premium = current_insurance_premium * (1 + premium_inflation)
-            current_medicare_premium = current_medicare_premium * (1 + premium_inflation)
-            current_hsa_withdrawal = current_hsa_withdrawal * (1 + hsa_withdrawal_inflation)
-            # Double HSA withdrawal at Medicare eligibility (medical expenses typically increase)
-            if year == medicare_eligibility_year:
-                current_hsa_withdrawal = current_hsa_withdrawal * 2
-            current_max_hsa = current_max_hsa * (1 + inflation_rate)  # Inflate HSA limit
+            current_travel_expenses = current_travel_expenses * travel_growth
+            current_insurance_premium = current_insurance_premium * premium_growth
+            current_medicare_premium = current_medicare_premium * premium_growth
+            current_max_hsa = current_max_hsa * bracket_growth  # Inflate HSA limit
             
             yd.local_tax = current_local_tax
             # Track appropriate premium based on Medicare eligibility
@@ -510,9 +552,7 @@ class PlanCalculator:
                 yd.medical_premium = current_medicare_premium
             else:
                 yd.medical_premium = current_insurance_premium
-            
-            # HSA contributions allowed until Medicare eligibility (age 65)
-            if year < medicare_eligibility_year:
+                # HSA contributions allowed until Medicare eligibility (age 65)
                 yd.max_hsa = current_max_hsa
                 yd.employee_hsa = current_max_hsa  # Full contribution in retirement (no employer)
                 yd.hsa_contribution = yd.employee_hsa
@@ -529,7 +569,7 @@ class PlanCalculator:
             yd.total_expenses = yd.annual_expenses + yd.special_expenses + yd.travel_expenses + yd.medical_premium_expense
             
             # Federal deductions (standard deduction + HSA if before Medicare)
-            deductions = self.federal.totalDeductions(year, 0, 0, yd.local_tax)
+            deductions = federal_deductions(year, 0, 0, yd.local_tax)
             yd.standard_deduction = deductions['standardDeduction']
             # Include HSA contribution in total deductions if before Medicare eligibility
             yd.total_deductions = yd.standard_deduction + yd.employee_hsa
@@ -548,14 +588,14 @@ class PlanCalculator:
             yd.gross_income = base_income + ira_annuity
             yd.adjusted_gross_income = max(0, yd.gross_income - yd.total_deductions)
             
-            federal_result = self.federal.taxBurden(yd.adjusted_gross_income, year)
+            federal_result = federal_tax_burden(yd.adjusted_gross_income, year)
             annuity_federal_tax = federal_result.totalFederalTax
-            annuity_ltcg_tax = self.federal.longTermCapitalGainsTax(
+            annuity_ltcg_tax = federal_ltcg_tax(
                 yd.adjusted_gross_income, yd.long_term_capital_gains, year)
             
             state_taxable = yd.gross_income
-            annuity_state_tax = self.state.taxBurden(state_taxable, 0, year=year, employer_hsa_contribution=0)
-            annuity_state_stcg_tax = self.state.shortTermCapitalGainsTax(yd.short_term_capital_gains)
+            annuity_state_tax = state_tax_burden(state_taxable, 0, year=year, employer_hsa_contribution=0)
+            annuity_state_stcg_tax = state_stcg_tax(yd.short_term_capital_gains)
             
             annuity_total_taxes = annuity_federal_tax + annuity_ltcg_tax + annuity_state_tax + annuity_state_stcg_tax
             annuity_take_home = yd.gross_income - annuity_total_taxes
@@ -587,10 +627,10 @@ class PlanCalculator:
                     test_gross = base_income + withdrawal_estimate
                     test_agi = max(0, test_gross - yd.total_deductions)
                     
-                    test_federal = self.federal.taxBurden(test_agi, year)
-                    test_ltcg = self.federal.longTermCapitalGainsTax(test_agi, yd.long_term_capital_gains, year)
-                    test_state = self.state.taxBurden(test_gross, 0, year=year, employer_hsa_contribution=0)
-                    test_state_stcg = self.state.shortTermCapitalGainsTax(yd.short_term_capital_gains)
+                    test_federal = federal_tax_burden(test_agi, year)
+                    test_ltcg = federal_ltcg_tax(test_agi, yd.long_term_capital_gains, year)
+                    test_state = state_tax_burden(test_gross, 0, year=year, employer_hsa_contribution=0)
+                    test_state_stcg = state_stcg_tax(yd.short_term_capital_gains)
                     
                     test_total_taxes = test_federal.totalFederalTax + test_ltcg + test_state + test_state_stcg
                     test_take_home = test_gross - test_total_taxes
@@ -621,17 +661,17 @@ class PlanCalculator:
             yd.adjusted_gross_income = max(0, yd.gross_income - yd.total_deductions)
             
             # Federal taxes (IRA withdrawal is ordinary income)
-            federal_result = self.federal.taxBurden(yd.adjusted_gross_income, year)
+            federal_result = federal_tax_burden(yd.adjusted_gross_income, year)
             yd.ordinary_income_tax = federal_result.totalFederalTax
             yd.marginal_bracket = federal_result.marginalBracket
-            yd.long_term_capital_gains_tax = self.federal.longTermCapitalGainsTax(
+            yd.long_term_capital_gains_tax = federal_ltcg_tax(
                 yd.adjusted_gross_income, yd.long_term_capital_gains, year)
             yd.federal_tax = yd.ordinary_income_tax + yd.long_term_capital_gains_tax
             
             # State taxes (IRA withdrawal is also state taxable)
             state_taxable = yd.gross_income
-            yd.state_income_tax = self.state.taxBurden(state_taxable, 0, year=year, employer_hsa_contribution=0)
-            yd.state_short_term_capital_gains_tax = self.state.shortTermCapitalGainsTax(yd.short_term_capital_gains)
+            yd.state_income_tax = state_tax_burden(state_taxable, 0, year=year, employer_hsa_contribution=0)
+            yd.state_short_term_capital_gains_tax = state_stcg_tax(yd.short_term_capital_gains)
             yd.state_tax = yd.state_income_tax + yd.state_short_term_capital_gains_tax
             
             # Total taxes and take home (no FICA)
@@ -659,7 +699,7 @@ class PlanCalculator:
             balance_hsa += yd.hsa_contribution
             
             # HSA withdrawal (tax-free for qualified medical expenses)
-            yd.hsa_withdrawal = min(current_hsa_withdrawal, balance_hsa)  # Can't withdraw more than balance
+            yd.hsa_withdrawal = min(hsa_withdrawal_targets[year], balance_hsa)  # Can't withdraw more than balance
             balance_hsa -= yd.hsa_withdrawal
             
             yd.balance_ira = balance_401k
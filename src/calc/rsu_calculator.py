@@ -1,4 +1,4 @@
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 
 class RSUCalculator:
@@ -11,7 +11,7 @@ class RSUCalculator:
     """
 
     def __init__(self, 
-                 previous_grants: List[Dict] = [],
+                 previous_grants: Optional[List[Dict]] = None,
                  first_year: int = 2026,
                  last_year: int = 2030,
                  first_year_stock_price: float = 100.00, 
@@ -31,7 +31,9 @@ class RSUCalculator:
         """
         self.vesting_schedule = {}
         self.vested_value = {}
-        grants = previous_grants
+        # Copy so the caller's list (often the spec's previousGrants) is not
+        # extended with the generated annual grants
+        grants = list(previous_grants) if previous_grants else []
         stock_prices = {}
         for year in range(first_year, last_year + 1):
             stock_price = first_year_stock_price * ((1 + expected_share_price_growth_fraction) ** (year - first_year))
@@ -44,18 +46,19 @@ class RSUCalculator:
                                'vestingPeriodYears': 4})
 
         """ collect vesting amounts for each year in the program """
+        vesting_schedule = self.vesting_schedule
         for grant in grants:
             grant_year = grant.get('year')
             grant_shares = grant.get('grantShares', 0)
             vesting_period = grant.get('vestingPeriodYears', 4)
-            # collect the vesting schedule from the previous grants
-            for year in range(grant_year + 1, grant_year + vesting_period + 1):
-                if year <= last_year:
-                    if year not in self.vesting_schedule:
-                        self.vesting_schedule[year] = 0
-                    self.vesting_schedule[year] += grant_shares / vesting_period
+            if vesting_period <= 0:
+                continue
+            shares_per_year = grant_shares / vesting_period
+            # collect the vesting schedule from the previous grants, stopping at the last year
+            for year in range(grant_year + 1, min(grant_year + vesting_period, last_year) + 1):
+                vesting_schedule[year] = vesting_schedule.get(year, 0) + shares_per_year
         # now, start calculating the vesting schedule for future grants
         for year in range(first_year, last_year + 1):
-            self.vested_value[year] = self.vesting_schedule.get(year, 0) * stock_prices[year]
+            self.vested_value[year] = vesting_schedule.get(year, 0) * stock_prices[year]
     
 
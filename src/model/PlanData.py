@@ -9,7 +9,7 @@ from dataclasses import dataclass, field
 from typing import Dict, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class YearlyData:
     """All financial data for a single year.
     
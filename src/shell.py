@@ -135,9 +135,13 @@ def load_plan(program_name: str) -> PlanData:
     return calculator.calculate(spec)
 
 
+# YearlyData's fields are fixed at import, so introspect them only once
+_YEARLY_FIELDS = tuple(f.name for f in dataclass_fields(YearlyData))
+
+
 def get_yearly_fields() -> list:
     """Get list of all field names from YearlyData dataclass."""
-    return [f.name for f in dataclass_fields(YearlyData)]
+    return list(_YEARLY_FIELDS)
 
 
 def format_value(value) -> str:
@@ -176,6 +180,8 @@ Type 'exit' or 'quit' to exit.
         self.plan_data = plan_data
         self.program_name = program_name
         self.available_fields = get_yearly_fields()
+        # Lowercased once so tab completion doesn't re-lower every field per keystroke
+        self._fields_lower = tuple((f, f.lower()) for f in self.available_fields)
         # Dictionary of loaded programs for comparison
         self.loaded_programs: dict[str, PlanData] = {}
         if plan_data and program_name:
@@ -198,12 +204,17 @@ Type 'exit' or 'quit' to exit.
     def _get_available_programs(self) -> list:
         """Get list of available program names from input-parameters directory."""
         input_params_dir = os.path.join(os.path.dirname(__file__), '../input-parameters')
-        programs = []
-        if os.path.exists(input_params_dir):
-            for item in sorted(os.listdir(input_params_dir)):
-                if os.path.isdir(os.path.join(input_params_dir, item)):
-                    programs.append(item)
-        return programs
+        if not os.path.exists(input_params_dir):
+            return []
+        # scandir reports the entry type from the directory listing, avoiding a stat per entry.
+        # Not cached: the generate command can add programs while the shell runs.
+        with os.scandir(input_params_dir) as entries:
+            return sorted(entry.name for entry in entries if entry.is_dir())
+    
+    def _match_fields(self, text: str) -> list:
+        """Get fields containing text anywhere (case-insensitive substring match)."""
+        text_lower = text.lower()
+        return [f for f, f_lower in self._fields_lower if text_lower in f_lower]
     
     def _update_intro(self):
         """Update the intro message based on current state."""
@@ -474,8 +485,7 @@ Type 'exit' or 'quit' to exit.
         """
         if not text:
             return self.available_fields
-        text_lower = text.lower()
-        return [f for f in self.available_fields if text_lower in f.lower()]
+        return self._match_fields(text)
         print()
     
     def do_years(self, arg: str):
@@ -971,8 +981,7 @@ Type 'exit' or 'quit' to exit.
             # Complete field names (case-insensitive substring match)
             if not text:
                 return self.available_fields
-            text_lower = text.lower()
-            return [f for f in self.available_fields if text_lower in f.lower()]
+            return self._match_fields(text)
 
     def do_config(self, arg: str):
         """Manage custom renderer configurations.
@@ -1106,12 +1115,11 @@ Type 'exit' or 'quit' to exit.
         # Set up custom completer for field names
         def field_completer(text, state):
             """Completer function for field names."""
-            text_lower = text.lower()
             if not text:
                 matches = self.available_fields[:]
             else:
                 # Case-insensitive substring match
-                matches = [f for f in self.available_fields if text_lower in f.lower()]
+                matches = self._match_fields(text)
             
             try:
                 return matches[state]
@@ -1265,11 +1273,8 @@ Type 'exit' or 'quit' to exit.
         if not program_name:
             print("Please specify a program name.")
             print("Available programs:")
-            input_params_dir = os.path.join(os.path.dirname(__file__), '../input-parameters')
-            if os.path.exists(input_params_dir):
-                for item in sorted(os.listdir(input_params_dir)):
-                    if os.path.isdir(os.path.join(input_params_dir, item)):
-                        print(f"  - {item}")
+            for item in self._get_available_programs():
+                print(f"  - {item}")
             if self.loaded_programs:
                 print("\nLoaded programs (available for comparison):")
                 for name in self.loaded_programs:
@@ -1423,8 +1428,7 @@ Available Commands:
             # Complete field names - case-insensitive substring match
             if not text:
                 return self.available_fields
-            text_lower = text.lower()
-            return [f for f in self.available_fields if text_lower in f.lower()]
+            return self._match_fields(text)
         return []
     
     def complete_get(self, text, line, begidx, endidx):
@@ -1434,8 +1438,7 @@ Available Commands:
         """
         if not text:
             return self.available_fields
-        text_lower = text.lower()
-        return [f for f in self.available_fields if text_lower in f.lower()]
+        return self._match_fields(text)
     
     def complete_load(self, text, line, begidx, endidx):
         """Tab completion for the load command."""
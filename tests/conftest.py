@@ -1,5 +1,20 @@
 """Pytest configuration for the financial-planner test suite."""
 
+import json
+import os
+import sys
+from collections import namedtuple
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
+
+import pytest
+
+# Make the application packages under src/ importable for every test module
+_SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), '../src'))
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
+
 # Configure pytest-asyncio to use auto mode so all async tests are automatically run
 pytest_plugins = ('pytest_asyncio',)
 
@@ -9,3 +24,141 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "asyncio: mark test as an async test"
     )
+
+
+# Canned results shared by every fake; the calculator only reads them
+FederalTaxResult = namedtuple('FederalTaxResult', 'totalFederalTax marginalBracket')
+FEDERAL_TAX_RESULT = FederalTaxResult(totalFederalTax=50000, marginalBracket=0.24)
+RSU_VESTED_VALUES = MappingProxyType({2026: 50000, 2027: 55000})
+FEDERAL_DEDUCTIONS = MappingProxyType({
+    'standardDeduction': 30000,
+    'itemizedDeduction': 0,
+    'max401k': 24000,
+    'maxHSA': 8000,
+    'employeeHSA': 8000,
+    'total': 62000
+})
+
+
+# Stateless stand-ins for the tax and benefit calculators. They return the
+# same canned values regardless of arguments, so one instance of each can be
+# shared by every test.
+@dataclass(frozen=True, slots=True)
+class FakeFederal:
+    """FederalDetails stand-in with sensible defaults."""
+
+    def totalDeductions(self, *args, **kwargs):
+        return FEDERAL_DEDUCTIONS
+
+    def taxBurden(self, *args, **kwargs):
+        return FEDERAL_TAX_RESULT
+
+    def longTermCapitalGainsTax(self, *args, **kwargs):
+        return 1000
+
+
+@dataclass(frozen=True, slots=True)
+class FakeState:
+    """StateDetails stand-in with sensible defaults."""
+
+    def taxBurden(self, *args, **kwargs):
+        return 15000
+
+    def shortTermCapitalGainsTax(self, *args, **kwargs):
+        return 500
+
+
+@dataclass(frozen=True, slots=True)
+class FakeESPP:
+    """ESPPDetails stand-in with sensible defaults."""
+    taxable: float = 5000
+
+    def taxable_from_spec(self, *args, **kwargs):
+        return self.taxable
+
+
+@dataclass(frozen=True, slots=True)
+class FakeSocialSecurity:
+    """SocialSecurityDetails stand-in."""
+    wage_base: float = 168600  # 2024 SS wage base
+    employee_portion: float = 0.062
+    ma_pfml: float = 0.00318
+
+    def total_contribution(self, *args, **kwargs):
+        return 12000
+
+    def get_data_for_year(self, *args, **kwargs):
+        return {
+            'maximumTaxedIncome': self.wage_base,
+            'employeePortion': self.employee_portion,
+            'maPFML': self.ma_pfml
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class FakeMedicare:
+    """MedicareDetails stand-in."""
+    medicare_rate: float = 0.0145
+    surcharge_threshold: float = 200000
+    surcharge_rate: float = 0.009
+
+    def base_contribution(self, *args, **kwargs):
+        return 5000
+
+    def surcharge(self, *args, **kwargs):
+        return 1000
+
+
+@dataclass(frozen=True, slots=True)
+class FakeRSUCalculator:
+    """RSUCalculator stand-in exposing only the vested values."""
+    vested_value: Mapping[int, float] = field(default_factory=lambda: RSU_VESTED_VALUES)
+
+
+@pytest.fixture(scope="session")
+def plan_dependencies():
+    """Read-only mapping of PlanCalculator keyword arguments to the fakes.
+
+    Tests that need one collaborator to behave differently can build their own
+    calculator with ``PlanCalculator(**{**plan_dependencies, 'espp': ...})``.
+    """
+    return MappingProxyType({
+        'federal': FakeFederal(),
+        'state': FakeState(),
+        'espp': FakeESPP(),
+        'social_security': FakeSocialSecurity(),
+        'medicare': FakeMedicare(),
+        'rsu_calculator': FakeRSUCalculator(),
+    })
+
+
+@pytest.fixture(scope="session")
+def calculator(plan_dependencies):
+    """PlanCalculator wired to the fake dependencies, shared by the whole session.
+
+    The fakes only return canned values, so a single instance can serve every
+    test that does not need to customise them. Tests that need a differently
+    configured collaborator build their own calculator from
+    ``plan_dependencies`` instead of re-creating the whole bundle.
+    """
+    from calc.plan_calculator import PlanCalculator
+    
+    return PlanCalculator(**plan_dependencies)
+
+
+@pytest.fixture(scope="session")
+def cached_calculate(calculator):
+    """``calculator.calculate`` memoized on the spec's canonical JSON form.
+
+    Tests that build the same spec share one PlanData, so results must be
+    treated as read-only.
+    """
+    cache = {}
+    
+    def calculate(spec):
+        key = json.dumps(spec, sort_keys=True, default=dict)
+        if key not in cache:
+            cache[key] = calculator.calculate(spec)
+        return cache[key]
+    
+    return calculate
@@ -1,7 +1,16 @@
 """Pytest configuration for MCP server tests."""
 
+import os
+import sys
+
 import pytest
 
+# Make the mcp-server modules importable for the MCP tests; src/ is added by
+# the top-level tests/conftest.py
+_MCP_SERVER = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../mcp-server'))
+if _MCP_SERVER not in sys.path:
+    sys.path.insert(0, _MCP_SERVER)
+
 # Set the asyncio_mode to auto for all async tests in this directory
 @pytest.fixture(scope="session")
 def anyio_backend():
@@ -1,23 +1,14 @@
 """Tests for the MCP server module."""
 
 import os
-import sys
 import json
 import pytest
-from unittest.mock import patch, MagicMock, AsyncMock
-
-# Add src and mcp-server to path for imports BEFORE importing mcp modules
-MCP_SERVER_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../mcp-server'))
-SRC_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src'))
-
-if MCP_SERVER_PATH not in sys.path:
-    sys.path.insert(0, MCP_SERVER_PATH)
-if SRC_PATH not in sys.path:
-    sys.path.insert(0, SRC_PATH)
+from unittest.mock import patch
 
 from mcp.types import Tool, TextContent
 
 # Import server module - need to import from the mcp-server directory
+MCP_SERVER_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../mcp-server'))
 import importlib.util
 server_spec = importlib.util.spec_from_file_location("mcp_server", os.path.join(MCP_SERVER_PATH, "server.py"))
 mcp_server = importlib.util.module_from_spec(server_spec)
@@ -1,16 +1,10 @@
 """Tests for the MCP server tools module."""
 
 import os
-import sys
 import json
 import shutil
 import tempfile
 import pytest
-from unittest.mock import patch, MagicMock
-
-# Add src and mcp-server to path for imports
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../mcp-server')))
 
 from tools import FinancialPlannerTools, MultiProgramTools
 
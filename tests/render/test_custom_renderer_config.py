@@ -5,17 +5,14 @@ renderer configurations stored in the report-config directory.
 """
 
 import pytest
-import sys
 import os
 import json
 import tempfile
 import shutil
+from contextlib import redirect_stdout
 from io import StringIO
 from unittest.mock import patch
 
-# Add src directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
-
 from model.PlanData import PlanData, YearlyData
 
 
@@ -130,14 +127,8 @@ class TestCustomRendererClass:
             show_totals=True
         )
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             renderer.render(mock_plan_data)
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         
@@ -169,14 +160,8 @@ class TestCustomRendererClass:
             show_totals=False
         )
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             renderer.render(mock_plan_data)
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         
@@ -198,14 +183,8 @@ class TestCustomRendererClass:
             show_totals=True
         )
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             renderer.render(mock_plan_data)
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         
@@ -229,14 +208,8 @@ class TestCustomRendererClass:
             show_totals=True
         )
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             renderer.render(mock_plan_data)
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         
@@ -885,14 +858,8 @@ class TestCustomRendererIntegration:
                 factory = renderers.RENDERER_REGISTRY['IntegrationReport']
                 renderer = factory(start_year=2025, end_year=2027)
                 
-                output = StringIO()
-                old_stdout = sys.stdout
-                sys.stdout = output
-                
-                try:
+                with redirect_stdout(StringIO()) as output:
                     renderer.render(mock_plan_data)
-                finally:
-                    sys.stdout = old_stdout
                 
                 result = output.getvalue()
         
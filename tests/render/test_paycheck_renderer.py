@@ -1,15 +1,12 @@
 """Tests for PaycheckRenderer."""
 
 import pytest
-import sys
 import os
 import shutil
 import tempfile
+from contextlib import redirect_stdout
 from io import StringIO
 
-# Add src directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
-
 from render.renderers import (
     PaycheckRenderer,
     RENDERER_REGISTRY,
@@ -160,14 +157,8 @@ class TestPaycheckRendererOutput:
         """Test that renderer produces output for a valid year."""
         renderer = PaycheckRenderer(start_year=plan_data.first_year)
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             renderer.render(plan_data)
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         assert len(result) > 0
@@ -177,14 +168,8 @@ class TestPaycheckRendererOutput:
         year = plan_data.first_year
         renderer = PaycheckRenderer(start_year=year)
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             renderer.render(plan_data)
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         assert f'PAYCHECK - {year}' in result
@@ -193,14 +178,8 @@ class TestPaycheckRendererOutput:
         """Test that renderer shows program name when provided."""
         renderer = PaycheckRenderer(start_year=plan_data.first_year, program_name='testprogram')
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             renderer.render(plan_data)
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         assert 'testprogram' in result
@@ -209,14 +188,8 @@ class TestPaycheckRendererOutput:
         """Test that renderer shows gross pay section."""
         renderer = PaycheckRenderer(start_year=plan_data.first_year)
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             renderer.render(plan_data)
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         assert 'GROSS PAY' in result
@@ -226,14 +199,8 @@ class TestPaycheckRendererOutput:
         """Test that renderer shows tax withholdings section."""
         renderer = PaycheckRenderer(start_year=plan_data.first_year)
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             renderer.render(plan_data)
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         assert 'TAX WITHHOLDINGS' in result
@@ -247,14 +214,8 @@ class TestPaycheckRendererOutput:
         """Test that renderer shows pre-tax deductions section."""
         renderer = PaycheckRenderer(start_year=plan_data.first_year)
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             renderer.render(plan_data)
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         assert 'PRE-TAX DEDUCTIONS' in result
@@ -263,14 +224,8 @@ class TestPaycheckRendererOutput:
         """Test that renderer shows net pay section."""
         renderer = PaycheckRenderer(start_year=plan_data.first_year)
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             renderer.render(plan_data)
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         assert 'NET PAY' in result
@@ -280,14 +235,8 @@ class TestPaycheckRendererOutput:
         """Test that renderer shows annual projections section."""
         renderer = PaycheckRenderer(start_year=plan_data.first_year)
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             renderer.render(plan_data)
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         assert 'ANNUAL PROJECTIONS' in result
@@ -303,14 +252,8 @@ class TestPaycheckRendererDefaultYear:
         """Test that renderer defaults to plan's first year when no year specified."""
         renderer = PaycheckRenderer()
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             renderer.render(plan_data)
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         assert f'PAYCHECK - {plan_data.first_year}' in result
@@ -325,14 +268,8 @@ class TestPaycheckRendererNonWorkingYear:
         non_working_year = plan_data.last_working_year + 5
         renderer = PaycheckRenderer(start_year=non_working_year)
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             renderer.render(plan_data)
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         assert 'not a working year' in result
@@ -347,14 +284,8 @@ class TestPaycheckRendererInvalidYear:
         invalid_year = plan_data.first_year - 100
         renderer = PaycheckRenderer(start_year=invalid_year)
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             renderer.render(plan_data)
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         assert 'No data available' in result
@@ -410,14 +341,8 @@ class TestPaycheckRendererMockData:
         """Test that renderer shows correct gross pay value."""
         renderer = PaycheckRenderer(start_year=2026)
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             renderer.render(mock_plan_data)
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         assert '10,000.00' in result
@@ -426,14 +351,8 @@ class TestPaycheckRendererMockData:
         """Test that renderer shows correct net pay value."""
         renderer = PaycheckRenderer(start_year=2026)
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             renderer.render(mock_plan_data)
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         assert '5,000.38' in result
@@ -442,14 +361,8 @@ class TestPaycheckRendererMockData:
         """Test that renderer shows when SS limit is reached."""
         renderer = PaycheckRenderer(start_year=2026)
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             renderer.render(mock_plan_data)
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         assert 'SS wage base reached' in result
@@ -459,14 +372,8 @@ class TestPaycheckRendererMockData:
         """Test that renderer shows when Medicare surcharge starts."""
         renderer = PaycheckRenderer(start_year=2026)
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             renderer.render(mock_plan_data)
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         assert 'Medicare surcharge' in result
@@ -476,14 +383,8 @@ class TestPaycheckRendererMockData:
         """Test that renderer shows 401(k) contribution."""
         renderer = PaycheckRenderer(start_year=2026)
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             renderer.render(mock_plan_data)
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         assert '401(k) Contribution:' in result
@@ -493,14 +394,8 @@ class TestPaycheckRendererMockData:
         """Test that renderer shows HSA contribution."""
         renderer = PaycheckRenderer(start_year=2026)
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             renderer.render(mock_plan_data)
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         assert 'HSA Contribution:' in result
@@ -510,14 +405,8 @@ class TestPaycheckRendererMockData:
         """Test that renderer shows deferred compensation."""
         renderer = PaycheckRenderer(start_year=2026)
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             renderer.render(mock_plan_data)
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         assert 'Deferred Compensation:' in result
@@ -573,14 +462,8 @@ class TestPaycheckRendererNoPretaxDeductions:
         """Test that renderer shows (None) when no pre-tax deductions."""
         renderer = PaycheckRenderer(start_year=2026)
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             renderer.render(mock_plan_no_deductions)
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         assert '(None)' in result
@@ -589,14 +472,8 @@ class TestPaycheckRendererNoPretaxDeductions:
         """Test that renderer hides paycheck changes section when no thresholds."""
         renderer = PaycheckRenderer(start_year=2026)
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             renderer.render(mock_plan_no_deductions)
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         assert 'PAYCHECK CHANGES DURING YEAR' not in result
@@ -762,14 +639,8 @@ class TestBonusPaycheckRendering:
         """Test that renderer shows bonus paycheck section when bonus > 0."""
         renderer = PaycheckRenderer(start_year=2026)
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             renderer.render(mock_plan_with_bonus)
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         assert 'BONUS PAYCHECK' in result
@@ -778,14 +649,8 @@ class TestBonusPaycheckRendering:
         """Test that renderer shows gross bonus amount."""
         renderer = PaycheckRenderer(start_year=2026)
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             renderer.render(mock_plan_with_bonus)
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         assert 'Gross Bonus:' in result
@@ -795,14 +660,8 @@ class TestBonusPaycheckRendering:
         """Test that renderer shows federal tax on bonus with supplemental rate."""
         renderer = PaycheckRenderer(start_year=2026)
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             renderer.render(mock_plan_with_bonus)
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         assert 'Federal (22% supplemental rate):' in result
@@ -812,14 +671,8 @@ class TestBonusPaycheckRendering:
         """Test that renderer shows state tax on bonus."""
         renderer = PaycheckRenderer(start_year=2026)
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             renderer.render(mock_plan_with_bonus)
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         assert 'State Income Tax:' in result
@@ -828,14 +681,8 @@ class TestBonusPaycheckRendering:
         """Test that renderer shows FICA taxes on bonus."""
         renderer = PaycheckRenderer(start_year=2026)
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             renderer.render(mock_plan_with_bonus)
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         # Check for bonus-specific FICA taxes (appears under Tax Withholdings in bonus section)
@@ -846,14 +693,8 @@ class TestBonusPaycheckRendering:
         """Test that renderer shows net bonus amount."""
         renderer = PaycheckRenderer(start_year=2026)
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             renderer.render(mock_plan_with_bonus)
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         assert 'Net Bonus (Take-Home):' in result
@@ -863,14 +704,8 @@ class TestBonusPaycheckRendering:
         """Test that renderer shows deferred compensation on bonus."""
         renderer = PaycheckRenderer(start_year=2026)
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             renderer.render(mock_plan_with_bonus_deferral)
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         assert 'Deferred Compensation:' in result
@@ -880,14 +715,8 @@ class TestBonusPaycheckRendering:
         """Test that renderer handles negative net bonus (when deferral > net)."""
         renderer = PaycheckRenderer(start_year=2026)
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             renderer.render(mock_plan_with_bonus_deferral)
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         assert 'Net Bonus (Take-Home):' in result
@@ -898,14 +727,8 @@ class TestBonusPaycheckRendering:
         """Test that renderer hides bonus section when bonus is 0."""
         renderer = PaycheckRenderer(start_year=2026)
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             renderer.render(mock_plan_no_bonus)
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         assert 'BONUS PAYCHECK' not in result
@@ -914,14 +737,8 @@ class TestBonusPaycheckRendering:
         """Test that renderer hides deferred comp line when bonus deferral is 0."""
         renderer = PaycheckRenderer(start_year=2026)
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             renderer.render(mock_plan_with_bonus)
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         # The bonus paycheck should appear
@@ -960,7 +777,7 @@ class TestBonusPaycheckCalculation:
         if yd.bonus > 0:
             # Federal tax should be 22% of gross bonus
             expected_federal = yd.bonus * 0.22
-            assert abs(yd.bonus_paycheck_federal_tax - expected_federal) < 0.01
+            assert yd.bonus_paycheck_federal_tax == pytest.approx(expected_federal, abs=0.01)
     
     def test_bonus_net_calculation(self, plan_data):
         """Test that bonus net is calculated correctly."""
@@ -973,7 +790,7 @@ class TestBonusPaycheckCalculation:
                            yd.bonus_paycheck_social_security -
                            yd.bonus_paycheck_medicare -
                            yd.bonus_paycheck_deferred_comp)
-            assert abs(yd.bonus_paycheck_net - expected_net) < 0.01
+            assert yd.bonus_paycheck_net == pytest.approx(expected_net, abs=0.01)
     
     def test_bonus_deferred_comp_equals_bonus_deferral(self, plan_data):
         """Test that bonus deferred comp equals bonus_deferral field."""
@@ -1014,7 +831,7 @@ class TestESPPContributionCalculation:
             if yd.espp_income > 0 and max_espp > 0:
                 espp_discount = yd.espp_income / max_espp
                 expected_contribution = max_espp * (1 - espp_discount) / pay_periods
-                assert abs(yd.paycheck_espp - expected_contribution) < 0.01, \
+                assert yd.paycheck_espp == pytest.approx(expected_contribution, abs=0.01), \
                     f"Year {year}: expected {expected_contribution}, got {yd.paycheck_espp}"
                 break
     
@@ -1045,14 +862,8 @@ class TestESPPRendererOutput:
         
         renderer = PaycheckRenderer(start_year=test_year)
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             renderer.render(plan_data)
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         assert 'POST-TAX DEDUCTIONS' in result
@@ -1073,14 +884,8 @@ class TestESPPRendererOutput:
         
         renderer = PaycheckRenderer(start_year=test_year)
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             renderer.render(plan_data)
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         
@@ -1107,14 +912,8 @@ class TestESPPRendererOutput:
         
         renderer = PaycheckRenderer(start_year=test_year)
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             renderer.render(plan_data)
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         assert 'Annual Post-Tax Deductions:' in result
@@ -1154,14 +953,8 @@ class TestESPPRendererOutput:
         
         renderer = PaycheckRenderer(start_year=2026)
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             renderer.render(plan)
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         assert 'POST-TAX DEDUCTIONS' not in result
@@ -1187,6 +980,6 @@ class TestESPPNetPayCalculation:
                                yd.paycheck_deferred_comp - 
                                yd.paycheck_medical_dental -
                                yd.paycheck_espp)
-                assert abs(yd.paycheck_net - expected_net) < 0.01, \
+                assert yd.paycheck_net == pytest.approx(expected_net, abs=0.01), \
                     f"Year {year}: expected net {expected_net}, got {yd.paycheck_net}"
                 break
@@ -1,15 +1,12 @@
 """Tests for renderer year range functionality."""
 
 import pytest
-import sys
 import os
 import shutil
 import tempfile
+from contextlib import redirect_stdout
 from io import StringIO
 
-# Add src directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
-
 from render.renderers import (
     BalancesRenderer,
     AnnualSummaryRenderer,
@@ -171,14 +168,8 @@ class TestBalancesRendererYearRange:
         """Test that renderer without year range shows all years."""
         renderer = BalancesRenderer()
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             renderer.render(plan_data)
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         
@@ -194,14 +185,8 @@ class TestBalancesRendererYearRange:
         
         renderer = BalancesRenderer(start_year=start_year, end_year=end_year)
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             renderer.render(plan_data)
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         
@@ -225,14 +210,8 @@ class TestBalancesRendererYearRange:
         
         renderer = BalancesRenderer(start_year=start_year)
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             renderer.render(plan_data)
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         
@@ -252,14 +231,8 @@ class TestBalancesRendererYearRange:
         
         renderer = BalancesRenderer(end_year=end_year)
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             renderer.render(plan_data)
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         
@@ -281,14 +254,8 @@ class TestAnnualSummaryRendererYearRange:
         """Test that renderer without year range shows all years."""
         renderer = AnnualSummaryRenderer()
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             renderer.render(plan_data)
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         
@@ -303,14 +270,8 @@ class TestAnnualSummaryRendererYearRange:
         
         renderer = AnnualSummaryRenderer(start_year=start_year, end_year=end_year)
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             renderer.render(plan_data)
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         
@@ -332,14 +293,8 @@ class TestAnnualSummaryRendererYearRange:
         
         renderer = AnnualSummaryRenderer(start_year=start_year, end_year=end_year)
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             renderer.render(plan_data)
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         
@@ -361,14 +316,8 @@ class TestContributionsRendererYearRange:
         """Test that renderer without year range shows working years."""
         renderer = ContributionsRenderer()
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             renderer.render(plan_data)
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         
@@ -382,14 +331,8 @@ class TestContributionsRendererYearRange:
         
         renderer = ContributionsRenderer(start_year=start_year, end_year=end_year)
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             renderer.render(plan_data)
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         
@@ -410,14 +353,8 @@ class TestMoneyMovementRendererYearRange:
         """Test that renderer without year range shows all years."""
         renderer = MoneyMovementRenderer()
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             renderer.render(plan_data)
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         
@@ -432,14 +369,8 @@ class TestMoneyMovementRendererYearRange:
         
         renderer = MoneyMovementRenderer(start_year=start_year, end_year=end_year)
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             renderer.render(plan_data)
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         
@@ -461,14 +392,8 @@ class TestCashFlowRendererYearRange:
         """Test that renderer without year range shows all years."""
         renderer = CashFlowRenderer()
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             renderer.render(plan_data)
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         
@@ -483,14 +408,8 @@ class TestCashFlowRendererYearRange:
         
         renderer = CashFlowRenderer(start_year=start_year, end_year=end_year)
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             renderer.render(plan_data)
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         
@@ -511,14 +430,8 @@ class TestCashFlowRendererYearRange:
         
         renderer = CashFlowRenderer(start_year=start_year, end_year=end_year)
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             renderer.render(plan_data)
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         
@@ -561,14 +474,8 @@ class TestCashFlowRendererYearRange:
         
         renderer = CashFlowRenderer()
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             renderer.render(plan)
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         
@@ -606,14 +513,8 @@ class TestShellRenderWithYearRange:
         first_year = shell_with_plan.plan_data.first_year
         end_year = first_year + 3
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             shell_with_plan.do_render(f'Balances {first_year}-{end_year}')
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         
@@ -632,14 +533,8 @@ class TestShellRenderWithYearRange:
         first_year = shell_with_plan.plan_data.first_year
         end_year = first_year + 3
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             shell_with_plan.do_render(f'AnnualSummary {first_year}-{end_year}')
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         
@@ -652,14 +547,8 @@ class TestShellRenderWithYearRange:
         first_year = shell_with_plan.plan_data.first_year
         end_year = first_year + 3
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             shell_with_plan.do_render(f'Contributions {first_year}-{end_year}')
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         
@@ -671,14 +560,8 @@ class TestShellRenderWithYearRange:
         first_year = shell_with_plan.plan_data.first_year
         end_year = first_year + 3
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             shell_with_plan.do_render(f'MoneyMovement {first_year}-{end_year}')
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         
@@ -691,14 +574,8 @@ class TestShellRenderWithYearRange:
         first_year = shell_with_plan.plan_data.first_year
         end_year = first_year + 3
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             shell_with_plan.do_render(f'CashFlow {first_year}-{end_year}')
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         
@@ -710,14 +587,8 @@ class TestShellRenderWithYearRange:
         """Test render with open-ended range (startYear-)."""
         start_year = shell_with_plan.plan_data.first_year + 5
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             shell_with_plan.do_render(f'Balances {start_year}-')
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         
@@ -735,14 +606,8 @@ class TestShellRenderWithYearRange:
         """Test render with open-start range (-endYear)."""
         end_year = shell_with_plan.plan_data.first_year + 5
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             shell_with_plan.do_render(f'Balances -{end_year}')
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         
@@ -758,14 +623,8 @@ class TestShellRenderWithYearRange:
     
     def test_render_with_invalid_year_range(self, shell_with_plan):
         """Test render with invalid year range shows error."""
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             shell_with_plan.do_render('Balances notayear-alsowrong')
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         
@@ -776,14 +635,8 @@ class TestShellRenderWithYearRange:
         """Test that TaxDetails still uses single year argument."""
         first_year = shell_with_plan.plan_data.first_year
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
+        with redirect_stdout(StringIO()) as output:
             shell_with_plan.do_render(f'TaxDetails {first_year}')
-        finally:
-            sys.stdout = old_stdout
         
         result = output.getvalue()
         
@@ -1,8 +1,5 @@
-import os
-import sys
 import json
 import math
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
 from tax.ESPPDetails import ESPPDetails
 
 
@@ -1,15 +1,14 @@
 import unittest
-import os
-import sys
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
 from tax.FederalDetails import FederalDetails
 
 class TestFederalDetails(unittest.TestCase):
-    def setUp(self):
-        # Use 3% inflation, test up to 2028
-        self.inflation = 0.03
-        self.final_year = 2028
-        self.fed = FederalDetails(self.inflation, self.final_year)
+    @classmethod
+    def setUpClass(cls):
+        # Use 3% inflation, test up to 2028. The tests only query the brackets,
+        # so one FederalDetails is built for the whole class.
+        cls.inflation = 0.03
+        cls.final_year = 2028
+        cls.fed = FederalDetails(cls.inflation, cls.final_year)
 
     def test_total_deductions(self):
         # Values from reference/federal-details.json for 2025 (base year)
@@ -1,11 +1,17 @@
 import os
-import sys
 import json
 import math
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
 from tax.StateDetails import StateDetails
 
 
+# Reference files are read once per module; tests only read from them
+_REFERENCE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'reference'))
+with open(os.path.join(_REFERENCE_DIR, 'federal-details.json'), 'r') as f:
+    FEDERAL_REFERENCE = json.load(f)
+with open(os.path.join(_REFERENCE_DIR, 'flat-tax-details.json'), 'r') as f:
+    FLAT_TAX_REFERENCE = json.load(f)
+
+
 def create_test_spec():
     """Create a test spec with sample financial data."""
     return {
@@ -28,9 +34,7 @@ def create_test_spec():
 
 def get_federal_base_year_data():
     """Load the base year data from the new taxYears array format."""
-    repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
-    with open(os.path.join(repo_root, 'reference', 'federal-details.json'), 'r') as f:
-        fed = json.load(f)
+    fed = FEDERAL_REFERENCE
     # New format uses taxYears array
     tax_years = fed.get('taxYears', [])
     if tax_years:
@@ -59,18 +63,13 @@ def test_state_tax_basic_matches_program_logic():
     gross_income = income['baseSalary'] + income['baseSalary'] * income['bonusFraction'] + income['otherIncome']
     medical = spec.get('deductions', {}).get('medicalDentalVision', 0)
     # include ESPP contribution benefit
-    repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
     espp_discount = spec.get('esppDiscount', 0)
     fed_data = get_federal_base_year_data()
     max_espp = fed_data['maxESPPValue']
     espp_income = max_espp * espp_discount
     gross_income = gross_income + espp_income
 
-    # load reference values
-    with open(os.path.join(repo_root, 'reference', 'flat-tax-details.json'), 'r') as f:
-        flat = json.load(f)
-
-    state = flat.get('state', {})
+    state = FLAT_TAX_REFERENCE.get('state', {})
     state_rate = state.get('rate', 0)
     state_sd = state.get('standardDeduction', 0)
     c401k = fed_data['401k']
@@ -102,14 +101,9 @@ def test_state_tax_inflation_applies_over_years():
     gross = 100000
     medical = 2000
 
-    # load reference base values
-    repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
-    with open(os.path.join(repo_root, 'reference', 'flat-tax-details.json'), 'r') as f:
-        flat = json.load(f)
-    
     fed_data = get_federal_base_year_data()
 
-    state = flat.get('state', {})
+    state = FLAT_TAX_REFERENCE.get('state', {})
     state_rate = state.get('rate', 0)
     state_sd = state.get('standardDeduction', 0)
     c401k = fed_data['401k']
@@ -139,14 +133,9 @@ def test_state_tax_with_employer_hsa_contribution():
     medical = 2000
     employer_hsa = 1500.00  # Employer contributes $1500 to HSA
 
-    # load reference base values
-    repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
-    with open(os.path.join(repo_root, 'reference', 'flat-tax-details.json'), 'r') as f:
-        flat = json.load(f)
-    
     fed_data = get_federal_base_year_data()
 
-    state = flat.get('state', {})
+    state = FLAT_TAX_REFERENCE.get('state', {})
     state_rate = state.get('rate', 0)
     state_sd = state.get('standardDeduction', 0)
     c401k = fed_data['401k']
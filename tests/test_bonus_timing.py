@@ -1,8 +1,5 @@
-import os
-import sys
 import pytest
-from unittest.mock import MagicMock
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+from dataclasses import replace
 from calc.plan_calculator import PlanCalculator
 from model.PlanData import YearlyData
 
@@ -10,32 +7,12 @@ class TestBonusPayPeriodImpact:
     """Test how bonus pay period affects SS limit and Medicare surcharge timing."""
     
     @pytest.fixture
-    def calculator(self):
-        """Create a calculator instance with mocked dependencies."""
-        # Mock dependencies
-        fed = MagicMock()
-        state = MagicMock()
-        espp = MagicMock()
-        ss = MagicMock()
-        medicare = MagicMock()
-        rsu = MagicMock()
-        
-        # Setup SS data - use 160200 to match test expectations
-        ss.get_data_for_year.return_value = {
-            "maximumTaxedIncome": 160200,  # SS wage base for tests
-            "employeePortion": 0.062,
-            "maPFML": 0.0
-        }
-        # Set wage_base attribute for paycheck calculations
-        ss.wage_base = 160200
-        
-        # Setup Medicare data
-        medicare.medicare_rate = 0.0145
-        medicare.surcharge_threshold = 200000
-        medicare.surcharge_rate = 0.009
-        
-        calc = PlanCalculator(fed, state, espp, ss, medicare, rsu)
-        return calc
+    def calculator(self, plan_dependencies):
+        """Create a calculator instance with the shared fake dependencies."""
+        # Use a 160200 SS wage base with no PFML to match test expectations
+        ss = replace(plan_dependencies['social_security'], wage_base=160200, ma_pfml=0.0)
+        
+        return PlanCalculator(**{**plan_dependencies, 'social_security': ss})
     
     def test_bonus_accelerates_ss_limit(self, calculator):
         """Test that a large bonus early in the year accelerates reaching SS limit."""
@@ -1,13 +1,20 @@
-import os
-import sys
+from types import SimpleNamespace
 from unittest.mock import Mock
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import pytest
+
 from calc.take_home import TakeHomeCalculator
+from calc.rsu_calculator import RSUCalculator
+from tax.ESPPDetails import ESPPDetails
+from tax.FederalDetails import FederalDetails
+from tax.MedicareDetails import MedicareDetails
+from tax.SocialSecurityDetails import SocialSecurityDetails
+from tax.StateDetails import StateDetails
 
 
 def create_mock_federal():
     """Create a mock FederalDetails with sensible defaults."""
-    mock = Mock()
+    mock = Mock(spec=FederalDetails)
     mock.totalDeductions.return_value = {
         'standardDeduction': 10000,
         'max401k': 3000,
@@ -15,10 +22,8 @@ def create_mock_federal():
         'employeeHSA': 2000,
         'total': 15000
     }
-    federal_result = Mock()
-    federal_result.totalFederalTax = 50000
-    federal_result.marginalBracket = 0.24
-    federal_result.longTermCapitalGainsTax = 0
+    federal_result = SimpleNamespace(totalFederalTax=50000, marginalBracket=0.24,
+                                     longTermCapitalGainsTax=0)
     mock.taxBurden.return_value = federal_result
     mock.longTermCapitalGainsTax.return_value = 0
     return mock
@@ -26,7 +31,7 @@ def create_mock_federal():
 
 def create_mock_state():
     """Create a mock StateDetails with sensible defaults."""
-    mock = Mock()
+    mock = Mock(spec=StateDetails)
     mock.taxBurden.return_value = 10000
     mock.shortTermCapitalGainsTax.return_value = 0
     return mock
@@ -34,14 +39,14 @@ def create_mock_state():
 
 def create_mock_espp():
     """Create a mock ESPPDetails with sensible defaults."""
-    mock = Mock()
+    mock = Mock(spec=ESPPDetails)
     mock.taxable_from_spec.return_value = 0
     return mock
 
 
 def create_mock_social_security(max_taxed_income=168600, employee_portion=0.062, ma_pfml=0.0063):
     """Create a mock SocialSecurityDetails."""
-    mock = Mock()
+    mock = Mock(spec=SocialSecurityDetails)
     mock.maximum_taxed_income = max_taxed_income
     mock.employee_portion = employee_portion
     mock.ma_pfml = ma_pfml
@@ -56,7 +61,7 @@ def create_mock_social_security(max_taxed_income=168600, employee_portion=0.062,
 
 def create_mock_medicare(medicare_rate=0.0145, surcharge_threshold=250000, surcharge_rate=0.009):
     """Create a mock MedicareDetails."""
-    mock = Mock()
+    mock = Mock(spec=MedicareDetails)
     mock.medicare_rate = medicare_rate
     mock.surcharge_threshold = surcharge_threshold
     mock.surcharge_rate = surcharge_rate
@@ -76,7 +81,7 @@ def create_mock_medicare(medicare_rate=0.0145, surcharge_threshold=250000, surch
 
 def create_mock_rsu_calculator(vested_value=0, vested_shares=0, stock_price=100.0):
     """Create a mock RSUCalculator with sensible defaults."""
-    mock = Mock()
+    mock = Mock(spec=RSUCalculator)
     # The RSU calculator now uses a dictionary keyed by year
     mock.vested_value = {2026: vested_value}
     return mock
@@ -170,7 +175,7 @@ def test_social_security_cap_applies():
 
     # Should be capped at max_taxed_income
     expected_ss = max_taxed_income * (employee_portion + ma_pfml)
-    assert round(results['total_social_security'], 2) == round(expected_ss, 2)
+    assert results['total_social_security'] == pytest.approx(expected_ss, abs=0.01)
     mock_social_security.total_contribution.assert_called_once_with(200000, 2026)
 
 
@@ -429,10 +434,8 @@ def test_federal_tax_includes_ltcg_tax():
     # Configure ordinary income tax and LTCG tax
     ordinary_tax = 50000
     ltcg_tax = 2000
-    federal_result = Mock()
-    federal_result.totalFederalTax = ordinary_tax
-    federal_result.marginalBracket = 0.24
-    federal_result.longTermCapitalGainsTax = 0
+    federal_result = SimpleNamespace(totalFederalTax=ordinary_tax, marginalBracket=0.24,
+                                     longTermCapitalGainsTax=0)
     mock_federal.taxBurden.return_value = federal_result
     mock_federal.longTermCapitalGainsTax.return_value = ltcg_tax
 
@@ -526,12 +529,12 @@ def test_medical_inflation_applies_after_first_year():
     # Second year - should be inflated by 10%
     results_2027 = calculator.calculate(spec, tax_year=2027)
     expected_2027 = base_medical * 1.10
-    assert abs(results_2027['deductions']['medicalDentalVision'] - expected_2027) < 0.01
+    assert results_2027['deductions']['medicalDentalVision'] == pytest.approx(expected_2027, abs=0.01)
 
     # Third year - should be inflated by 10% twice
     results_2028 = calculator.calculate(spec, tax_year=2028)
     expected_2028 = base_medical * (1.10 ** 2)
-    assert abs(results_2028['deductions']['medicalDentalVision'] - expected_2028) < 0.01
+    assert results_2028['deductions']['medicalDentalVision'] == pytest.approx(expected_2028, abs=0.01)
 
 
 def test_medical_inflation_zero_rate_no_change():
@@ -1,11 +1,7 @@
 """Tests for the investment calculator."""
 
-import os
-import sys
 import pytest
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
-
 from calc.investment_calculator import InvestmentCalculator
 
 
@@ -2,85 +2,20 @@
 
 These tests verify the income vs expense comparison and the resulting
 adjustments to the taxable account balance.
-"""
-
-import os
-import sys
-import pytest
-from unittest.mock import Mock
-
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
-
-from calc.plan_calculator import PlanCalculator
-from model.PlanData import YearlyData, PlanData
-
-
-def create_mock_federal():
-    """Create a mock FederalDetails with sensible defaults."""
-    mock = Mock()
-    mock.totalDeductions.return_value = {
-        'standardDeduction': 30000,
-        'itemizedDeduction': 0,
-        'max401k': 24000,
-        'maxHSA': 8000,
-        'employeeHSA': 8000,
-        'total': 62000
-    }
-    federal_result = Mock()
-    federal_result.totalFederalTax = 50000
-    federal_result.marginalBracket = 0.24
-    mock.taxBurden.return_value = federal_result
-    mock.longTermCapitalGainsTax.return_value = 1000
-    return mock
-
-
-def create_mock_state():
-    """Create a mock StateDetails with sensible defaults."""
-    mock = Mock()
-    mock.taxBurden.return_value = 15000
-    mock.shortTermCapitalGainsTax.return_value = 500
-    return mock
-
-
-def create_mock_espp():
-    """Create a mock ESPPDetails with sensible defaults."""
-    mock = Mock()
-    mock.taxable_from_spec.return_value = 5000
-    return mock
-
-
-def create_mock_social_security():
-    """Create a mock SocialSecurityDetails."""
-    mock = Mock()
-    mock.total_contribution.return_value = 12000
-    # Mock get_data_for_year for weekly take-home calculations
-    mock.get_data_for_year.return_value = {
-        'maximumTaxedIncome': 168600,  # 2024 SS wage base
-        'employeePortion': 0.062,
-        'maPFML': 0.00318
-    }
-    # Add wage_base property for paycheck calculations
-    mock.wage_base = 168600
-    return mock
 
+PYTEST_DONT_REWRITE: the assertions here are simple comparisons, so the
+module opts out of pytest's assertion rewriting. Drop the marker locally
+when a failure needs pytest's detailed comparison output.
+"""
 
-def create_mock_medicare():
-    """Create a mock MedicareDetails."""
-    mock = Mock()
-    mock.base_contribution.return_value = 5000
-    mock.surcharge.return_value = 1000
-    # Instance attributes for weekly take-home calculations
-    mock.medicare_rate = 0.0145
-    mock.surcharge_threshold = 200000
-    mock.surcharge_rate = 0.009
-    return mock
+import functools
+from types import MappingProxyType
 
+import pytest
 
-def create_mock_rsu_calculator(vested_values=None):
-    """Create a mock RSUCalculator."""
-    mock = Mock()
-    mock.vested_value = vested_values or {2026: 50000, 2027: 55000}
-    return mock
+# Keep the whole module on one xdist worker so the shared calculator and
+# cached results are built once.
+pytestmark = pytest.mark.xdist_group("money_movement")
 
 
 def create_spec_with_expenses():
@@ -136,44 +71,89 @@ def create_spec_with_expenses():
     }
 
 
+def _freeze(spec):
+    """Return a read-only view of a spec, including its nested sections and lists."""
+    if isinstance(spec, dict):
+        return MappingProxyType({key: _freeze(value) for key, value in spec.items()})
+    if isinstance(spec, list):
+        return tuple(_freeze(value) for value in spec)
+    return spec
+
+
+def _with_annual_expenses(annual_amount):
+    """Return a read-only copy of the default spec with a different expense level."""
+    return MappingProxyType({
+        **_BASE_SPEC,
+        'expenses': MappingProxyType({**_BASE_SPEC['expenses'], 'annualAmount': annual_amount})
+    })
+
+
+# Specs shared by tests that only vary the expense configuration. They are
+# read-only all the way down, including the sections the variants share, so
+# that a test cannot leak a mutation into its neighbours.
+_BASE_SPEC = _freeze(create_spec_with_expenses())
+_SPEC_LOW = _with_annual_expenses(20000)
+_SPEC_HIGH = _with_annual_expenses(500000)
+_SPEC_IRAHIGH = _with_annual_expenses(200000)
+_SPEC_MOD = _with_annual_expenses(50000)
+_SPEC_NOEXP = MappingProxyType({k: v for k, v in _BASE_SPEC.items() if k != 'expenses'})
+
+# Year boundaries of the default spec, computed once at collection time
+_FIRST_RETIREMENT = _BASE_SPEC['lastWorkingYear'] + 1
+_POST_DEFERRED = _FIRST_RETIREMENT + _BASE_SPEC['deferredCompensationPlan']['disbursementYears']
+_LAST_PLANNING = _BASE_SPEC['lastPlanningYear']
+
+# Specs addressable by name so that plan results can be memoized per spec
+_SPECS = {
+    'default': _BASE_SPEC,
+    'low': _SPEC_LOW,
+    'high': _SPEC_HIGH,
+    'irahigh': _SPEC_IRAHIGH,
+    'mod': _SPEC_MOD,
+    'noexp': _SPEC_NOEXP,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _run(calculator, spec_key):
+    """Calculate the plan for a named spec, once per calculator and spec.
+
+    The calculator and specs are deterministic and read-only, so every test
+    asking for the same spec can share one PlanData.
+    """
+    return calculator.calculate(_SPECS[spec_key])
+
+
+requires_post_deferred_years = pytest.mark.skipif(
+    _POST_DEFERRED > _LAST_PLANNING,
+    reason="planning horizon ends before deferred comp is exhausted"
+)
+
+
 class TestExpenseCalculation:
     """Test expense calculations."""
     
-    @pytest.fixture
-    def calculator(self):
-        return PlanCalculator(
-            federal=create_mock_federal(),
-            state=create_mock_state(),
-            espp=create_mock_espp(),
-            social_security=create_mock_social_security(),
-            medicare=create_mock_medicare(),
-            rsu_calculator=create_mock_rsu_calculator()
-        )
-    
     def test_annual_expenses_present(self, calculator):
         """Test that annual expenses are calculated."""
-        spec = create_spec_with_expenses()
-        result = calculator.calculate(spec)
+        result = _run(calculator, 'default')
         
         first_year = result.yearly_data[2026]
         assert first_year.annual_expenses == 80000
     
     def test_annual_expenses_inflate(self, calculator):
         """Test that annual expenses inflate each year."""
-        spec = create_spec_with_expenses()
-        result = calculator.calculate(spec)
+        result = _run(calculator, 'default')
         
         y1 = result.yearly_data[2026]
         y2 = result.yearly_data[2027]
         
-        inflation = spec['expenses']['inflationRate']
+        inflation = _BASE_SPEC['expenses']['inflationRate']
         expected = y1.annual_expenses * (1 + inflation)
-        assert abs(y2.annual_expenses - expected) < 0.01
+        assert y2.annual_expenses == pytest.approx(expected, abs=0.01)
     
     def test_special_expenses_applied(self, calculator):
         """Test that special expenses are applied in the correct year."""
-        spec = create_spec_with_expenses()
-        result = calculator.calculate(spec)
+        result = _run(calculator, 'default')
         
         # 2026 should have no special expense
         assert result.yearly_data[2026].special_expenses == 0
@@ -186,8 +166,7 @@ class TestExpenseCalculation:
     
     def test_total_expenses_calculated(self, calculator):
         """Test that total expenses = annual + special."""
-        spec = create_spec_with_expenses()
-        result = calculator.calculate(spec)
+        result = _run(calculator, 'default')
         
         y = result.yearly_data[2027]
         assert y.total_expenses == y.annual_expenses + y.special_expenses
@@ -196,21 +175,9 @@ class TestExpenseCalculation:
 class TestMoneyMovement:
     """Test money movement calculations."""
     
-    @pytest.fixture
-    def calculator(self):
-        return PlanCalculator(
-            federal=create_mock_federal(),
-            state=create_mock_state(),
-            espp=create_mock_espp(),
-            social_security=create_mock_social_security(),
-            medicare=create_mock_medicare(),
-            rsu_calculator=create_mock_rsu_calculator()
-        )
-    
     def test_income_expense_difference_calculated(self, calculator):
         """Test that income vs expense difference is calculated."""
-        spec = create_spec_with_expenses()
-        result = calculator.calculate(spec)
+        result = _run(calculator, 'default')
         
         y = result.yearly_data[2026]
         expected_diff = y.take_home_pay - y.total_expenses
@@ -218,127 +185,89 @@ class TestMoneyMovement:
     
     def test_taxable_adjustment_positive_when_excess_income(self, calculator):
         """Test that taxable adjustment is positive when income exceeds expenses."""
-        spec = create_spec_with_expenses()
-        # Set low expenses to ensure excess income
-        spec['expenses']['annualAmount'] = 20000
-        result = calculator.calculate(spec)
+        # Low expenses ensure excess income
+        result = _run(calculator, 'low')
         
         y = result.yearly_data[2026]
         assert y.taxable_account_adjustment > 0
     
     def test_taxable_adjustment_negative_when_expenses_exceed(self, calculator):
         """Test that taxable adjustment is negative when expenses exceed income."""
-        spec = create_spec_with_expenses()
-        # Set high expenses to ensure deficit
-        spec['expenses']['annualAmount'] = 500000
-        result = calculator.calculate(spec)
+        # High expenses ensure a deficit
+        result = _run(calculator, 'high')
         
         y = result.yearly_data[2026]
         assert y.taxable_account_adjustment < 0
     
     def test_taxable_balance_increases_with_excess_income(self, calculator):
         """Test that taxable balance increases when there's excess income."""
-        spec = create_spec_with_expenses()
-        spec['expenses']['annualAmount'] = 20000  # Low expenses
-        result = calculator.calculate(spec)
+        result = _run(calculator, 'low')
         
-        initial_taxable = spec['investments']['taxableBalance']
+        initial_taxable = _SPEC_LOW['investments']['taxableBalance']
         y1 = result.yearly_data[2026]
         
         # First year balance should be initial + adjustment
         expected = initial_taxable + y1.taxable_account_adjustment
-        assert abs(y1.balance_taxable - expected) < 0.01
+        assert y1.balance_taxable == pytest.approx(expected, abs=0.01)
     
     def test_taxable_balance_decreases_with_expense_deficit(self, calculator):
         """Test that taxable balance decreases when expenses exceed income."""
-        spec = create_spec_with_expenses()
-        spec['expenses']['annualAmount'] = 500000  # Very high expenses
-        result = calculator.calculate(spec)
+        result = _run(calculator, 'high')
         
-        initial_taxable = spec['investments']['taxableBalance']
+        initial_taxable = _SPEC_HIGH['investments']['taxableBalance']
         y1 = result.yearly_data[2026]
         
         # First year balance should be initial + adjustment (which is negative)
         expected = initial_taxable + y1.taxable_account_adjustment
         assert y1.balance_taxable < initial_taxable
-        assert abs(y1.balance_taxable - expected) < 0.01
+        assert y1.balance_taxable == pytest.approx(expected, abs=0.01)
 
 
 class TestRetirementMoneyMovement:
     """Test money movement in retirement years."""
     
-    @pytest.fixture
-    def calculator(self):
-        return PlanCalculator(
-            federal=create_mock_federal(),
-            state=create_mock_state(),
-            espp=create_mock_espp(),
-            social_security=create_mock_social_security(),
-            medicare=create_mock_medicare(),
-            rsu_calculator=create_mock_rsu_calculator()
-        )
-    
     def test_expenses_continue_in_retirement(self, calculator):
         """Test that expenses continue to be calculated in retirement."""
-        spec = create_spec_with_expenses()
-        result = calculator.calculate(spec)
+        result = _run(calculator, 'default')
         
-        retirement_year = spec['lastWorkingYear'] + 1
-        y = result.yearly_data[retirement_year]
+        y = result.yearly_data[_FIRST_RETIREMENT]
         
         assert y.annual_expenses > 0
         assert y.total_expenses > 0
     
     def test_expenses_inflate_in_retirement(self, calculator):
         """Test that expenses continue to inflate during retirement."""
-        spec = create_spec_with_expenses()
-        result = calculator.calculate(spec)
+        yearly_data = _run(calculator, 'default').yearly_data
         
-        last_working = spec['lastWorkingYear']
-        first_retirement = last_working + 1
-        second_retirement = first_retirement + 1
+        first_expenses = yearly_data[_FIRST_RETIREMENT].annual_expenses
+        second_expenses = yearly_data[_FIRST_RETIREMENT + 1].annual_expenses
         
-        y1 = result.yearly_data[first_retirement]
-        y2 = result.yearly_data[second_retirement]
-        
-        inflation = spec['expenses']['inflationRate']
-        expected = y1.annual_expenses * (1 + inflation)
-        assert abs(y2.annual_expenses - expected) < 0.01
+        inflation = _BASE_SPEC['expenses']['inflationRate']
+        expected = first_expenses * (1 + inflation)
+        assert second_expenses == pytest.approx(expected, abs=0.01)
     
     def test_money_movement_in_retirement(self, calculator):
         """Test that money movement continues in retirement years."""
-        spec = create_spec_with_expenses()
-        result = calculator.calculate(spec)
+        result = _run(calculator, 'default')
         
-        retirement_year = spec['lastWorkingYear'] + 1
-        y = result.yearly_data[retirement_year]
+        y = result.yearly_data[_FIRST_RETIREMENT]
+        take_home, total_expenses, difference, adjustment, hsa = (
+            y.take_home_pay, y.total_expenses, y.income_expense_difference,
+            y.taxable_account_adjustment, y.hsa_contribution)
         
         # Income-expense difference should be calculated
-        expected_diff = y.take_home_pay - y.total_expenses
-        assert y.income_expense_difference == expected_diff
+        expected_diff = take_home - total_expenses
+        assert difference == expected_diff
         # Taxable account adjustment also deducts HSA contribution (before Medicare eligibility)
-        assert y.taxable_account_adjustment == expected_diff - y.hsa_contribution
+        assert adjustment == expected_diff - hsa
 
 
 class TestNoExpensesSpec:
     """Test behavior when no expenses are configured."""
     
-    @pytest.fixture
-    def calculator(self):
-        return PlanCalculator(
-            federal=create_mock_federal(),
-            state=create_mock_state(),
-            espp=create_mock_espp(),
-            social_security=create_mock_social_security(),
-            medicare=create_mock_medicare(),
-            rsu_calculator=create_mock_rsu_calculator()
-        )
-    
     def test_zero_expenses_when_not_configured(self, calculator):
         """Test that expenses are zero when not in spec."""
-        spec = create_spec_with_expenses()
-        del spec['expenses']  # Remove expenses section
-        result = calculator.calculate(spec)
+        result = _run(calculator, 'noexp')
         
         y = result.yearly_data[2026]
         assert y.annual_expenses == 0
@@ -347,9 +276,7 @@ class TestNoExpensesSpec:
     
     def test_taxable_adjustment_equals_take_home_when_no_expenses(self, calculator):
         """Test that all take-home goes to taxable when no expenses."""
-        spec = create_spec_with_expenses()
-        del spec['expenses']  # Remove expenses section
-        result = calculator.calculate(spec)
+        result = _run(calculator, 'noexp')
         
         y = result.yearly_data[2026]
         assert y.taxable_account_adjustment == y.take_home_pay
@@ -358,124 +285,73 @@ class TestNoExpensesSpec:
 class TestIRAWithdrawals:
     """Test IRA/401k withdrawal calculations in post-deferred comp years."""
     
-    @pytest.fixture
-    def calculator(self):
-        return PlanCalculator(
-            federal=create_mock_federal(),
-            state=create_mock_state(),
-            espp=create_mock_espp(),
-            social_security=create_mock_social_security(),
-            medicare=create_mock_medicare(),
-            rsu_calculator=create_mock_rsu_calculator()
-        )
-    
     def test_no_ira_withdrawal_during_working_years(self, calculator):
         """Test that IRA withdrawals are zero during working years."""
-        spec = create_spec_with_expenses()
-        result = calculator.calculate(spec)
+        result = _run(calculator, 'default')
         
-        for year in range(spec['firstYear'], spec['lastWorkingYear'] + 1):
-            assert result.yearly_data[year].ira_withdrawal == 0
+        withdrawals = [result.yearly_data[year].ira_withdrawal
+                       for year in range(_BASE_SPEC['firstYear'], _FIRST_RETIREMENT)]
+        assert withdrawals == [0] * len(withdrawals)
     
     def test_no_ira_withdrawal_during_deferred_comp_years(self, calculator):
         """Test that IRA withdrawals are zero during deferred comp disbursement years."""
-        spec = create_spec_with_expenses()
-        result = calculator.calculate(spec)
-        
-        disbursement_years = spec['deferredCompensationPlan']['disbursementYears']
-        first_retirement = spec['lastWorkingYear'] + 1
+        result = _run(calculator, 'default')
         
-        for year in range(first_retirement, first_retirement + disbursement_years):
-            if year <= spec['lastPlanningYear']:
-                assert result.yearly_data[year].ira_withdrawal == 0
+        withdrawals = [result.yearly_data[year].ira_withdrawal
+                       for year in range(_FIRST_RETIREMENT, min(_POST_DEFERRED, _LAST_PLANNING + 1))]
+        assert withdrawals == [0] * len(withdrawals)
     
+    @requires_post_deferred_years
     def test_ira_withdrawal_after_deferred_comp_exhausted(self, calculator):
         """Test that IRA withdrawals start when deferred comp is exhausted."""
-        spec = create_spec_with_expenses()
-        # High expenses to ensure shortfall
-        spec['expenses']['annualAmount'] = 200000
-        result = calculator.calculate(spec)
-        
-        disbursement_years = spec['deferredCompensationPlan']['disbursementYears']
-        first_retirement = spec['lastWorkingYear'] + 1
-        post_deferred_start = first_retirement + disbursement_years
-        
-        if post_deferred_start <= spec['lastPlanningYear']:
-            y = result.yearly_data[post_deferred_start]
-            # Should have IRA withdrawal when there's an expense shortfall
-            assert y.ira_withdrawal > 0
+        result = _run(calculator, 'irahigh')
+        y = result.yearly_data[_POST_DEFERRED]
+        # Should have IRA withdrawal when there's an expense shortfall
+        assert y.ira_withdrawal > 0
     
+    @requires_post_deferred_years
     def test_ira_withdrawal_limited_by_annuity(self, calculator):
         """Test that IRA withdrawal is limited by balance / remaining years."""
-        spec = create_spec_with_expenses()
-        spec['expenses']['annualAmount'] = 500000  # Very high expenses
-        result = calculator.calculate(spec)
-        
-        disbursement_years = spec['deferredCompensationPlan']['disbursementYears']
-        first_retirement = spec['lastWorkingYear'] + 1
-        post_deferred_start = first_retirement + disbursement_years
+        result = _run(calculator, 'high')
+        y = result.yearly_data[_POST_DEFERRED]
         
-        if post_deferred_start <= spec['lastPlanningYear']:
-            y = result.yearly_data[post_deferred_start]
-            remaining_years = spec['lastPlanningYear'] - post_deferred_start + 1
-            
-            # Get the 401k balance before this year's withdrawal
-            # The withdrawal should be limited by balance / remaining years
-            assert y.ira_withdrawal <= y.balance_ira + y.ira_withdrawal  # Balance before withdrawal
+        # Get the 401k balance before this year's withdrawal
+        # The withdrawal should be limited by balance / remaining years
+        assert y.ira_withdrawal <= y.balance_ira + y.ira_withdrawal  # Balance before withdrawal
     
+    @pytest.mark.skipif(_POST_DEFERRED + 1 > _LAST_PLANNING,
+                        reason="planning horizon has fewer than two post-deferred comp years")
     def test_ira_balance_decreases_with_withdrawals(self, calculator):
         """Test that 401k balance decreases when IRA withdrawals are made."""
-        spec = create_spec_with_expenses()
-        spec['expenses']['annualAmount'] = 200000  # High expenses
-        result = calculator.calculate(spec)
+        result = _run(calculator, 'irahigh')
+        y1 = result.yearly_data[_POST_DEFERRED]
+        y2 = result.yearly_data[_POST_DEFERRED + 1]
         
-        disbursement_years = spec['deferredCompensationPlan']['disbursementYears']
-        first_retirement = spec['lastWorkingYear'] + 1
-        post_deferred_start = first_retirement + disbursement_years
-        
-        if post_deferred_start + 1 <= spec['lastPlanningYear']:
-            y1 = result.yearly_data[post_deferred_start]
-            y2 = result.yearly_data[post_deferred_start + 1]
-            
-            if y1.ira_withdrawal > 0:
-                # Balance after appreciation but before next withdrawal should account for withdrawal
-                expected_growth = y1.balance_ira * 1.08  # 8% appreciation
-                # y2 balance = y1 balance * appreciation - y2 withdrawal
-                assert y2.balance_ira < expected_growth
+        if y1.ira_withdrawal > 0:
+            # Balance after appreciation but before next withdrawal should account for withdrawal
+            expected_growth = y1.balance_ira * 1.08  # 8% appreciation
+            # y2 balance = y1 balance * appreciation - y2 withdrawal
+            assert y2.balance_ira < expected_growth
     
+    @requires_post_deferred_years
     def test_taxable_adjustment_zero_when_ira_covers_shortfall(self, calculator):
         """Test that taxable adjustment is zero when IRA fully covers expense shortfall."""
-        spec = create_spec_with_expenses()
-        # Moderate expenses that IRA annuity can cover
-        spec['expenses']['annualAmount'] = 50000
-        result = calculator.calculate(spec)
-        
-        disbursement_years = spec['deferredCompensationPlan']['disbursementYears']
-        first_retirement = spec['lastWorkingYear'] + 1
-        post_deferred_start = first_retirement + disbursement_years
-        
-        if post_deferred_start <= spec['lastPlanningYear']:
-            y = result.yearly_data[post_deferred_start]
-            # When IRA covers shortfall, taxable adjustment should be >= 0
-            assert y.taxable_account_adjustment >= 0
+        result = _run(calculator, 'mod')
+        y = result.yearly_data[_POST_DEFERRED]
+        # When IRA covers shortfall, taxable adjustment should be >= 0
+        assert y.taxable_account_adjustment >= 0
 
+    @requires_post_deferred_years
     def test_ira_withdrawal_included_in_gross_income(self, calculator):
         """Test that IRA withdrawals are included in gross income for tax purposes."""
-        spec = create_spec_with_expenses()
-        spec['expenses']['annualAmount'] = 200000  # High expenses to trigger IRA withdrawal
-        result = calculator.calculate(spec)
-        
-        disbursement_years = spec['deferredCompensationPlan']['disbursementYears']
-        first_retirement = spec['lastWorkingYear'] + 1
-        post_deferred_start = first_retirement + disbursement_years
-        
-        if post_deferred_start <= spec['lastPlanningYear']:
-            y = result.yearly_data[post_deferred_start]
-            if y.ira_withdrawal > 0:
-                # Gross income should include IRA withdrawal
-                base_income = y.short_term_capital_gains + y.long_term_capital_gains
-                assert y.gross_income == base_income + y.ira_withdrawal
+        result = _run(calculator, 'irahigh')
+        y = result.yearly_data[_POST_DEFERRED]
+        if y.ira_withdrawal > 0:
+            # Gross income should include IRA withdrawal
+            base_income = y.short_term_capital_gains + y.long_term_capital_gains
+            assert y.gross_income == base_income + y.ira_withdrawal
 
+    @requires_post_deferred_years
     def test_ira_withdrawal_is_taxable(self, calculator):
         """Test that IRA withdrawals are subject to income tax when above deductions."""
         spec = create_spec_with_expenses()
@@ -484,40 +360,23 @@ class TestIRAWithdrawals:
         spec['investments']['taxDeferredBalance'] = 2000000
         result = calculator.calculate(spec)
         
-        disbursement_years = spec['deferredCompensationPlan']['disbursementYears']
-        first_retirement = spec['lastWorkingYear'] + 1
-        post_deferred_start = first_retirement + disbursement_years
-        
-        if post_deferred_start <= spec['lastPlanningYear']:
-            y = result.yearly_data[post_deferred_start]
-            if y.ira_withdrawal > 0:
-                # Gross income should equal base income (capital gains) + IRA withdrawal
-                base_income = y.short_term_capital_gains + y.long_term_capital_gains
-                expected_gross = base_income + y.ira_withdrawal
-                assert abs(y.gross_income - expected_gross) < 0.01, \
-                    f"Gross income {y.gross_income} should equal base {base_income} + IRA {y.ira_withdrawal} = {expected_gross}"
+        y = result.yearly_data[_POST_DEFERRED]
+        if y.ira_withdrawal > 0:
+            # Gross income should equal base income (capital gains) + IRA withdrawal
+            base_income = y.short_term_capital_gains + y.long_term_capital_gains
+            expected_gross = base_income + y.ira_withdrawal
+            assert y.gross_income == pytest.approx(expected_gross, abs=0.01), \
+                f"Gross income {y.gross_income} should equal base {base_income} + IRA {y.ira_withdrawal} = {expected_gross}"
 
 
 class TestIRAWithdrawalAnnuity:
     """Test IRA withdrawal annuity behavior - withdrawals to deplete IRA by end of plan."""
     
-    @pytest.fixture
-    def calculator(self):
-        return PlanCalculator(
-            federal=create_mock_federal(),
-            state=create_mock_state(),
-            espp=create_mock_espp(),
-            social_security=create_mock_social_security(),
-            medicare=create_mock_medicare(),
-            rsu_calculator=create_mock_rsu_calculator()
-        )
-    
     def test_ira_balance_near_zero_at_end_of_plan(self, calculator):
         """Test that IRA balance is depleted (near zero) at the end of planning horizon."""
-        spec = create_spec_with_expenses()
-        spec['investments']['taxDeferredBalance'] = 500000
-        spec['expenses']['annualAmount'] = 50000  # Moderate expenses
-        result = calculator.calculate(spec)
+        # Default 401k balance with moderate expenses
+        spec = _SPEC_MOD
+        result = _run(calculator, 'mod')
         
         final_year = spec['lastPlanningYear']
         y = result.yearly_data[final_year]
@@ -566,7 +425,7 @@ class TestIRAWithdrawalAnnuity:
             expected_annuity = balance_before / remaining_years
             
             # Withdrawal should be close to annuity (within 20% tolerance for tax effects)
-            assert abs(y.ira_withdrawal - expected_annuity) / expected_annuity < 0.20, \
+            assert y.ira_withdrawal == pytest.approx(expected_annuity, rel=0.20), \
                 f"IRA withdrawal {y.ira_withdrawal:,.0f} should approximate annuity {expected_annuity:,.0f}"
     
     def test_ira_withdrawal_increases_for_expense_shortfall(self, calculator):
@@ -600,10 +459,8 @@ class TestIRAWithdrawalAnnuity:
     
     def test_ira_depletion_over_multiple_years(self, calculator):
         """Test that IRA balance decreases progressively over post-disbursement years."""
-        spec = create_spec_with_expenses()
-        spec['investments']['taxDeferredBalance'] = 500000
-        spec['expenses']['annualAmount'] = 50000
-        result = calculator.calculate(spec)
+        spec = _SPEC_MOD
+        result = _run(calculator, 'mod')
         
         disbursement_years = spec['deferredCompensationPlan']['disbursementYears']
         first_retirement = spec['lastWorkingYear'] + 1
@@ -623,10 +480,8 @@ class TestIRAWithdrawalAnnuity:
     
     def test_all_post_disbursement_years_have_ira_withdrawal(self, calculator):
         """Test that every post-disbursement year has some IRA withdrawal."""
-        spec = create_spec_with_expenses()
-        spec['investments']['taxDeferredBalance'] = 500000
-        spec['expenses']['annualAmount'] = 50000
-        result = calculator.calculate(spec)
+        spec = _SPEC_MOD
+        result = _run(calculator, 'mod')
         
         disbursement_years = spec['deferredCompensationPlan']['disbursementYears']
         first_retirement = spec['lastWorkingYear'] + 1
@@ -642,10 +497,8 @@ class TestIRAWithdrawalAnnuity:
     
     def test_final_year_withdrawal_equals_remaining_balance(self, calculator):
         """Test that final year withdrawal depletes remaining IRA balance."""
-        spec = create_spec_with_expenses()
-        spec['investments']['taxDeferredBalance'] = 500000
-        spec['expenses']['annualAmount'] = 50000
-        result = calculator.calculate(spec)
+        spec = _SPEC_MOD
+        result = _run(calculator, 'mod')
         
         final_year = spec['lastPlanningYear']
         y = result.yearly_data[final_year]
@@ -4,93 +4,32 @@ This tests the unified calculation approach that uses three loops:
 1. Working years - all income, contributions, and taxes while employed
 2. Deferred comp withdrawal years - retirement with disbursements
 3. Post-withdrawal years - retirement without disbursements
-"""
-
-import os
-import sys
-import pytest
-from unittest.mock import Mock, MagicMock
-
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
-
-from calc.plan_calculator import PlanCalculator
-from model.PlanData import YearlyData, PlanData
-
-
-def create_mock_federal():
-    """Create a mock FederalDetails with sensible defaults."""
-    mock = Mock()
-    mock.totalDeductions.return_value = {
-        'standardDeduction': 30000,
-        'itemizedDeduction': 0,
-        'max401k': 24000,
-        'maxHSA': 8000,
-        'employeeHSA': 8000,
-        'total': 62000
-    }
-    federal_result = Mock()
-    federal_result.totalFederalTax = 50000
-    federal_result.marginalBracket = 0.24
-    mock.taxBurden.return_value = federal_result
-    mock.longTermCapitalGainsTax.return_value = 1000
-    return mock
-
-
-def create_mock_state():
-    """Create a mock StateDetails with sensible defaults."""
-    mock = Mock()
-    mock.taxBurden.return_value = 15000
-    mock.shortTermCapitalGainsTax.return_value = 500
-    return mock
-
-
-def create_mock_espp():
-    """Create a mock ESPPDetails with sensible defaults."""
-    mock = Mock()
-    mock.taxable_from_spec.return_value = 5000
-    return mock
-
-
-def create_mock_social_security():
-    """Create a mock SocialSecurityDetails."""
-    mock = Mock()
-    mock.total_contribution.return_value = 12000
-    # Mock get_data_for_year for weekly take-home calculations
-    mock.get_data_for_year.return_value = {
-        'maximumTaxedIncome': 168600,  # 2024 SS wage base
-        'employeePortion': 0.062,
-        'maPFML': 0.00318
-    }
-    # Set wage_base attribute for paycheck calculations
-    mock.wage_base = 168600
-    return mock
 
+PYTEST_DONT_REWRITE: this module is not assertion-rewritten, so failures
+report only the failing line. Remove the marker temporarily to get pytest's
+value-by-value comparison when debugging.
+"""
 
-def create_mock_medicare():
-    """Create a mock MedicareDetails."""
-    mock = Mock()
-    mock.base_contribution.return_value = 5000
-    mock.surcharge.return_value = 1000
-    # Instance attributes for weekly take-home calculations
-    mock.medicare_rate = 0.0145
-    mock.surcharge_threshold = 200000
-    mock.surcharge_rate = 0.009
-    return mock
+from dataclasses import replace
+from types import MappingProxyType
 
+import pytest
 
-def create_mock_rsu_calculator(vested_values=None):
-    """Create a mock RSUCalculator."""
-    mock = Mock()
-    mock.vested_value = vested_values or {2026: 50000, 2027: 55000}
-    return mock
+# Keep the whole module on one xdist worker so the module-scoped plans are
+# calculated once.
+pytestmark = pytest.mark.xdist_group("plan_calculator")
 
 
 def create_basic_spec():
-    """Create a minimal spec dictionary for testing."""
+    """Create a minimal spec dictionary for testing.
+
+    The horizon covers three working years and the first two retirement
+    years, which is all most tests look at.
+    """
     return {
         'firstYear': 2026,
         'lastWorkingYear': 2028,
-        'lastPlanningYear': 2040,
+        'lastPlanningYear': 2030,
         'federalBracketInflation': 0.03,
         'income': {
             'baseSalary': 200000,
@@ -131,144 +70,135 @@ def create_basic_spec():
     }
 
 
+def _freeze(spec):
+    """Return a read-only view of a spec, including its nested sections and lists."""
+    if isinstance(spec, dict):
+        return MappingProxyType({key: _freeze(value) for key, value in spec.items()})
+    if isinstance(spec, list):
+        return tuple(_freeze(value) for value in spec)
+    return spec
+
+
+_BASIC_SPEC = _freeze(create_basic_spec())
+
+
+def spec_with(**overrides):
+    """Return the basic spec with the given top-level keys replaced.
+
+    Sections that are not overridden are shared read-only views of the basic
+    spec, so nothing is deep-copied. To change a single field in a section,
+    pass ``section={**_BASIC_SPEC['section'], 'field': value}``.
+    """
+    return {**_BASIC_SPEC, **overrides}
+
+
+def create_long_horizon_spec():
+    """Create the basic spec extended through the full deferred comp payout."""
+    return spec_with(lastPlanningYear=2040)
+
+
+def create_extended_spec():
+    """Create the basic spec extended past the deferred comp payout."""
+    return spec_with(lastPlanningYear=2050)  # Extend to have post-withdrawal years
+
+
+@pytest.fixture(scope="module")
+def basic_spec():
+    """Read-only basic spec shared by tests that do not modify it.
+
+    Tests that need a variant build it with spec_with() instead.
+    """
+    return _BASIC_SPEC
+
+
+@pytest.fixture(scope="module")
+def default_result(cached_calculate, basic_spec):
+    """Plan calculated once from the basic spec and shared by the read-only tests."""
+    return cached_calculate(basic_spec)
+
+
+@pytest.fixture(scope="module")
+def yearly_sums(default_result):
+    """Lifetime sums of the default plan's yearly fields, built in a single pass."""
+    gross = federal = state = taxes = take_home = 0.0
+    for yd in default_result.yearly_data.values():
+        gross += yd.gross_income
+        federal += yd.federal_tax
+        state += yd.state_tax
+        taxes += yd.total_taxes
+        take_home += yd.take_home_pay
+    return {
+        'total_gross_income': gross,
+        'total_federal_tax': federal,
+        'total_state_tax': state,
+        'total_taxes': taxes,
+        'total_take_home': take_home,
+    }
+
+
+@pytest.fixture(scope="module")
+def long_horizon_result(cached_calculate):
+    """Plan calculated once from the long-horizon spec."""
+    return cached_calculate(create_long_horizon_spec())
+
+
+@pytest.fixture(scope="module")
+def extended_result(cached_calculate):
+    """Plan calculated once from the extended spec, which has post-withdrawal years."""
+    return cached_calculate(create_extended_spec())
+
+
 class TestPlanCalculatorBasics:
     """Test basic PlanCalculator functionality."""
     
-    @pytest.fixture
-    def calculator(self):
-        """Create a PlanCalculator with mock dependencies."""
-        return PlanCalculator(
-            federal=create_mock_federal(),
-            state=create_mock_state(),
-            espp=create_mock_espp(),
-            social_security=create_mock_social_security(),
-            medicare=create_mock_medicare(),
-            rsu_calculator=create_mock_rsu_calculator()
-        )
-    
-    def test_calculate_returns_plan_data(self, calculator):
+    def test_calculate_returns_plan_data(self, default_result):
         """Test that calculate returns a PlanData object."""
-        spec = create_basic_spec()
-        result = calculator.calculate(spec)
+        from model.PlanData import PlanData
         
-        assert isinstance(result, PlanData)
-        assert result.first_year == 2026
-        assert result.last_working_year == 2028
-        assert result.last_planning_year == 2040
+        assert isinstance(default_result, PlanData)
+        assert default_result.first_year == 2026
+        assert default_result.last_working_year == 2028
+        assert default_result.last_planning_year == 2030
     
-    def test_all_years_have_data(self, calculator):
+    def test_all_years_have_data(self, default_result):
         """Test that all years in the planning horizon have data."""
-        spec = create_basic_spec()
-        result = calculator.calculate(spec)
+        from model.PlanData import YearlyData
         
-        expected_years = result.last_planning_year - result.first_year + 1
-        assert len(result.yearly_data) == expected_years
-        
-        for year in range(result.first_year, result.last_planning_year + 1):
-            assert year in result.yearly_data
-            assert isinstance(result.yearly_data[year], YearlyData)
+        expected_years = set(range(default_result.first_year, default_result.last_planning_year + 1))
+        assert default_result.yearly_data.keys() == expected_years
+        assert all(isinstance(data, YearlyData) for data in default_result.yearly_data.values())
     
-    def test_working_years_flagged_correctly(self, calculator):
+    def test_working_years_flagged_correctly(self, basic_spec, default_result):
         """Test that is_working_year is set correctly for each year."""
-        spec = create_basic_spec()
-        result = calculator.calculate(spec)
-        
-        for year, data in result.yearly_data.items():
-            if year <= spec['lastWorkingYear']:
-                assert data.is_working_year is True, f"Year {year} should be a working year"
-            else:
-                assert data.is_working_year is False, f"Year {year} should be a retirement year"
+        last_working = basic_spec['lastWorkingYear']
+        flags = {year: data.is_working_year for year, data in default_result.yearly_data.items()}
+        expected = {year: year <= last_working for year in flags}
+        assert flags == expected
 
 
 class TestWorkingYearsLoop:
     """Test the working years loop (Loop 1)."""
     
-    @pytest.fixture
-    def calculator(self):
-        return PlanCalculator(
-            federal=create_mock_federal(),
-            state=create_mock_state(),
-            espp=create_mock_espp(),
-            social_security=create_mock_social_security(),
-            medicare=create_mock_medicare(),
-            rsu_calculator=create_mock_rsu_calculator()
-        )
-    
-    def test_working_year_has_income(self, calculator):
-        """Test that working years have income components."""
-        spec = create_basic_spec()
-        result = calculator.calculate(spec)
-        
-        first_year_data = result.yearly_data[2026]
-        
-        assert first_year_data.base_salary > 0
-        assert first_year_data.bonus > 0
-        assert first_year_data.gross_income > 0
-    
-    def test_salary_inflates_each_year(self, calculator):
+    def test_salary_inflates_each_year(self, basic_spec, default_result):
         """Test that salary increases each year."""
-        spec = create_basic_spec()
-        result = calculator.calculate(spec)
-        
-        y1 = result.yearly_data[2026]
-        y2 = result.yearly_data[2027]
-        y3 = result.yearly_data[2028]
+        y1 = default_result.yearly_data[2026]
+        y2 = default_result.yearly_data[2027]
+        y3 = default_result.yearly_data[2028]
         
         # Each year's salary should be higher than the previous
         assert y2.base_salary > y1.base_salary
         assert y3.base_salary > y2.base_salary
         
         # Should follow the inflation rate
-        increase_rate = spec['income']['annualBaseIncreaseFraction']
+        increase_rate = basic_spec['income']['annualBaseIncreaseFraction']
         expected_y2_salary = y1.base_salary * (1 + increase_rate)
-        assert abs(y2.base_salary - expected_y2_salary) < 0.01
-    
-    def test_deferrals_calculated(self, calculator):
-        """Test that deferrals are calculated correctly."""
-        spec = create_basic_spec()
-        result = calculator.calculate(spec)
-        
-        first_year = result.yearly_data[2026]
-        
-        expected_base_deferral = spec['income']['baseSalary'] * spec['income']['baseDeferralFraction']
-        expected_bonus_deferral = (spec['income']['baseSalary'] * spec['income']['bonusFraction'] * 
-                                   spec['income']['bonusDeferralFraction'])
-        
-        assert abs(first_year.base_deferral - expected_base_deferral) < 0.01
-        assert abs(first_year.bonus_deferral - expected_bonus_deferral) < 0.01
-        assert first_year.total_deferral == first_year.base_deferral + first_year.bonus_deferral
-    
-    def test_contributions_tracked(self, calculator):
-        """Test that 401k and HSA contributions are tracked."""
-        spec = create_basic_spec()
-        result = calculator.calculate(spec)
-        
-        first_year = result.yearly_data[2026]
-        
-        assert first_year.employee_401k_contribution > 0
-        assert first_year.employer_401k_match >= 0
-        assert first_year.total_401k_contribution == first_year.employee_401k_contribution + first_year.employer_401k_match
-        assert first_year.hsa_contribution > 0
-    
-    def test_fica_taxes_calculated(self, calculator):
-        """Test that FICA taxes are calculated for working years."""
-        spec = create_basic_spec()
-        result = calculator.calculate(spec)
-        
-        first_year = result.yearly_data[2026]
-        
-        assert first_year.social_security_tax > 0
-        assert first_year.medicare_tax > 0
-        assert first_year.total_fica > 0
+        assert y2.base_salary == pytest.approx(expected_y2_salary, abs=0.01)
     
-    def test_balances_accumulate(self, calculator):
+    def test_balances_accumulate(self, default_result):
         """Test that balances accumulate over working years."""
-        spec = create_basic_spec()
-        result = calculator.calculate(spec)
-        
-        y1 = result.yearly_data[2026]
-        y2 = result.yearly_data[2027]
-        y3 = result.yearly_data[2028]
+        y1 = default_result.yearly_data[2026]
+        y2 = default_result.yearly_data[2027]
+        y3 = default_result.yearly_data[2028]
         
         # Balances should grow each year (contributions + appreciation)
         assert y2.balance_ira > y1.balance_ira
@@ -281,57 +211,42 @@ class TestWorkingYearsLoop:
 class TestDeferredCompWithdrawalYearsLoop:
     """Test the deferred compensation withdrawal years loop (Loop 2)."""
     
-    @pytest.fixture
-    def calculator(self):
-        return PlanCalculator(
-            federal=create_mock_federal(),
-            state=create_mock_state(),
-            espp=create_mock_espp(),
-            social_security=create_mock_social_security(),
-            medicare=create_mock_medicare(),
-            rsu_calculator=create_mock_rsu_calculator()
-        )
-    
-    def test_disbursements_start_after_working_years(self, calculator):
+    def test_disbursements_start_after_working_years(self, basic_spec, default_result):
         """Test that disbursements start the year after last working year."""
-        spec = create_basic_spec()
-        result = calculator.calculate(spec)
-        
-        last_working = spec['lastWorkingYear']
+        last_working = basic_spec['lastWorkingYear']
         first_retirement = last_working + 1
         
         # Last working year should have no disbursement
-        assert result.yearly_data[last_working].deferred_comp_disbursement == 0
+        assert default_result.yearly_data[last_working].deferred_comp_disbursement == 0
         
         # First retirement year should have disbursement
-        assert result.yearly_data[first_retirement].deferred_comp_disbursement > 0
+        assert default_result.yearly_data[first_retirement].deferred_comp_disbursement > 0
     
-    def test_disbursements_follow_annuity_pattern(self, calculator):
+    @pytest.mark.slow
+    def test_disbursements_follow_annuity_pattern(self, long_horizon_result):
         """Test that disbursements are calculated as balance / remaining years."""
-        spec = create_basic_spec()
-        result = calculator.calculate(spec)
+        spec = create_long_horizon_spec()
         
         disbursement_years = spec['deferredCompensationPlan']['disbursementYears']
         first_retirement = spec['lastWorkingYear'] + 1
         
         # Each year's disbursement should be approximately balance / remaining years
         # Due to growth, disbursements will increase over time
-        disbursements = []
-        for year in range(first_retirement, first_retirement + disbursement_years):
-            if year <= spec['lastPlanningYear']:
-                disbursements.append(result.yearly_data[year].deferred_comp_disbursement)
+        last_disbursement = min(first_retirement + disbursement_years, spec['lastPlanningYear'] + 1)
+        yearly_data = long_horizon_result.yearly_data
+        disbursements = [yearly_data[year].deferred_comp_disbursement
+                         for year in range(first_retirement, last_disbursement)]
         
         # Disbursements should generally increase due to growth
         # (each year the remaining balance grows before the disbursement)
-        if len(disbursements) > 1:
-            for i in range(1, len(disbursements)):
-                # Later disbursements should be >= earlier ones due to growth
-                assert disbursements[i] >= disbursements[i-1] * 0.99  # Allow small rounding
+        # Later disbursements should be >= earlier ones, allowing small rounding
+        assert all(later >= earlier * 0.99
+                   for earlier, later in zip(disbursements, disbursements[1:]))
     
-    def test_deferred_comp_balance_zero_after_disbursements(self, calculator):
+    @pytest.mark.slow
+    def test_deferred_comp_balance_zero_after_disbursements(self, long_horizon_result):
         """Test that deferred comp balance is zero after all disbursements."""
-        spec = create_basic_spec()
-        result = calculator.calculate(spec)
+        spec = create_long_horizon_spec()
         
         disbursement_years = spec['deferredCompensationPlan']['disbursementYears']
         first_retirement = spec['lastWorkingYear'] + 1
@@ -339,62 +254,45 @@ class TestDeferredCompWithdrawalYearsLoop:
         
         if last_disbursement_year <= spec['lastPlanningYear']:
             # Balance should be zero after the last disbursement
-            assert result.yearly_data[last_disbursement_year].balance_deferred_comp == 0
+            assert long_horizon_result.yearly_data[last_disbursement_year].balance_deferred_comp == 0
     
-    def test_no_fica_in_retirement(self, calculator):
+    def test_no_fica_in_retirement(self, basic_spec, default_result):
         """Test that there are no FICA taxes in retirement years."""
-        spec = create_basic_spec()
-        result = calculator.calculate(spec)
+        first_retirement = basic_spec['lastWorkingYear'] + 1
         
-        first_retirement = spec['lastWorkingYear'] + 1
-        
-        assert result.yearly_data[first_retirement].total_fica == 0
-        assert result.yearly_data[first_retirement].social_security_tax == 0
-        assert result.yearly_data[first_retirement].medicare_tax == 0
+        retirement_data = default_result.yearly_data[first_retirement]
+        assert retirement_data.total_fica == 0
+        assert retirement_data.social_security_tax == 0
+        assert retirement_data.medicare_tax == 0
     
-    def test_no_salary_in_retirement(self, calculator):
+    def test_no_salary_in_retirement(self, basic_spec, default_result):
         """Test that there is no salary in retirement years."""
-        spec = create_basic_spec()
-        result = calculator.calculate(spec)
+        first_retirement = basic_spec['lastWorkingYear'] + 1
         
-        first_retirement = spec['lastWorkingYear'] + 1
-        
-        assert result.yearly_data[first_retirement].base_salary == 0
-        assert result.yearly_data[first_retirement].bonus == 0
+        retirement_data = default_result.yearly_data[first_retirement]
+        assert retirement_data.base_salary == 0
+        assert retirement_data.bonus == 0
     
-    def test_deferred_balance_decreases_during_withdrawal(self, calculator):
+    def test_deferred_balance_decreases_during_withdrawal(self, basic_spec, default_result):
         """Test that deferred comp balance decreases during withdrawal."""
-        spec = create_basic_spec()
-        result = calculator.calculate(spec)
-        
-        first_retirement = spec['lastWorkingYear'] + 1
+        first_retirement = basic_spec['lastWorkingYear'] + 1
         second_retirement = first_retirement + 1
         
         # Balance should decrease as disbursements are made
-        if second_retirement <= spec['lastPlanningYear']:
-            assert (result.yearly_data[second_retirement].balance_deferred_comp < 
-                    result.yearly_data[first_retirement].balance_deferred_comp)
+        if second_retirement <= basic_spec['lastPlanningYear']:
+            yearly_data = default_result.yearly_data
+            assert (yearly_data[second_retirement].balance_deferred_comp < 
+                    yearly_data[first_retirement].balance_deferred_comp)
 
 
 class TestPostWithdrawalYearsLoop:
     """Test the post-deferred comp withdrawal years loop (Loop 3)."""
     
-    @pytest.fixture
-    def calculator(self):
-        return PlanCalculator(
-            federal=create_mock_federal(),
-            state=create_mock_state(),
-            espp=create_mock_espp(),
-            social_security=create_mock_social_security(),
-            medicare=create_mock_medicare(),
-            rsu_calculator=create_mock_rsu_calculator()
-        )
-    
-    def test_no_disbursement_after_withdrawal_period(self, calculator):
+    @pytest.mark.slow
+    def test_no_disbursement_after_withdrawal_period(self, extended_result):
         """Test that there are no disbursements after the withdrawal period."""
-        spec = create_basic_spec()
-        spec['lastPlanningYear'] = 2050  # Extend to have post-withdrawal years
-        result = calculator.calculate(spec)
+        spec = create_extended_spec()
+        result = extended_result
         
         disbursement_years = spec['deferredCompensationPlan']['disbursementYears']
         first_retirement = spec['lastWorkingYear'] + 1
@@ -403,11 +301,11 @@ class TestPostWithdrawalYearsLoop:
         if post_withdrawal_start <= spec['lastPlanningYear']:
             assert result.yearly_data[post_withdrawal_start].deferred_comp_disbursement == 0
     
-    def test_deferred_balance_zero_after_withdrawal(self, calculator):
+    @pytest.mark.slow
+    def test_deferred_balance_zero_after_withdrawal(self, extended_result):
         """Test that deferred comp balance is zero after withdrawal period."""
-        spec = create_basic_spec()
-        spec['lastPlanningYear'] = 2050  # Extend to have post-withdrawal years
-        result = calculator.calculate(spec)
+        spec = create_extended_spec()
+        result = extended_result
         
         disbursement_years = spec['deferredCompensationPlan']['disbursementYears']
         first_retirement = spec['lastWorkingYear'] + 1
@@ -416,11 +314,11 @@ class TestPostWithdrawalYearsLoop:
         if post_withdrawal_start <= spec['lastPlanningYear']:
             assert result.yearly_data[post_withdrawal_start].balance_deferred_comp == 0
     
-    def test_capital_gains_continue_post_withdrawal(self, calculator):
+    @pytest.mark.slow
+    def test_capital_gains_continue_post_withdrawal(self, extended_result):
         """Test that capital gains income continues in post-withdrawal years."""
-        spec = create_basic_spec()
-        spec['lastPlanningYear'] = 2050
-        result = calculator.calculate(spec)
+        spec = create_extended_spec()
+        result = extended_result
         
         disbursement_years = spec['deferredCompensationPlan']['disbursementYears']
         first_retirement = spec['lastWorkingYear'] + 1
@@ -436,154 +334,111 @@ class TestPostWithdrawalYearsLoop:
 class TestLifetimeTotals:
     """Test lifetime totals in PlanData."""
     
-    @pytest.fixture
-    def calculator(self):
-        return PlanCalculator(
-            federal=create_mock_federal(),
-            state=create_mock_state(),
-            espp=create_mock_espp(),
-            social_security=create_mock_social_security(),
-            medicare=create_mock_medicare(),
-            rsu_calculator=create_mock_rsu_calculator()
-        )
-    
-    def test_totals_sum_correctly(self, calculator):
+    @pytest.mark.parametrize("total_field", [
+        "total_gross_income",
+        "total_federal_tax",
+        "total_state_tax",
+        "total_taxes",
+        "total_take_home",
+    ])
+    def test_totals_sum_correctly(self, default_result, yearly_sums, total_field):
         """Test that lifetime totals are correct sums of yearly data."""
-        spec = create_basic_spec()
-        result = calculator.calculate(spec)
-        
-        # Sum up the yearly values
-        expected_gross = sum(yd.gross_income for yd in result.yearly_data.values())
-        expected_federal = sum(yd.federal_tax for yd in result.yearly_data.values())
-        expected_state = sum(yd.state_tax for yd in result.yearly_data.values())
-        expected_total_tax = sum(yd.total_taxes for yd in result.yearly_data.values())
-        expected_take_home = sum(yd.take_home_pay for yd in result.yearly_data.values())
-        
-        assert abs(result.total_gross_income - expected_gross) < 0.01
-        assert abs(result.total_federal_tax - expected_federal) < 0.01
-        assert abs(result.total_state_tax - expected_state) < 0.01
-        assert abs(result.total_taxes - expected_total_tax) < 0.01
-        assert abs(result.total_take_home - expected_take_home) < 0.01
+        assert getattr(default_result, total_field) == pytest.approx(yearly_sums[total_field], abs=0.01)
     
-    def test_final_balances_match_last_year(self, calculator):
+    def test_final_balances_match_last_year(self, basic_spec, default_result):
         """Test that final balances match the last year's balances."""
-        spec = create_basic_spec()
-        result = calculator.calculate(spec)
-        
-        last_year_data = result.yearly_data[spec['lastPlanningYear']]
+        last_year_data = default_result.yearly_data[basic_spec['lastPlanningYear']]
         
-        assert result.final_401k_balance == last_year_data.balance_ira
-        assert result.final_hsa_balance == last_year_data.balance_hsa
-        assert result.final_deferred_comp_balance == last_year_data.balance_deferred_comp
-        assert result.final_taxable_balance == last_year_data.balance_taxable
+        assert default_result.final_401k_balance == last_year_data.balance_ira
+        assert default_result.final_hsa_balance == last_year_data.balance_hsa
+        assert default_result.final_deferred_comp_balance == last_year_data.balance_deferred_comp
+        assert default_result.final_taxable_balance == last_year_data.balance_taxable
 
 
 class TestInflationHandling:
     """Test that inflation is applied correctly."""
     
-    @pytest.fixture
-    def calculator(self):
-        return PlanCalculator(
-            federal=create_mock_federal(),
-            state=create_mock_state(),
-            espp=create_mock_espp(),
-            social_security=create_mock_social_security(),
-            medicare=create_mock_medicare(),
-            rsu_calculator=create_mock_rsu_calculator()
-        )
-    
-    def test_medical_costs_inflate(self, calculator):
+    def test_medical_costs_inflate(self, basic_spec, default_result):
         """Test that medical costs inflate each year."""
-        spec = create_basic_spec()
-        result = calculator.calculate(spec)
+        y1 = default_result.yearly_data[2026]
+        y2 = default_result.yearly_data[2027]
         
-        y1 = result.yearly_data[2026]
-        y2 = result.yearly_data[2027]
-        
-        medical_inflation = spec['deductions']['medicalInflationRate']
+        medical_inflation = basic_spec['deductions']['medicalInflationRate']
         expected = y1.medical_dental_vision * (1 + medical_inflation)
         
-        assert abs(y2.medical_dental_vision - expected) < 0.01
+        assert y2.medical_dental_vision == pytest.approx(expected, abs=0.01)
     
-    def test_local_tax_inflates(self, calculator):
+    def test_local_tax_inflates(self, basic_spec, default_result):
         """Test that local tax inflates each year."""
-        spec = create_basic_spec()
-        result = calculator.calculate(spec)
+        y1 = default_result.yearly_data[2026]
+        y2 = default_result.yearly_data[2027]
         
-        y1 = result.yearly_data[2026]
-        y2 = result.yearly_data[2027]
-        
-        local_tax_inflation = spec['localTax']['inflationRate']
+        local_tax_inflation = basic_spec['localTax']['inflationRate']
         expected = y1.local_tax * (1 + local_tax_inflation)
         
-        assert abs(y2.local_tax - expected) < 0.01
+        assert y2.local_tax == pytest.approx(expected, abs=0.01)
     
-    def test_local_tax_continues_in_retirement(self, calculator):
+    def test_local_tax_continues_in_retirement(self, basic_spec, default_result):
         """Test that local tax continues to inflate in retirement."""
-        spec = create_basic_spec()
-        result = calculator.calculate(spec)
-        
-        last_working = result.yearly_data[spec['lastWorkingYear']]
-        first_retirement = result.yearly_data[spec['lastWorkingYear'] + 1]
+        last_working = default_result.yearly_data[basic_spec['lastWorkingYear']]
+        first_retirement = default_result.yearly_data[basic_spec['lastWorkingYear'] + 1]
         
-        local_tax_inflation = spec['localTax']['inflationRate']
+        local_tax_inflation = basic_spec['localTax']['inflationRate']
         expected = last_working.local_tax * (1 + local_tax_inflation)
         
-        assert abs(first_retirement.local_tax - expected) < 0.01
+        assert first_retirement.local_tax == pytest.approx(expected, abs=0.01)
 
 
 class TestEdgeCases:
     """Test edge cases and boundary conditions."""
     
-    @pytest.fixture
-    def calculator(self):
-        return PlanCalculator(
-            federal=create_mock_federal(),
-            state=create_mock_state(),
-            espp=create_mock_espp(),
-            social_security=create_mock_social_security(),
-            medicare=create_mock_medicare(),
-            rsu_calculator=create_mock_rsu_calculator()
-        )
-    
-    def test_single_working_year(self, calculator):
+    def test_single_working_year(self, cached_calculate):
         """Test with only one working year."""
-        spec = create_basic_spec()
-        spec['lastWorkingYear'] = spec['firstYear']
-        spec['lastPlanningYear'] = spec['firstYear'] + 5
+        spec = spec_with(
+            lastWorkingYear=_BASIC_SPEC['firstYear'],
+            lastPlanningYear=_BASIC_SPEC['firstYear'] + 5,
+        )
         
-        result = calculator.calculate(spec)
+        result = cached_calculate(spec)
         
         assert len(result.yearly_data) == 6
         assert result.yearly_data[spec['firstYear']].is_working_year is True
         assert result.yearly_data[spec['firstYear'] + 1].is_working_year is False
     
-    def test_no_deferred_compensation(self, calculator):
+    def test_no_deferred_compensation(self, cached_calculate):
         """Test with no deferred compensation contributions."""
-        spec = create_basic_spec()
-        spec['income']['baseDeferralFraction'] = 0
-        spec['income']['bonusDeferralFraction'] = 0
+        spec = spec_with(
+            income={
+                **_BASIC_SPEC['income'],
+                'baseDeferralFraction': 0,
+                'bonusDeferralFraction': 0,
+            },
+        )
         
-        result = calculator.calculate(spec)
+        result = cached_calculate(spec)
         
         # All years should have zero deferred comp balance
         for yd in result.yearly_data.values():
             assert yd.balance_deferred_comp == 0
             assert yd.deferred_comp_disbursement == 0
     
-    def test_zero_disbursement_years(self, calculator):
+    def test_zero_disbursement_years(self, cached_calculate):
         """Test with zero disbursement years configured."""
-        spec = create_basic_spec()
-        spec['deferredCompensationPlan']['disbursementYears'] = 0
+        spec = spec_with(
+            deferredCompensationPlan={
+                **_BASIC_SPEC['deferredCompensationPlan'],
+                'disbursementYears': 0,
+            },
+        )
         
-        result = calculator.calculate(spec)
+        result = cached_calculate(spec)
         
         # No disbursements should occur
         for year, yd in result.yearly_data.items():
             if year > spec['lastWorkingYear']:
                 assert yd.deferred_comp_disbursement == 0
     
-    def test_missing_optional_spec_fields(self, calculator):
+    def test_missing_optional_spec_fields(self, cached_calculate):
         """Test that missing optional fields don't cause errors."""
         spec = {
             'firstYear': 2026,
@@ -595,7 +450,7 @@ class TestEdgeCases:
         }
         
         # Should not raise an error
-        result = calculator.calculate(spec)
+        result = cached_calculate(spec)
         
         assert len(result.yearly_data) == 5
         assert result.yearly_data[2026].base_salary == 100000
@@ -604,22 +459,19 @@ class TestEdgeCases:
 class TestEsppIncome:
     """Test ESPP income handling."""
     
-    def test_espp_income_from_spec_first_year(self):
+    def test_espp_income_from_spec_first_year(self, plan_dependencies):
         """Test that esppIncome from spec is used for first year."""
-        mock_espp = create_mock_espp()
-        mock_espp.taxable_from_spec.return_value = 6000
-        
-        calculator = PlanCalculator(
-            federal=create_mock_federal(),
-            state=create_mock_state(),
-            espp=mock_espp,
-            social_security=create_mock_social_security(),
-            medicare=create_mock_medicare(),
-            rsu_calculator=create_mock_rsu_calculator()
-        )
+        from calc.plan_calculator import PlanCalculator
         
-        spec = create_basic_spec()
-        spec['income']['esppIncome'] = 3500  # Explicit first year value
+        espp = replace(plan_dependencies['espp'], taxable=6000)
+        calculator = PlanCalculator(**{**plan_dependencies, 'espp': espp})
+        
+        spec = spec_with(
+            income={
+                **_BASIC_SPEC['income'],
+                'esppIncome': 3500,  # Explicit first year value
+            },
+        )
         
         result = calculator.calculate(spec)
         
@@ -628,24 +480,15 @@ class TestEsppIncome:
         # Second year should use calculated value
         assert result.yearly_data[2027].espp_income == 6000
     
-    def test_espp_income_calculated_when_not_in_spec(self):
+    def test_espp_income_calculated_when_not_in_spec(self, basic_spec, plan_dependencies):
         """Test that ESPP income is calculated when not in spec."""
-        mock_espp = create_mock_espp()
-        mock_espp.taxable_from_spec.return_value = 5000
-        
-        calculator = PlanCalculator(
-            federal=create_mock_federal(),
-            state=create_mock_state(),
-            espp=mock_espp,
-            social_security=create_mock_social_security(),
-            medicare=create_mock_medicare(),
-            rsu_calculator=create_mock_rsu_calculator()
-        )
+        from calc.plan_calculator import PlanCalculator
         
-        spec = create_basic_spec()
-        # Don't set esppIncome - should use calculated value
+        espp = replace(plan_dependencies['espp'], taxable=5000)
+        calculator = PlanCalculator(**{**plan_dependencies, 'espp': espp})
         
-        result = calculator.calculate(spec)
+        # basic_spec has no esppIncome - should use calculated value
+        result = calculator.calculate(basic_spec)
         
         assert result.yearly_data[2026].espp_income == 5000
 
@@ -653,191 +496,210 @@ class TestEsppIncome:
 class TestCapitalGains:
     """Test capital gains calculations."""
     
-    @pytest.fixture
-    def calculator(self):
-        return PlanCalculator(
-            federal=create_mock_federal(),
-            state=create_mock_state(),
-            espp=create_mock_espp(),
-            social_security=create_mock_social_security(),
-            medicare=create_mock_medicare(),
-            rsu_calculator=create_mock_rsu_calculator()
-        )
-    
-    def test_capital_gains_based_on_taxable_balance(self, calculator):
-        """Test that capital gains are calculated from taxable balance."""
-        spec = create_basic_spec()
-        result = calculator.calculate(spec)
-        
-        first_year = result.yearly_data[2026]
-        taxable_balance = spec['investments']['taxableBalance']
-        stcg_percent = spec['income']['realizedShortTermCapitalGainsPercent']
-        ltcg_percent = spec['income']['realizedLongTermCapitalGainsPercent']
-        
-        expected_stcg = taxable_balance * stcg_percent
-        expected_ltcg = taxable_balance * ltcg_percent
-        
-        assert abs(first_year.short_term_capital_gains - expected_stcg) < 0.01
-        assert abs(first_year.long_term_capital_gains - expected_ltcg) < 0.01
-    
-    def test_capital_gains_grow_with_balance(self, calculator):
+    def test_capital_gains_grow_with_balance(self, default_result):
         """Test that capital gains grow as balance appreciates."""
-        spec = create_basic_spec()
-        result = calculator.calculate(spec)
-        
-        y1 = result.yearly_data[2026]
-        y2 = result.yearly_data[2027]
+        y1 = default_result.yearly_data[2026]
+        y2 = default_result.yearly_data[2027]
         
         # Second year should have higher capital gains due to balance growth
         assert y2.short_term_capital_gains > y1.short_term_capital_gains
         assert y2.long_term_capital_gains > y1.long_term_capital_gains
 
 
+APPRECIATION_FIELDS = [
+    "appreciation_ira",
+    "appreciation_deferred_comp",
+    "appreciation_hsa",
+    "appreciation_taxable",
+    "total_appreciation",
+]
+
+
+def _prior_balance_growth(balance_field, section, rate_key):
+    """Expected appreciation: last year's balance times the spec's rate."""
+    def expected(spec, yearly_data, year):
+        return getattr(yearly_data[year - 1], balance_field) * spec[section][rate_key]
+    return expected
+
+
+# (year, field, expected) where expected is a constant or a callable taking
+# (spec, yearly_data, year)
+EARLY_YEAR_VALUES = [
+    pytest.param(2026, "base_deferral",
+                 lambda spec, yd, year: spec['income']['baseSalary'] * spec['income']['baseDeferralFraction'],
+                 id="base_deferral"),
+    pytest.param(2026, "bonus_deferral",
+                 lambda spec, yd, year: (spec['income']['baseSalary'] * spec['income']['bonusFraction'] *
+                                         spec['income']['bonusDeferralFraction']),
+                 id="bonus_deferral"),
+    pytest.param(2026, "total_deferral",
+                 lambda spec, yd, year: yd[year].base_deferral + yd[year].bonus_deferral,
+                 id="total_deferral"),
+    pytest.param(2026, "total_401k_contribution",
+                 lambda spec, yd, year: yd[year].employee_401k_contribution + yd[year].employer_401k_match,
+                 id="total_401k_contribution"),
+    pytest.param(2026, "short_term_capital_gains",
+                 lambda spec, yd, year: (spec['investments']['taxableBalance'] *
+                                         spec['income']['realizedShortTermCapitalGainsPercent']),
+                 id="short_term_capital_gains"),
+    pytest.param(2026, "long_term_capital_gains",
+                 lambda spec, yd, year: (spec['investments']['taxableBalance'] *
+                                         spec['income']['realizedLongTermCapitalGainsPercent']),
+                 id="long_term_capital_gains"),
+    # No prior balance to appreciate in the first year
+    *[pytest.param(2026, field, 0, id=f"first_year_{field}") for field in APPRECIATION_FIELDS],
+    pytest.param(2027, "appreciation_taxable",
+                 _prior_balance_growth("balance_taxable", "investments", "taxableAppreciationRate"),
+                 id="appreciation_taxable_rate"),
+    pytest.param(2027, "appreciation_ira",
+                 _prior_balance_growth("balance_ira", "investments", "taxDeferredAppreciationRate"),
+                 id="appreciation_ira_rate"),
+    pytest.param(2027, "appreciation_hsa",
+                 _prior_balance_growth("balance_hsa", "investments", "hsaAppreciationRate"),
+                 id="appreciation_hsa_rate"),
+    pytest.param(2027, "appreciation_deferred_comp",
+                 _prior_balance_growth("balance_deferred_comp", "deferredCompensationPlan", "annualGrowthFraction"),
+                 id="appreciation_deferred_comp_rate"),
+]
+
+# (year, field) pairs that must be positive in the default plan
+EARLY_YEAR_POSITIVE = [
+    # Income components
+    (2026, "base_salary"),
+    (2026, "bonus"),
+    (2026, "gross_income"),
+    # 401k and HSA contributions
+    (2026, "employee_401k_contribution"),
+    (2026, "employer_401k_match"),
+    (2026, "hsa_contribution"),
+    # FICA taxes
+    (2026, "social_security_tax"),
+    (2026, "medicare_tax"),
+    (2026, "total_fica"),
+    # Every account appreciates after the first year
+    *[(2027, field) for field in APPRECIATION_FIELDS],
+]
+
+
+class TestEarlyYearInvariants:
+    """Data-driven checks on the first two years of the default plan."""
+    
+    @pytest.mark.parametrize("year, field, expected", EARLY_YEAR_VALUES)
+    def test_yearly_value(self, basic_spec, default_result, year, field, expected):
+        """Test that a yearly field matches its value derived from the spec."""
+        yearly_data = default_result.yearly_data
+        if callable(expected):
+            expected = expected(basic_spec, yearly_data, year)
+        
+        assert getattr(yearly_data[year], field) == pytest.approx(expected, abs=0.01)
+    
+    @pytest.mark.parametrize("year, field", EARLY_YEAR_POSITIVE,
+                             ids=[f"{year}_{field}" for year, field in EARLY_YEAR_POSITIVE])
+    def test_yearly_value_positive(self, default_result, year, field):
+        """Test that a yearly field is populated with a positive amount."""
+        assert getattr(default_result.yearly_data[year], field) > 0
+
+
+def _check_total_is_sum(spec, yearly_data):
+    """total_appreciation is the sum of the per-account components."""
+    components_sum = {
+        year: data.appreciation_ira + data.appreciation_deferred_comp + data.appreciation_hsa + data.appreciation_taxable
+        for year, data in yearly_data.items()
+    }
+    totals = {year: data.total_appreciation for year, data in yearly_data.items()}
+    assert totals == pytest.approx(components_sum, abs=0.01)
+
+
+def _check_grows_over_time(spec, yearly_data):
+    """Appreciation amounts grow as balances grow."""
+    y2 = yearly_data[2027]
+    y3 = yearly_data[2028]
+    
+    # Later years should have more appreciation due to larger balances
+    assert y3.appreciation_ira > y2.appreciation_ira
+    assert y3.appreciation_hsa > y2.appreciation_hsa
+    assert y3.total_appreciation > y2.total_appreciation
+
+
+def _check_first_retirement_year(spec, yearly_data):
+    """The first retirement year captures appreciation on every account."""
+    retirement_data = yearly_data[spec['lastWorkingYear'] + 1]
+    
+    assert retirement_data.appreciation_deferred_comp > 0
+    assert retirement_data.appreciation_ira > 0
+    assert retirement_data.appreciation_hsa > 0
+    assert retirement_data.appreciation_taxable > 0
+
+
+def _check_first_retirement_deferred_comp_value(spec, yearly_data):
+    """First retirement year deferred comp appreciation uses the prior balance."""
+    last_working = spec['lastWorkingYear']
+    deferred_rate = spec['deferredCompensationPlan']['annualGrowthFraction']
+    expected_appreciation = yearly_data[last_working].balance_deferred_comp * deferred_rate
+    
+    assert yearly_data[last_working + 1].appreciation_deferred_comp == pytest.approx(expected_appreciation, abs=0.01)
+
+
+def _check_retirement_years(spec, yearly_data):
+    """Retirement years after the first continue to appreciate."""
+    first_retirement = spec['lastWorkingYear'] + 1
+    second_retirement = first_retirement + 1
+    
+    if second_retirement <= spec['lastPlanningYear']:
+        data = yearly_data[second_retirement]
+        
+        assert data.appreciation_ira > 0
+        assert data.appreciation_hsa > 0
+        assert data.appreciation_taxable > 0
+        # Deferred comp should have appreciation if there's still balance
+        if data.balance_deferred_comp > 0 or yearly_data[first_retirement].balance_deferred_comp > 0:
+            assert data.appreciation_deferred_comp > 0
+
+
+def _check_accumulates_correctly(spec, yearly_data):
+    """Balance growth matches appreciation plus contributions."""
+    y1 = yearly_data[2026]
+    y2 = yearly_data[2027]
+    
+    # IRA balance growth should be appreciation + contributions
+    expected_ira_balance = y1.balance_ira + y2.appreciation_ira + y2.total_401k_contribution
+    assert y2.balance_ira == pytest.approx(expected_ira_balance, abs=0.01)
+    
+    # HSA balance growth should be appreciation + contributions - withdrawal
+    expected_hsa_balance = y1.balance_hsa + y2.appreciation_hsa + y2.hsa_contribution - y2.hsa_withdrawal
+    assert y2.balance_hsa == pytest.approx(expected_hsa_balance, abs=0.01)
+    
+    # Deferred comp balance growth should be appreciation + contributions
+    expected_deferred_balance = (y1.balance_deferred_comp + y2.appreciation_deferred_comp + 
+                                 y2.deferred_comp_contribution)
+    assert y2.balance_deferred_comp == pytest.approx(expected_deferred_balance, abs=0.01)
+
+
+# Appreciation invariants of the default plan, each taking (spec, yearly_data)
+APPRECIATION_INVARIANTS = [
+    _check_total_is_sum,
+    _check_grows_over_time,
+    _check_first_retirement_year,
+    _check_first_retirement_deferred_comp_value,
+    _check_retirement_years,
+    _check_accumulates_correctly,
+]
+
+
 class TestAccountAppreciation:
     """Test appreciation tracking for all account types."""
     
-    @pytest.fixture
-    def calculator(self):
-        return PlanCalculator(
-            federal=create_mock_federal(),
-            state=create_mock_state(),
-            espp=create_mock_espp(),
-            social_security=create_mock_social_security(),
-            medicare=create_mock_medicare(),
-            rsu_calculator=create_mock_rsu_calculator()
-        )
-    
-    def test_first_year_has_zero_appreciation(self, calculator):
-        """Test that first year has zero appreciation (no prior balance to appreciate)."""
-        spec = create_basic_spec()
-        result = calculator.calculate(spec)
-        
-        first_year = result.yearly_data[2026]
-        
-        assert first_year.appreciation_ira == 0
-        assert first_year.appreciation_deferred_comp == 0
-        assert first_year.appreciation_hsa == 0
-        assert first_year.appreciation_taxable == 0
-        assert first_year.total_appreciation == 0
-    
-    def test_working_years_have_appreciation(self, calculator):
-        """Test that working years (after first) have appreciation."""
-        spec = create_basic_spec()
-        result = calculator.calculate(spec)
-        
-        second_year = result.yearly_data[2027]
-        
-        # All accounts should have appreciation
-        assert second_year.appreciation_ira > 0
-        assert second_year.appreciation_deferred_comp > 0
-        assert second_year.appreciation_hsa > 0
-        assert second_year.appreciation_taxable > 0
-        assert second_year.total_appreciation > 0
-    
-    def test_appreciation_matches_rates(self, calculator):
-        """Test that appreciation is calculated using correct rates."""
-        spec = create_basic_spec()
-        result = calculator.calculate(spec)
-        
-        y1 = result.yearly_data[2026]
-        y2 = result.yearly_data[2027]
-        
-        taxable_rate = spec['investments']['taxableAppreciationRate']
-        ira_rate = spec['investments']['taxDeferredAppreciationRate']
-        hsa_rate = spec['investments']['hsaAppreciationRate']
-        deferred_rate = spec['deferredCompensationPlan']['annualGrowthFraction']
-        
-        # Appreciation should be prior balance * rate
-        expected_taxable = y1.balance_taxable * taxable_rate
-        expected_ira = y1.balance_ira * ira_rate
-        expected_hsa = y1.balance_hsa * hsa_rate
-        expected_deferred = y1.balance_deferred_comp * deferred_rate
-        
-        assert abs(y2.appreciation_taxable - expected_taxable) < 0.01
-        assert abs(y2.appreciation_ira - expected_ira) < 0.01
-        assert abs(y2.appreciation_hsa - expected_hsa) < 0.01
-        assert abs(y2.appreciation_deferred_comp - expected_deferred) < 0.01
-    
-    def test_total_appreciation_is_sum(self, calculator):
-        """Test that total_appreciation is sum of all components."""
-        spec = create_basic_spec()
-        result = calculator.calculate(spec)
-        
-        for year, data in result.yearly_data.items():
-            expected_total = (data.appreciation_ira + data.appreciation_deferred_comp + 
-                            data.appreciation_hsa + data.appreciation_taxable)
-            assert abs(data.total_appreciation - expected_total) < 0.01, f"Year {year} total mismatch"
-    
-    def test_appreciation_grows_over_time(self, calculator):
-        """Test that appreciation amounts grow as balances grow."""
-        spec = create_basic_spec()
-        result = calculator.calculate(spec)
-        
-        y2 = result.yearly_data[2027]
-        y3 = result.yearly_data[2028]
-        
-        # Later years should have more appreciation due to larger balances
-        assert y3.appreciation_ira > y2.appreciation_ira
-        assert y3.appreciation_hsa > y2.appreciation_hsa
-        assert y3.total_appreciation > y2.total_appreciation
-    
-    def test_first_retirement_year_has_deferred_comp_appreciation(self, calculator):
-        """Test that first retirement year captures deferred comp appreciation."""
-        spec = create_basic_spec()
-        result = calculator.calculate(spec)
-        
-        last_working = spec['lastWorkingYear']
-        first_retirement = last_working + 1
-        
-        retirement_data = result.yearly_data[first_retirement]
-        
-        # First retirement year should have deferred comp appreciation
-        assert retirement_data.appreciation_deferred_comp > 0
-        # All other accounts should also have appreciation
-        assert retirement_data.appreciation_ira > 0
-        assert retirement_data.appreciation_hsa > 0
-        assert retirement_data.appreciation_taxable > 0
-    
-    def test_first_retirement_year_deferred_comp_appreciation_value(self, calculator):
-        """Test that first retirement year deferred comp appreciation is correct."""
-        spec = create_basic_spec()
-        result = calculator.calculate(spec)
-        
-        last_working = spec['lastWorkingYear']
-        first_retirement = last_working + 1
-        
-        last_working_data = result.yearly_data[last_working]
-        first_retirement_data = result.yearly_data[first_retirement]
-        
-        deferred_rate = spec['deferredCompensationPlan']['annualGrowthFraction']
-        expected_appreciation = last_working_data.balance_deferred_comp * deferred_rate
-        
-        assert abs(first_retirement_data.appreciation_deferred_comp - expected_appreciation) < 0.01
+    @pytest.mark.parametrize("check", APPRECIATION_INVARIANTS,
+                             ids=[check.__name__.removeprefix("_check_") for check in APPRECIATION_INVARIANTS])
+    def test_appreciation_invariant(self, basic_spec, default_result, check):
+        """Test an appreciation invariant against the shared default plan."""
+        check(basic_spec, default_result.yearly_data)
     
-    def test_retirement_years_have_appreciation(self, calculator):
-        """Test that retirement years continue to have appreciation."""
-        spec = create_basic_spec()
-        result = calculator.calculate(spec)
-        
-        first_retirement = spec['lastWorkingYear'] + 1
-        second_retirement = first_retirement + 1
-        
-        if second_retirement <= spec['lastPlanningYear']:
-            data = result.yearly_data[second_retirement]
-            
-            # All accounts should have appreciation
-            assert data.appreciation_ira > 0
-            assert data.appreciation_hsa > 0
-            assert data.appreciation_taxable > 0
-            # Deferred comp should have appreciation if there's still balance
-            if data.balance_deferred_comp > 0 or result.yearly_data[first_retirement].balance_deferred_comp > 0:
-                assert data.appreciation_deferred_comp > 0
-    
-    def test_post_withdrawal_years_have_zero_deferred_appreciation(self, calculator):
+    @pytest.mark.slow
+    def test_post_withdrawal_years_have_zero_deferred_appreciation(self, extended_result):
         """Test that post-withdrawal years have zero deferred comp appreciation."""
-        spec = create_basic_spec()
-        spec['lastPlanningYear'] = 2050  # Extend to have post-withdrawal years
-        result = calculator.calculate(spec)
+        spec = create_extended_spec()
+        result = extended_result
         
         disbursement_years = spec['deferredCompensationPlan']['disbursementYears']
         first_retirement = spec['lastWorkingYear'] + 1
@@ -853,16 +715,23 @@ class TestAccountAppreciation:
             assert data.appreciation_hsa > 0
             assert data.appreciation_taxable > 0
     
-    def test_no_appreciation_with_zero_balances(self, calculator):
+    def test_no_appreciation_with_zero_balances(self, cached_calculate):
         """Test that appreciation is zero when starting with zero balances."""
-        spec = create_basic_spec()
-        spec['investments']['taxableBalance'] = 0
-        spec['investments']['taxDeferredBalance'] = 0
-        spec['investments']['hsaBalance'] = 0
-        spec['income']['baseDeferralFraction'] = 0
-        spec['income']['bonusDeferralFraction'] = 0
+        spec = spec_with(
+            investments={
+                **_BASIC_SPEC['investments'],
+                'taxableBalance': 0,
+                'taxDeferredBalance': 0,
+                'hsaBalance': 0,
+            },
+            income={
+                **_BASIC_SPEC['income'],
+                'baseDeferralFraction': 0,
+                'bonusDeferralFraction': 0,
+            },
+        )
         
-        result = calculator.calculate(spec)
+        result = cached_calculate(spec)
         
         # First year should have zero appreciation
         first_year = result.yearly_data[2026]
@@ -870,102 +739,68 @@ class TestAccountAppreciation:
         assert first_year.appreciation_hsa == 0
         assert first_year.appreciation_taxable == 0
         assert first_year.appreciation_deferred_comp == 0
-    
-    def test_appreciation_accumulates_correctly(self, calculator):
-        """Test that balance growth matches appreciation + contributions."""
-        spec = create_basic_spec()
-        result = calculator.calculate(spec)
-        
-        y1 = result.yearly_data[2026]
-        y2 = result.yearly_data[2027]
-        
-        # IRA balance growth should be appreciation + contributions
-        expected_ira_balance = y1.balance_ira + y2.appreciation_ira + y2.total_401k_contribution
-        assert abs(y2.balance_ira - expected_ira_balance) < 0.01
-        
-        # HSA balance growth should be appreciation + contributions - withdrawal
-        expected_hsa_balance = y1.balance_hsa + y2.appreciation_hsa + y2.hsa_contribution - y2.hsa_withdrawal
-        assert abs(y2.balance_hsa - expected_hsa_balance) < 0.01
-        
-        # Deferred comp balance growth should be appreciation + contributions
-        expected_deferred_balance = (y1.balance_deferred_comp + y2.appreciation_deferred_comp + 
-                                     y2.deferred_comp_contribution)
-        assert abs(y2.balance_deferred_comp - expected_deferred_balance) < 0.01
 
 
 class TestHSAWithdrawals:
     """Tests for HSA withdrawal functionality."""
     
-    @pytest.fixture
-    def calculator(self):
-        """Create a PlanCalculator with mock dependencies."""
-        return PlanCalculator(
-            federal=create_mock_federal(),
-            state=create_mock_state(),
-            espp=create_mock_espp(),
-            social_security=create_mock_social_security(),
-            medicare=create_mock_medicare(),
-            rsu_calculator=create_mock_rsu_calculator()
-        )
-    
-    def test_hsa_withdrawal_subtracts_from_balance(self, calculator):
+    def test_hsa_withdrawal_subtracts_from_balance(self, cached_calculate):
         """Test that HSA withdrawals reduce the HSA balance."""
-        spec = create_basic_spec()
-        spec['investments'] = {
-            'hsaBalance': 50000.0,
-            'hsaAppreciationRate': 0.07,
-            'hsaEmployerContribution': 1500.0,
-            'hsaAnnualWithdrawal': 3000.0,
-            'hsaWithdrawalInflationRate': 0.04
-        }
+        spec = spec_with(
+            investments={
+                'hsaBalance': 50000.0,
+                'hsaAppreciationRate': 0.07,
+                'hsaEmployerContribution': 1500.0,
+                'hsaAnnualWithdrawal': 3000.0,
+                'hsaWithdrawalInflationRate': 0.04
+            },
+        )
         
-        result = calculator.calculate(spec)
+        result = cached_calculate(spec)
         
         # First year should have withdrawal of 3000
         first_year = result.yearly_data[2026]
         assert first_year.hsa_withdrawal == 3000.0
         
         # Balance should reflect: initial + contribution + appreciation - withdrawal
-        # HSA contribution from deductions mock is 8000 (employee) + 1500 (employer) = 9500
-        # But the actual value depends on what the mock returns
+        # HSA contribution from deductions fake is 8000 (employee) + 1500 (employer) = 9500
+        # But the actual value depends on what the fake returns
         assert first_year.hsa_withdrawal <= first_year.balance_hsa + first_year.hsa_withdrawal
     
-    def test_hsa_withdrawal_inflates_over_time(self, calculator):
+    def test_hsa_withdrawal_inflates_over_time(self, cached_calculate):
         """Test that HSA withdrawal amount increases with inflation."""
-        spec = create_basic_spec()
-        spec['investments'] = {
-            'hsaBalance': 100000.0,
-            'hsaAppreciationRate': 0.07,
-            'hsaEmployerContribution': 0,
-            'hsaAnnualWithdrawal': 5000.0,
-            'hsaWithdrawalInflationRate': 0.05  # 5% inflation
-        }
-        
-        result = calculator.calculate(spec)
+        spec = spec_with(
+            investments={
+                'hsaBalance': 100000.0,
+                'hsaAppreciationRate': 0.07,
+                'hsaEmployerContribution': 0,
+                'hsaAnnualWithdrawal': 5000.0,
+                'hsaWithdrawalInflationRate': 0.05  # 5% inflation
+            },
+        )
         
-        y1 = result.yearly_data[2026]
-        y2 = result.yearly_data[2027]
-        y3 = result.yearly_data[2028]
+        result = cached_calculate(spec)
         
-        # Withdrawals should increase by 5% each year
-        assert y1.hsa_withdrawal == 5000.0
-        assert abs(y2.hsa_withdrawal - 5250.0) < 0.01  # 5000 * 1.05
-        assert abs(y3.hsa_withdrawal - 5512.50) < 0.01  # 5000 * 1.05^2
+        # Withdrawals should increase by 5% each year: 5000, 5000 * 1.05, 5000 * 1.05^2
+        yearly_data = result.yearly_data
+        withdrawals = [yearly_data[year].hsa_withdrawal for year in (2026, 2027, 2028)]
+        assert withdrawals == pytest.approx([5000.0, 5250.0, 5512.50], abs=0.01)
     
-    def test_hsa_withdrawal_capped_at_balance(self, calculator):
+    def test_hsa_withdrawal_capped_at_balance(self, cached_calculate):
         """Test that HSA withdrawal cannot exceed the available balance."""
-        spec = create_basic_spec()
-        spec['investments'] = {
-            'hsaBalance': 1000.0,  # Small starting balance
-            'hsaAppreciationRate': 0.0,  # No growth
-            'hsaEmployerContribution': 0,
-            'hsaAnnualWithdrawal': 50000.0,  # Try to withdraw more than balance
-            'hsaWithdrawalInflationRate': 0.0
-        }
-        # Disable HSA contributions
-        spec['deductions'] = {'medicalDentalVision': 0}
+        spec = spec_with(
+            investments={
+                'hsaBalance': 1000.0,  # Small starting balance
+                'hsaAppreciationRate': 0.0,  # No growth
+                'hsaEmployerContribution': 0,
+                'hsaAnnualWithdrawal': 50000.0,  # Try to withdraw more than balance
+                'hsaWithdrawalInflationRate': 0.0
+            },
+            # Disable HSA contributions
+            deductions={'medicalDentalVision': 0},
+        )
         
-        result = calculator.calculate(spec)
+        result = cached_calculate(spec)
         
         first_year = result.yearly_data[2026]
         # Withdrawal should be capped at balance (initial + any contributions)
@@ -973,35 +808,36 @@ class TestHSAWithdrawals:
         # Balance should be non-negative after withdrawal
         assert first_year.balance_hsa >= 0
     
-    def test_hsa_withdrawal_zero_by_default(self, calculator):
+    def test_hsa_withdrawal_zero_by_default(self, cached_calculate):
         """Test that HSA withdrawal is zero when not specified."""
-        spec = create_basic_spec()
-        spec['investments'] = {
-            'hsaBalance': 50000.0,
-            'hsaAppreciationRate': 0.07
-            # No hsaAnnualWithdrawal specified
-        }
+        spec = spec_with(
+            investments={
+                'hsaBalance': 50000.0,
+                'hsaAppreciationRate': 0.07
+                # No hsaAnnualWithdrawal specified
+            },
+        )
         
-        result = calculator.calculate(spec)
+        result = cached_calculate(spec)
         
         first_year = result.yearly_data[2026]
         assert first_year.hsa_withdrawal == 0.0
     
-    def test_hsa_withdrawal_continues_in_retirement(self, calculator):
+    def test_hsa_withdrawal_continues_in_retirement(self, cached_calculate):
         """Test that HSA withdrawals continue during retirement years."""
-        spec = create_basic_spec()
-        spec['lastWorkingYear'] = 2027  # Retire after 2027
-        spec['lastPlanningYear'] = 2030
-        spec['investments'] = {
-            'hsaBalance': 100000.0,
-            'hsaAppreciationRate': 0.05,
-            'hsaEmployerContribution': 0,
-            'hsaAnnualWithdrawal': 4000.0,
-            'hsaWithdrawalInflationRate': 0.03
-        }
-        
+        spec = spec_with(
+            lastWorkingYear=2027,  # Retire after 2027
+            lastPlanningYear=2030,
+            investments={
+                'hsaBalance': 100000.0,
+                'hsaAppreciationRate': 0.05,
+                'hsaEmployerContribution': 0,
+                'hsaAnnualWithdrawal': 4000.0,
+                'hsaWithdrawalInflationRate': 0.03
+            },
+        )
         
-        result = calculator.calculate(spec)
+        result = cached_calculate(spec)
         
         # Check working years
         assert result.yearly_data[2026].hsa_withdrawal == 4000.0
@@ -1014,99 +850,94 @@ class TestHSAWithdrawals:
         assert y2028.hsa_withdrawal > 0
         
         # All retirement years should have withdrawals
+        yearly_data = result.yearly_data
         for year in [2028, 2029, 2030]:
-            yd = result.yearly_data[year]
+            yd = yearly_data[year]
             assert yd.hsa_withdrawal > 0
 
 
 class TestHSAContributionsInRetirement:
     """Tests for HSA contribution functionality during early retirement (before Medicare)."""
     
-    @pytest.fixture
-    def calculator(self):
-        """Create a PlanCalculator with mock dependencies."""
-        return PlanCalculator(
-            federal=create_mock_federal(),
-            state=create_mock_state(),
-            espp=create_mock_espp(),
-            social_security=create_mock_social_security(),
-            medicare=create_mock_medicare(),
-            rsu_calculator=create_mock_rsu_calculator()
-        )
-    
-    def test_hsa_contributions_continue_before_medicare(self, calculator):
+    def test_hsa_contributions_continue_before_medicare(self, cached_calculate):
         """Test that HSA contributions continue in retirement before Medicare eligibility."""
-        spec = create_basic_spec()
-        spec['birthYear'] = 1970  # Medicare eligibility at 2035 (1970 + 65)
-        spec['lastWorkingYear'] = 2030
-        spec['lastPlanningYear'] = 2040
-        spec['investments'] = {
-            'hsaBalance': 50000.0,
-            'hsaAppreciationRate': 0.07,
-            'hsaEmployerContribution': 1500.0
-        }
+        spec = spec_with(
+            birthYear=1970,  # Medicare eligibility at 2035 (1970 + 65)
+            lastWorkingYear=2030,
+            lastPlanningYear=2040,
+            investments={
+                'hsaBalance': 50000.0,
+                'hsaAppreciationRate': 0.07,
+                'hsaEmployerContribution': 1500.0
+            },
+        )
         
-        result = calculator.calculate(spec)
+        result = cached_calculate(spec)
         
         # Retirement years before Medicare (2031-2034) should have HSA contributions
+        yearly_data = result.yearly_data
         for year in [2031, 2032, 2033, 2034]:
-            yd = result.yearly_data[year]
+            yd = yearly_data[year]
             assert yd.is_working_year == False
             assert yd.hsa_contribution > 0, f"Year {year} should have HSA contribution"
             assert yd.employee_hsa > 0, f"Year {year} should have employee HSA"
     
-    def test_hsa_contributions_stop_at_medicare(self, calculator):
+    def test_hsa_contributions_stop_at_medicare(self, cached_calculate):
         """Test that HSA contributions stop at Medicare eligibility (age 65)."""
-        spec = create_basic_spec()
-        spec['birthYear'] = 1970  # Medicare eligibility at 2035 (1970 + 65)
-        spec['lastWorkingYear'] = 2030
-        spec['lastPlanningYear'] = 2040
-        spec['investments'] = {
-            'hsaBalance': 50000.0,
-            'hsaAppreciationRate': 0.07,
-            'hsaEmployerContribution': 1500.0
-        }
+        spec = spec_with(
+            birthYear=1970,  # Medicare eligibility at 2035 (1970 + 65)
+            lastWorkingYear=2030,
+            lastPlanningYear=2040,
+            investments={
+                'hsaBalance': 50000.0,
+                'hsaAppreciationRate': 0.07,
+                'hsaEmployerContribution': 1500.0
+            },
+        )
         
-        result = calculator.calculate(spec)
+        result = cached_calculate(spec)
         
         # Medicare eligibility year and after should have no HSA contributions
+        yearly_data = result.yearly_data
         for year in [2035, 2036, 2037, 2038, 2039, 2040]:
-            yd = result.yearly_data[year]
+            yd = yearly_data[year]
             assert yd.hsa_contribution == 0, f"Year {year} should not have HSA contribution (Medicare eligible)"
     
-    def test_hsa_contribution_deducted_from_cash_flow(self, calculator):
+    def test_hsa_contribution_deducted_from_cash_flow(self, cached_calculate):
         """Test that HSA contribution is deducted from taxable account adjustment."""
-        spec = create_basic_spec()
-        spec['birthYear'] = 1970  # Medicare eligibility at 2035
-        spec['lastWorkingYear'] = 2030
-        spec['lastPlanningYear'] = 2036
-        spec['investments'] = {
-            'hsaBalance': 50000.0,
-            'hsaAppreciationRate': 0.07,
-            'hsaEmployerContribution': 1500.0
-        }
+        spec = spec_with(
+            birthYear=1970,  # Medicare eligibility at 2035
+            lastWorkingYear=2030,
+            lastPlanningYear=2036,
+            investments={
+                'hsaBalance': 50000.0,
+                'hsaAppreciationRate': 0.07,
+                'hsaEmployerContribution': 1500.0
+            },
+        )
         
-        result = calculator.calculate(spec)
+        result = cached_calculate(spec)
         
         # In retirement before Medicare, taxable adjustment should account for HSA contribution
         y = result.yearly_data[2031]
         expected_adjustment = y.income_expense_difference - y.hsa_contribution
-        assert abs(y.taxable_account_adjustment - expected_adjustment) < 0.01
+        assert y.taxable_account_adjustment == pytest.approx(expected_adjustment, abs=0.01)
     
-    def test_hsa_contribution_increases_hsa_balance(self, calculator):
+    def test_hsa_contribution_increases_hsa_balance(self, cached_calculate):
         """Test that HSA contributions increase the HSA balance in retirement."""
-        spec = create_basic_spec()
-        spec['birthYear'] = 1970  # Medicare eligibility at 2035
-        spec['lastWorkingYear'] = 2030
-        spec['lastPlanningYear'] = 2036
-        spec['investments'] = {
-            'hsaBalance': 50000.0,
-            'hsaAppreciationRate': 0.0,  # No appreciation for simpler test
-            'hsaEmployerContribution': 1500.0,
-            'hsaAnnualWithdrawal': 0  # No withdrawals for simpler test
-        }
+        spec = spec_with(
+            birthYear=1970,  # Medicare eligibility at 2035
+            lastWorkingYear=2030,
+            lastPlanningYear=2036,
+            investments={
+                'hsaBalance': 50000.0,
+                'hsaAppreciationRate': 0.0,  # No appreciation for simpler test
+                'hsaEmployerContribution': 1500.0,
+                'hsaAnnualWithdrawal': 0  # No withdrawals for simpler test
+            },
+        )
         
-        result = calculator.calculate(spec)
+        result = cached_calculate(spec)
         
         # HSA balance should increase by contribution amount (minus any withdrawals)
         y2030 = result.yearly_data[2030]  # Last working year
@@ -1114,251 +945,207 @@ class TestHSAContributionsInRetirement:
         
         # Balance should increase due to contribution
         expected_balance = y2030.balance_hsa + y2031.hsa_contribution
-        assert abs(y2031.balance_hsa - expected_balance) < 0.01
+        assert y2031.balance_hsa == pytest.approx(expected_balance, abs=0.01)
     
-    def test_no_employer_hsa_in_retirement(self, calculator):
+    def test_no_employer_hsa_in_retirement(self, cached_calculate):
         """Test that there is no employer HSA contribution in retirement."""
-        spec = create_basic_spec()
-        spec['birthYear'] = 1970
-        spec['lastWorkingYear'] = 2030
-        spec['lastPlanningYear'] = 2035
-        spec['investments'] = {
-            'hsaBalance': 50000.0,
-            'hsaAppreciationRate': 0.07,
-            'hsaEmployerContribution': 1500.0
-        }
+        spec = spec_with(
+            birthYear=1970,
+            lastWorkingYear=2030,
+            lastPlanningYear=2035,
+            investments={
+                'hsaBalance': 50000.0,
+                'hsaAppreciationRate': 0.07,
+                'hsaEmployerContribution': 1500.0
+            },
+        )
         
-        result = calculator.calculate(spec)
+        result = cached_calculate(spec)
         
         # Retirement years should have no employer HSA contribution
+        yearly_data = result.yearly_data
         for year in [2031, 2032, 2033, 2034]:
-            yd = result.yearly_data[year]
+            yd = yearly_data[year]
             assert yd.employer_hsa == 0, f"Year {year} should have no employer HSA"
             # But employee HSA should equal the full contribution
             assert yd.hsa_contribution == yd.employee_hsa
 
 
+@pytest.fixture(scope="module")
+def medicare_doubling_result(cached_calculate):
+    """Plan whose HSA withdrawal inflates 5% a year and doubles at Medicare.
+    
+    The HSA is large and does not appreciate, so withdrawals are never capped.
+    """
+    spec = spec_with(
+        birthYear=1970,  # Medicare eligibility at 2035 (1970 + 65)
+        lastWorkingYear=2030,
+        lastPlanningYear=2040,
+        investments={
+            'hsaBalance': 500000.0,  # Large balance to avoid running out
+            'hsaAppreciationRate': 0.0,
+            'hsaAnnualWithdrawal': 10000.0,
+            'hsaWithdrawalInflationRate': 0.05  # 5% inflation
+        },
+    )
+    return cached_calculate(spec)
+
+
 class TestHSAWithdrawalDoubleAtMedicare:
     """Tests for HSA withdrawal doubling at Medicare eligibility."""
     
-    @pytest.fixture
-    def calculator(self):
-        """Create a PlanCalculator with mock dependencies."""
-        return PlanCalculator(
-            federal=create_mock_federal(),
-            state=create_mock_state(),
-            espp=create_mock_espp(),
-            social_security=create_mock_social_security(),
-            medicare=create_mock_medicare(),
-            rsu_calculator=create_mock_rsu_calculator()
-        )
-    
-    def test_hsa_withdrawal_doubles_at_medicare_eligibility(self, calculator):
+    def test_hsa_withdrawal_doubles_at_medicare_eligibility(self, medicare_doubling_result):
         """Test that HSA withdrawal doubles at Medicare eligibility year."""
-        spec = create_basic_spec()
-        spec['birthYear'] = 1970  # Medicare eligibility at 2035 (1970 + 65)
-        spec['lastWorkingYear'] = 2030
-        spec['lastPlanningYear'] = 2040
-        spec['investments'] = {
-            'hsaBalance': 500000.0,  # Large balance to avoid running out
-            'hsaAppreciationRate': 0.0,  # No appreciation for simpler test
-            'hsaAnnualWithdrawal': 10000.0,
-            'hsaWithdrawalInflationRate': 0.0  # No inflation for simpler test
-        }
-        
-        result = calculator.calculate(spec)
-        
-        # Year before Medicare (2034): withdrawal should be 10000
-        y2034 = result.yearly_data[2034]
-        assert y2034.hsa_withdrawal == 10000.0
+        yearly_data = medicare_doubling_result.yearly_data
+        y2034, y2035, y2036 = (yearly_data[year].hsa_withdrawal for year in (2034, 2035, 2036))
         
-        # Medicare eligibility year (2035): withdrawal should double to 20000
-        y2035 = result.yearly_data[2035]
-        assert y2035.hsa_withdrawal == 20000.0
-        
-        # Year after Medicare (2036): withdrawal should continue at doubled amount (20000)
-        y2036 = result.yearly_data[2036]
-        assert y2036.hsa_withdrawal == 20000.0
+        # Medicare eligibility year (2035): one more inflation, then doubled
+        assert y2035 == pytest.approx(y2034 * 1.05 * 2)
+        # Year after Medicare (2036): doubled amount continues, it is not doubled again
+        assert y2036 == pytest.approx(y2035 * 1.05)
     
-    def test_hsa_withdrawal_doubles_and_continues_to_inflate(self, calculator):
+    def test_hsa_withdrawal_doubles_and_continues_to_inflate(self, medicare_doubling_result):
         """Test that HSA withdrawal doubles at Medicare and continues to inflate after."""
-        spec = create_basic_spec()
-        spec['birthYear'] = 1970  # Medicare eligibility at 2035
-        spec['lastWorkingYear'] = 2030
-        spec['lastPlanningYear'] = 2037
-        spec['investments'] = {
-            'hsaBalance': 500000.0,  # Large balance
-            'hsaAppreciationRate': 0.0,
-            'hsaAnnualWithdrawal': 10000.0,
-            'hsaWithdrawalInflationRate': 0.05  # 5% inflation
-        }
-        
-        result = calculator.calculate(spec)
+        result = medicare_doubling_result
         
         # Inflation happens every year after first year (2026 is first year, so inflations start at 2027)
         # Working years: 2027, 2028, 2029, 2030 = 4 inflations
         # Retirement years before Medicare: 2031, 2032, 2033, 2034 = 4 more inflations
         # Total before 2034's withdrawal: 8 inflations
         
-        # Year before Medicare (2034): 8 inflations from 10000
-        y2034 = result.yearly_data[2034]
-        expected_2034 = 10000 * (1.05 ** 8)
-        assert abs(y2034.hsa_withdrawal - expected_2034) < 0.01
-        
-        # Medicare eligibility year (2035): 9 inflations then doubled
-        y2035 = result.yearly_data[2035]
-        expected_2035 = 10000 * (1.05 ** 9) * 2
-        assert abs(y2035.hsa_withdrawal - expected_2035) < 0.01
-        
-        
-        # Year after Medicare (2036): continues to inflate from doubled amount (10 inflations total, doubled)
-        y2036 = result.yearly_data[2036]
-        expected_2036 = 10000 * (1.05 ** 9) * 2 * 1.05
-        assert abs(y2036.hsa_withdrawal - expected_2036) < 0.01
-        
-        # 2037: continues to inflate (11 inflations total from base, doubled at 2035)
-        y2037 = result.yearly_data[2037]
-        expected_2037 = 10000 * (1.05 ** 9) * 2 * (1.05 ** 2)
-        assert abs(y2037.hsa_withdrawal - expected_2037) < 0.01
+        # Base withdrawal after n inflations, shared by every expected value
+        inflated = [10000 * 1.05 ** n for n in range(12)]
+        expected = {
+            # Year before Medicare: 8 inflations from 10000
+            2034: inflated[8],
+            # Medicare eligibility year: 9 inflations then doubled
+            2035: inflated[9] * 2,
+            # After Medicare the doubled amount continues to inflate
+            2036: inflated[10] * 2,
+            2037: inflated[11] * 2,
+        }
+        withdrawals = {year: result.yearly_data[year].hsa_withdrawal for year in expected}
+        assert withdrawals == pytest.approx(expected, abs=0.01)
 
 
 class TestHSAInTotalDeductionsDuringRetirement:
     """Tests for HSA contributions being included in total_deductions during retirement before Medicare."""
     
-    @pytest.fixture
-    def calculator(self):
-        """Create a PlanCalculator with mock dependencies."""
-        return PlanCalculator(
-            federal=create_mock_federal(),
-            state=create_mock_state(),
-            espp=create_mock_espp(),
-            social_security=create_mock_social_security(),
-            medicare=create_mock_medicare(),
-            rsu_calculator=create_mock_rsu_calculator()
-        )
-    
-    def test_total_deductions_includes_hsa_in_disbursement_years(self, calculator):
+    def test_total_deductions_includes_hsa_in_disbursement_years(self, cached_calculate):
         """Test that total_deductions includes HSA contribution during disbursement years before Medicare."""
-        spec = create_basic_spec()
-        spec['birthYear'] = 1970  # Medicare eligibility at 2035 (1970 + 65)
-        spec['lastWorkingYear'] = 2030
-        spec['lastPlanningYear'] = 2040
-        spec['deferredCompensationPlan'] = {
-            'annualGrowthFraction': 0.05,
-            'disbursementYears': 5  # Disbursements from 2031-2035
-        }
-        spec['investments'] = {
-            'hsaBalance': 50000.0,
-            'hsaAppreciationRate': 0.07,
-            'hsaEmployerContribution': 1500.0
-        }
+        spec = spec_with(
+            birthYear=1970,  # Medicare eligibility at 2035 (1970 + 65)
+            lastWorkingYear=2030,
+            lastPlanningYear=2040,
+            deferredCompensationPlan={
+                'annualGrowthFraction': 0.05,
+                'disbursementYears': 5  # Disbursements from 2031-2035
+            },
+            investments={
+                'hsaBalance': 50000.0,
+                'hsaAppreciationRate': 0.07,
+                'hsaEmployerContribution': 1500.0
+            },
+        )
         
-        result = calculator.calculate(spec)
+        result = cached_calculate(spec)
         
-        # Disbursement years before Medicare (2031-2034) should have HSA in total_deductions
-        for year in [2031, 2032, 2033, 2034]:
-            yd = result.yearly_data[year]
-            # Total deductions should equal standard deduction + employee HSA
-            expected_total = yd.standard_deduction + yd.employee_hsa
-            assert abs(yd.total_deductions - expected_total) < 0.01, \
-                f"Year {year}: total_deductions ({yd.total_deductions}) should equal " \
-                f"standard_deduction ({yd.standard_deduction}) + employee_hsa ({yd.employee_hsa})"
+        # Disbursement years before Medicare (2031-2034) should have HSA in total_deductions:
+        # total deductions equal standard deduction + employee HSA
+        years = [result.yearly_data[year] for year in range(2031, 2035)]
+        assert [yd.total_deductions for yd in years] == pytest.approx(
+            [yd.standard_deduction + yd.employee_hsa for yd in years], abs=0.01)
     
-    def test_total_deductions_includes_hsa_in_post_disbursement_years(self, calculator):
+    def test_total_deductions_includes_hsa_in_post_disbursement_years(self, cached_calculate):
         """Test that total_deductions includes HSA contribution in post-disbursement years before Medicare."""
-        spec = create_basic_spec()
-        spec['birthYear'] = 1975  # Medicare eligibility at 2040 (1975 + 65)
-        spec['lastWorkingYear'] = 2028
-        spec['lastPlanningYear'] = 2045
-        spec['deferredCompensationPlan'] = {
-            'annualGrowthFraction': 0.05,
-            'disbursementYears': 5  # Disbursements from 2029-2033
-        }
-        spec['investments'] = {
-            'hsaBalance': 50000.0,
-            'hsaAppreciationRate': 0.07,
-            'hsaEmployerContribution': 1500.0
-        }
+        spec = spec_with(
+            birthYear=1975,  # Medicare eligibility at 2040 (1975 + 65)
+            lastWorkingYear=2028,
+            lastPlanningYear=2045,
+            deferredCompensationPlan={
+                'annualGrowthFraction': 0.05,
+                'disbursementYears': 5  # Disbursements from 2029-2033
+            },
+            investments={
+                'hsaBalance': 50000.0,
+                'hsaAppreciationRate': 0.07,
+                'hsaEmployerContribution': 1500.0
+            },
+        )
         
-        result = calculator.calculate(spec)
+        result = cached_calculate(spec)
         
         # Post-disbursement years before Medicare (2034-2039) should have HSA in total_deductions
-        for year in [2034, 2035, 2036, 2037, 2038, 2039]:
-            yd = result.yearly_data[year]
-            # Verify HSA contribution is happening
-            assert yd.employee_hsa > 0, f"Year {year} should have HSA contribution before Medicare"
-            # Total deductions should equal standard deduction + employee HSA
-            expected_total = yd.standard_deduction + yd.employee_hsa
-            assert abs(yd.total_deductions - expected_total) < 0.01, \
-                f"Year {year}: total_deductions ({yd.total_deductions}) should equal " \
-                f"standard_deduction ({yd.standard_deduction}) + employee_hsa ({yd.employee_hsa})"
+        years = [result.yearly_data[year] for year in range(2034, 2040)]
+        assert all(yd.employee_hsa > 0 for yd in years), "HSA contributions should continue before Medicare"
+        # Total deductions should equal standard deduction + employee HSA
+        assert [yd.total_deductions for yd in years] == pytest.approx(
+            [yd.standard_deduction + yd.employee_hsa for yd in years], abs=0.01)
     
-    def test_total_deductions_excludes_hsa_at_medicare(self, calculator):
+    def test_total_deductions_excludes_hsa_at_medicare(self, cached_calculate):
         """Test that total_deductions excludes HSA contribution at and after Medicare eligibility."""
-        spec = create_basic_spec()
-        spec['birthYear'] = 1970  # Medicare eligibility at 2035 (1970 + 65)
-        spec['lastWorkingYear'] = 2030
-        spec['lastPlanningYear'] = 2040
-        spec['investments'] = {
-            'hsaBalance': 50000.0,
-            'hsaAppreciationRate': 0.07,
-            'hsaEmployerContribution': 1500.0
-        }
+        spec = spec_with(
+            birthYear=1970,  # Medicare eligibility at 2035 (1970 + 65)
+            lastWorkingYear=2030,
+            lastPlanningYear=2040,
+            investments={
+                'hsaBalance': 50000.0,
+                'hsaAppreciationRate': 0.07,
+                'hsaEmployerContribution': 1500.0
+            },
+        )
         
-        result = calculator.calculate(spec)
+        result = cached_calculate(spec)
         
         # At and after Medicare (2035+), HSA contribution should be zero
-        for year in [2035, 2036, 2037, 2038, 2039, 2040]:
-            yd = result.yearly_data[year]
-            assert yd.employee_hsa == 0, f"Year {year} should have no HSA contribution at/after Medicare"
-            assert yd.hsa_contribution == 0, f"Year {year} should have no HSA contribution at/after Medicare"
-            # Total deductions should just be standard deduction
-            assert abs(yd.total_deductions - yd.standard_deduction) < 0.01, \
-                f"Year {year}: total_deductions should equal standard_deduction when no HSA"
+        years = [result.yearly_data[year] for year in range(2035, 2041)]
+        assert [(yd.employee_hsa, yd.hsa_contribution) for yd in years] == [(0, 0)] * len(years)
+        # Total deductions should just be standard deduction
+        assert [yd.total_deductions for yd in years] == pytest.approx(
+            [yd.standard_deduction for yd in years], abs=0.01)
     
-    def test_adjusted_gross_income_reflects_hsa_deduction(self, calculator):
+    def test_adjusted_gross_income_reflects_hsa_deduction(self, cached_calculate):
         """Test that AGI is correctly reduced by HSA contribution in retirement."""
-        spec = create_basic_spec()
-        spec['birthYear'] = 1970  # Medicare eligibility at 2035
-        spec['lastWorkingYear'] = 2030
-        spec['lastPlanningYear'] = 2040
-        spec['deferredCompensationPlan'] = {
-            'annualGrowthFraction': 0.05,
-            'disbursementYears': 5
-        }
-        spec['investments'] = {
-            'hsaBalance': 50000.0,
-            'hsaAppreciationRate': 0.07,
-            'hsaEmployerContribution': 1500.0
-        }
+        spec = spec_with(
+            birthYear=1970,  # Medicare eligibility at 2035
+            lastWorkingYear=2030,
+            lastPlanningYear=2040,
+            deferredCompensationPlan={
+                'annualGrowthFraction': 0.05,
+                'disbursementYears': 5
+            },
+            investments={
+                'hsaBalance': 50000.0,
+                'hsaAppreciationRate': 0.07,
+                'hsaEmployerContribution': 1500.0
+            },
+        )
         
-        result = calculator.calculate(spec)
+        result = cached_calculate(spec)
         
         # In disbursement years before Medicare, AGI should be gross - total_deductions
-        for year in [2031, 2032, 2033, 2034]:
-            yd = result.yearly_data[year]
-            expected_agi = max(0, yd.gross_income - yd.total_deductions)
-            assert abs(yd.adjusted_gross_income - expected_agi) < 0.01, \
-                f"Year {year}: AGI ({yd.adjusted_gross_income}) should equal " \
-                f"gross_income ({yd.gross_income}) - total_deductions ({yd.total_deductions})"
+        years = [result.yearly_data[year] for year in range(2031, 2035)]
+        assert [yd.adjusted_gross_income for yd in years] == pytest.approx(
+            [max(0, yd.gross_income - yd.total_deductions) for yd in years], abs=0.01)
     
-    def test_hsa_deduction_reduces_tax_liability(self, calculator):
+    def test_hsa_deduction_reduces_tax_liability(self, cached_calculate):
         """Test that including HSA in deductions results in lower taxable income."""
-        spec = create_basic_spec()
-        spec['birthYear'] = 1970  # Medicare eligibility at 2035
-        spec['lastWorkingYear'] = 2030
-        spec['lastPlanningYear'] = 2036
-        spec['deferredCompensationPlan'] = {
-            'annualGrowthFraction': 0.05,
-            'disbursementYears': 3
-        }
-        spec['investments'] = {
-            'hsaBalance': 50000.0,
-            'hsaAppreciationRate': 0.07,
-            'hsaEmployerContribution': 1500.0
-        }
+        spec = spec_with(
+            birthYear=1970,  # Medicare eligibility at 2035
+            lastWorkingYear=2030,
+            lastPlanningYear=2036,
+            deferredCompensationPlan={
+                'annualGrowthFraction': 0.05,
+                'disbursementYears': 3
+            },
+            investments={
+                'hsaBalance': 50000.0,
+                'hsaAppreciationRate': 0.07,
+                'hsaEmployerContribution': 1500.0
+            },
+        )
         
-        result = calculator.calculate(spec)
+        result = cached_calculate(spec)
         
         # Year 2031 (disbursement, before Medicare) - HSA should reduce AGI
         y2031 = result.yearly_data[2031]
@@ -1366,109 +1153,99 @@ class TestHSAInTotalDeductionsDuringRetirement:
         
         # AGI should be gross_income - standard_deduction - employee_hsa
         expected_agi = max(0, y2031.gross_income - y2031.standard_deduction - y2031.employee_hsa)
-        assert abs(y2031.adjusted_gross_income - expected_agi) < 0.01
+        assert y2031.adjusted_gross_income == pytest.approx(expected_agi, abs=0.01)
 
 
 class TestMedicarePremiumSwitch:
     """Tests for switching from full insurance to Medicare premium at age 65."""
     
-    @pytest.fixture
-    def calculator(self):
-        """Create a PlanCalculator with mock dependencies."""
-        return PlanCalculator(
-            federal=create_mock_federal(),
-            state=create_mock_state(),
-            espp=create_mock_espp(),
-            social_security=create_mock_social_security(),
-            medicare=create_mock_medicare(),
-            rsu_calculator=create_mock_rsu_calculator()
-        )
-    
-    def test_uses_full_insurance_before_medicare(self, calculator):
+    def test_uses_full_insurance_before_medicare(self, cached_calculate):
         """Test that full insurance premium is used before Medicare eligibility."""
-        spec = create_basic_spec()
-        spec['birthYear'] = 1970  # Medicare eligibility at 2035
-        spec['lastWorkingYear'] = 2030
-        spec['lastPlanningYear'] = 2040
-        spec['insurance'] = {
-            'fullInsurancePremiums': 20000.0,
-            'medicarePremiums': 5000.0,
-            'premiumInflationRate': 0.0  # No inflation for simpler test
-        }
+        spec = spec_with(
+            birthYear=1970,  # Medicare eligibility at 2035
+            lastWorkingYear=2030,
+            lastPlanningYear=2040,
+            insurance={
+                'fullInsurancePremiums': 20000.0,
+                'medicarePremiums': 5000.0,
+                'premiumInflationRate': 0.0  # No inflation for simpler test
+            },
+        )
         
-        result = calculator.calculate(spec)
+        result = cached_calculate(spec)
         
         # Years before Medicare (2031-2034) should use full insurance premium
+        yearly_data = result.yearly_data
         for year in [2031, 2032, 2033, 2034]:
-            yd = result.yearly_data[year]
+            yd = yearly_data[year]
             assert yd.medical_premium == 20000.0, f"Year {year} should use full insurance"
             assert yd.medical_premium_expense == 20000.0
     
-    def test_uses_medicare_premium_at_eligibility(self, calculator):
+    def test_uses_medicare_premium_at_eligibility(self, cached_calculate):
         """Test that Medicare premium is used at Medicare eligibility year."""
-        spec = create_basic_spec()
-        spec['birthYear'] = 1970  # Medicare eligibility at 2035
-        spec['lastWorkingYear'] = 2030
-        spec['lastPlanningYear'] = 2040
-        spec['insurance'] = {
-            'fullInsurancePremiums': 20000.0,
-            'medicarePremiums': 5000.0,
-            'premiumInflationRate': 0.0  # No inflation for simpler test
-        }
+        spec = spec_with(
+            birthYear=1970,  # Medicare eligibility at 2035
+            lastWorkingYear=2030,
+            lastPlanningYear=2040,
+            insurance={
+                'fullInsurancePremiums': 20000.0,
+                'medicarePremiums': 5000.0,
+                'premiumInflationRate': 0.0  # No inflation for simpler test
+            },
+        )
         
-        result = calculator.calculate(spec)
+        result = cached_calculate(spec)
         
         # Medicare eligibility year (2035) should use Medicare premium
         y2035 = result.yearly_data[2035]
         assert y2035.medical_premium == 5000.0
         assert y2035.medical_premium_expense == 5000.0
     
-    def test_uses_medicare_premium_after_eligibility(self, calculator):
+    def test_uses_medicare_premium_after_eligibility(self, cached_calculate):
         """Test that Medicare premium continues after eligibility."""
-        spec = create_basic_spec()
-        spec['birthYear'] = 1970  # Medicare eligibility at 2035
-        spec['lastWorkingYear'] = 2030
-        spec['lastPlanningYear'] = 2040
-        spec['insurance'] = {
-            'fullInsurancePremiums': 20000.0,
-            'medicarePremiums': 5000.0,
-            'premiumInflationRate': 0.0  # No inflation for simpler test
-        }
+        spec = spec_with(
+            birthYear=1970,  # Medicare eligibility at 2035
+            lastWorkingYear=2030,
+            lastPlanningYear=2040,
+            insurance={
+                'fullInsurancePremiums': 20000.0,
+                'medicarePremiums': 5000.0,
+                'premiumInflationRate': 0.0  # No inflation for simpler test
+            },
+        )
         
-        result = calculator.calculate(spec)
+        result = cached_calculate(spec)
         
         # Years after Medicare eligibility should use Medicare premium
+        yearly_data = result.yearly_data
         for year in [2035, 2036, 2037, 2038, 2039, 2040]:
-            yd = result.yearly_data[year]
+            yd = yearly_data[year]
             assert yd.medical_premium == 5000.0, f"Year {year} should use Medicare"
             assert yd.medical_premium_expense == 5000.0
     
-    def test_medicare_premium_inflates_separately(self, calculator):
+    def test_medicare_premium_inflates_separately(self, cached_calculate):
         """Test that Medicare premium inflates along with full insurance premium."""
-        spec = create_basic_spec()
-        spec['birthYear'] = 1970  # Medicare eligibility at 2035
-        spec['lastWorkingYear'] = 2030
-        spec['lastPlanningYear'] = 2037
-        spec['insurance'] = {
-            'fullInsurancePremiums': 20000.0,
-            'medicarePremiums': 5000.0,
-            'premiumInflationRate': 0.05  # 5% inflation
-        }
-        
-        result = calculator.calculate(spec)
+        spec = spec_with(
+            birthYear=1970,  # Medicare eligibility at 2035
+            lastWorkingYear=2030,
+            lastPlanningYear=2037,
+            insurance={
+                'fullInsurancePremiums': 20000.0,
+                'medicarePremiums': 5000.0,
+                'premiumInflationRate': 0.05  # 5% inflation
+            },
+        )
         
-        # 2034 (before Medicare): full insurance with 8 inflations (2027-2034)
-        y2034 = result.yearly_data[2034]
-        expected_full_2034 = 20000 * (1.05 ** 8)
-        assert abs(y2034.medical_premium - expected_full_2034) < 0.01
+        result = cached_calculate(spec)
         
-        # 2035 (Medicare eligibility): Medicare premium with 9 inflations
-        y2035 = result.yearly_data[2035]
-        expected_medicare_2035 = 5000 * (1.05 ** 9)
-        assert abs(y2035.medical_premium - expected_medicare_2035) < 0.01
-        
-        # 2036: Medicare premium with 10 inflations
-        y2036 = result.yearly_data[2036]
-        expected_medicare_2036 = 5000 * (1.05 ** 10)
-        assert abs(y2036.medical_premium - expected_medicare_2036) < 0.01
+        expected = {
+            # Before Medicare: full insurance with 8 inflations (2027-2034)
+            2034: 20000 * (1.05 ** 8),
+            # Medicare eligibility: Medicare premium with 9 inflations
+            2035: 5000 * (1.05 ** 9),
+            # Medicare premium with 10 inflations
+            2036: 5000 * (1.05 ** 10),
+        }
+        premiums = {year: result.yearly_data[year].medical_premium for year in expected}
+        assert premiums == pytest.approx(expected, abs=0.01)
 
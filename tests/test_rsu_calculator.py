@@ -1,6 +1,5 @@
-import os
-import sys
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+import pytest
+
 from calc.rsu_calculator import RSUCalculator
 
 
@@ -53,7 +52,7 @@ def test_vested_value_calculation():
     # the stock price in 2026 is 250 * 1.07 = 267.50
     # so the vested value in 2026 is 130 * 267.50 = 34775.00
     vested_value_2026 = calculator.vested_value[2026]
-    assert round(vested_value_2026, 2) == 34775.00
+    assert vested_value_2026 == pytest.approx(34775.00, abs=0.01)
     # the number of shares vesting in 2027 is 120/4 + 140/4 + 160/4 + new grant shares
     # new grant value in 2026 is 100000 * 1.05^1 = 105000
     # new grant shares = 105000 / (250 * 1.07) = 392.52336449
@@ -61,7 +60,7 @@ def test_vested_value_calculation():
     # stock price in 2027 = 250 * 1.07^2 = 286.225
     # vested value in 2027 = 203.13084112 * 286.225 = 58141.125
     vested_value_2027 = calculator.vested_value[2027]
-    assert round(vested_value_2027, 2) == 58141.13
+    assert vested_value_2027 == pytest.approx(58141.13, abs=0.01)
     vested_value_2028 = calculator.vested_value[2028]
     # the vested value in 2028 is
     # shares vesting: 140/4 + 160/4 + 392.52336449/4 + new grant shares
@@ -70,5 +69,15 @@ def test_vested_value_calculation():
     # total shares vesting in 2028 = 35 + 40 + 98.13084112 + 385.18647917/4 = 269.42746091
     # stock price in 2028 = 250 * 1.07^3 = 306.26075
     # vested value in 2028 = 269.42746091 * 306.26075 = 82515.05624889
-    assert round(vested_value_2028, 2) == 82515.06
+    assert vested_value_2028 == pytest.approx(82515.06, abs=0.01)
+
+
+
+def test_previous_grants_not_modified():
+    """Test that construction leaves the caller's grants and the default untouched."""
+    previous_grants = [{"year": 2025, "grantShares": 160, "vestingPeriodYears": 4}]
+    RSUCalculator(previous_grants=previous_grants)
+    assert previous_grants == [{"year": 2025, "grantShares": 160, "vestingPeriodYears": 4}]
 
+    # Default-constructed calculators must not share generated grants
+    assert RSUCalculator().vested_value == RSUCalculator().vested_value
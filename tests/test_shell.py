@@ -1,20 +1,22 @@
 """Tests for the interactive shell functionality."""
 
 import pytest
-import sys
 import os
 import shutil
 import tempfile
+from collections import Counter
+from contextlib import redirect_stdout
 from io import StringIO
 
-# Add src directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 from shell import FinancialPlanShell, get_yearly_fields, load_plan
 from render.renderers import RENDERER_REGISTRY
 from model.field_metadata import FIELD_METADATA, get_short_name, get_description, wrap_header
 
 
+# Keep the whole module on one xdist worker so the temporary program tree,
+# the test plan and the fields output are built once.
+pytestmark = pytest.mark.xdist_group("shell")
+
 # Path to test fixtures
 FIXTURES_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), 'mcp_server_tests', 'fixtures'))
 
@@ -113,77 +115,60 @@ def load_test_plan(test_base_path: str, program_name: str = 'testprogram'):
     return calculator.calculate(spec)
 
 
+@pytest.fixture(scope="module")
+def testprogram_plan(test_base_path):
+    """Plan calculated once from the testprogram fixture.
+    
+    Shells hold per-test state such as loaded_programs, so tests still build
+    their own shell around this shared, read-only plan.
+    """
+    return load_test_plan(test_base_path, 'testprogram')
+
+
+@pytest.fixture(scope="module")
+def fields_output():
+    """Output of the fields command, captured once for the module."""
+    output = StringIO()
+    with redirect_stdout(output):
+        FinancialPlanShell().do_fields('')
+    return output.getvalue()
+
+
+def _parse_fields_output(text: str) -> dict:
+    """Split the fields command output into a {category: set of field names} dict."""
+    sections = {}
+    current = None
+    for line in text.splitlines():
+        if line.startswith('  ') and current is not None:
+            current.add(line.split()[0])
+        elif line.endswith(':'):
+            current = sections.setdefault(line[:-1], set())
+    return sections
+
+
+@pytest.fixture(scope="module")
+def fields_by_section(fields_output):
+    """Field names listed under each category of the fields command."""
+    return _parse_fields_output(fields_output)
+
+
 class TestFieldsCommand:
     """Test the fields command displays correct categories."""
     
-    def test_hsa_withdrawal_in_expenses_category(self):
+    def test_hsa_withdrawal_in_expenses_category(self, fields_by_section):
         """Test that hsa_withdrawal is listed in the Expenses category."""
-        shell = FinancialPlanShell()
-        
-        # Capture output
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
-            shell.do_fields('')
-        finally:
-            sys.stdout = old_stdout
-        
-        result = output.getvalue()
-        
-        # The Expenses section should contain hsa_withdrawal
-        assert 'hsa_withdrawal' in result
-        
-        # Verify it appears after "Expenses:" heading
-        expenses_idx = result.find('Expenses:')
-        hsa_withdrawal_idx = result.find('hsa_withdrawal')
-        assert expenses_idx != -1
-        assert hsa_withdrawal_idx != -1
-        assert hsa_withdrawal_idx > expenses_idx
-    
-    def test_medical_premium_fields_in_expenses_category(self):
+        assert 'hsa_withdrawal' in fields_by_section['Expenses']
+    
+    def test_medical_premium_fields_in_expenses_category(self, fields_by_section):
         """Test that medical_premium and medical_premium_expense are in Expenses."""
-        shell = FinancialPlanShell()
-        
-        # Capture output
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
-            shell.do_fields('')
-        finally:
-            sys.stdout = old_stdout
-        
-        result = output.getvalue()
-        
-        # Both medical premium fields should be in output
-        assert 'medical_premium' in result
-        assert 'medical_premium_expense' in result
+        assert {'medical_premium', 'medical_premium_expense'} <= fields_by_section['Expenses']
     
-    def test_all_yearly_fields_are_listed(self):
+    def test_all_yearly_fields_are_listed(self, fields_by_section):
         """Test that all YearlyData fields appear in the fields output."""
-        shell = FinancialPlanShell()
-        available_fields = get_yearly_fields()
-        
-        # Capture output
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
-            shell.do_fields('')
-        finally:
-            sys.stdout = old_stdout
-        
-        result = output.getvalue()
+        listed_fields = set().union(*fields_by_section.values())
         
         # Every field in YearlyData should appear in the output
-        missing_fields = []
-        for field in available_fields:
-            if field not in result:
-                missing_fields.append(field)
+        missing_fields = [field for field in get_yearly_fields() if field not in listed_fields]
         
         assert not missing_fields, f"Fields not listed in 'fields' command: {missing_fields}"
 
@@ -224,9 +209,9 @@ class TestFieldMetadata:
     
     def test_short_names_are_unique(self):
         """Test that all short names are unique."""
-        short_names = [info.short_name for info in FIELD_METADATA.values()]
-        duplicates = [name for name in short_names if short_names.count(name) > 1]
-        assert not duplicates, f"Duplicate short names: {set(duplicates)}"
+        short_name_counts = Counter(info.short_name for info in FIELD_METADATA.values())
+        duplicates = {name for name, count in short_name_counts.items() if count > 1}
+        assert not duplicates, f"Duplicate short names: {duplicates}"
     
     def test_get_short_name_returns_correct_value(self):
         """Test get_short_name returns the correct short name."""
@@ -276,40 +261,21 @@ class TestFieldMetadata:
         for line in result:
             assert len(line) <= 12
 
-    def test_fields_command_shows_short_names_and_descriptions(self):
+    def test_fields_command_shows_short_names_and_descriptions(self, fields_output):
         """Test that fields command displays short names and descriptions."""
-        shell = FinancialPlanShell()
-        
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
-            shell.do_fields('')
-        finally:
-            sys.stdout = old_stdout
-        
-        result = output.getvalue()
+        result = fields_output
         
         # Check that short names and descriptions appear
         assert 'Gross Inc' in result
         assert 'Take Home' in result
         assert 'taxable income' in result.lower() or 'gross income' in result.lower()
     
-    def test_fields_command_with_specific_field(self):
+    def test_fields_command_with_specific_field(self, capsys):
         """Test that fields command shows detailed info for a specific field."""
         shell = FinancialPlanShell()
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
-            shell.do_fields('gross_income')
-        finally:
-            sys.stdout = old_stdout
-        
-        result = output.getvalue()
+        shell.do_fields('gross_income')
+        result = capsys.readouterr().out
         
         assert 'gross_income' in result
         assert 'Gross Inc' in result
@@ -320,137 +286,62 @@ class TestRenderCommand:
     """Test the render command functionality."""
     
     @pytest.fixture
-    def shell_with_plan(self, test_base_path):
+    def shell_with_plan(self, testprogram_plan):
         """Create a shell with a loaded plan."""
-        plan_data = load_test_plan(test_base_path, 'testprogram')
-        return FinancialPlanShell(plan_data, 'testprogram')
+        return FinancialPlanShell(testprogram_plan, 'testprogram')
     
     @pytest.fixture
     def shell_without_plan(self):
         """Create a shell without a loaded plan."""
         return FinancialPlanShell()
     
-    def test_render_without_plan_shows_error(self, shell_without_plan):
+    def test_render_without_plan_shows_error(self, shell_without_plan, capsys):
         """Test that render command requires a loaded plan."""
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
-            shell_without_plan.do_render('')
-        finally:
-            sys.stdout = old_stdout
-        
-        result = output.getvalue()
+        shell_without_plan.do_render('')
+        result = capsys.readouterr().out
         assert "No plan loaded" in result
     
-    def test_render_no_args_lists_modes(self, shell_with_plan):
+    def test_render_no_args_lists_modes(self, shell_with_plan, capsys):
         """Test that render with no arguments lists available modes."""
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
-            shell_with_plan.do_render('')
-        finally:
-            sys.stdout = old_stdout
-        
-        result = output.getvalue()
+        shell_with_plan.do_render('')
+        result = capsys.readouterr().out
         assert "Available render modes" in result
         
         # Check that all registered modes are listed
         for mode in RENDERER_REGISTRY.keys():
             assert mode in result
     
-    def test_render_invalid_mode_shows_error(self, shell_with_plan):
-        """Test that invalid render mode shows error message."""
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
-            shell_with_plan.do_render('InvalidMode')
-        finally:
-            sys.stdout = old_stdout
-        
-        result = output.getvalue()
-        assert "Unknown render mode" in result
-        assert "InvalidMode" in result
-    
-    def test_render_balances_produces_output(self, shell_with_plan):
+    @pytest.mark.parametrize("arg, expected", [
+        ('InvalidMode', ["Unknown render mode", "InvalidMode"]),
+        ('TaxDetails', ["requires a year argument"]),
+        ('TaxDetails notayear', ["Invalid year"]),
+        ('TaxDetails 1900', ["must be between"]),
+    ], ids=['invalid_mode', 'tax_details_requires_year', 'tax_details_invalid_year',
+            'tax_details_out_of_range_year'])
+    def test_render_shows_error(self, shell_with_plan, capsys, arg, expected):
+        """Test that bad render arguments show the matching error message."""
+        shell_with_plan.do_render(arg)
+        result = capsys.readouterr().out
+        
+        for message in expected:
+            assert message in result
+    
+    def test_render_balances_produces_output(self, shell_with_plan, capsys):
         """Test that render Balances produces table output."""
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
-            shell_with_plan.do_render('Balances')
-        finally:
-            sys.stdout = old_stdout
-        
-        result = output.getvalue()
+        shell_with_plan.do_render('Balances')
+        result = capsys.readouterr().out
         # Should contain year data
         assert str(shell_with_plan.plan_data.first_year) in result
     
-    def test_render_tax_details_requires_year(self, shell_with_plan):
-        """Test that TaxDetails mode requires a year argument."""
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
-            shell_with_plan.do_render('TaxDetails')
-        finally:
-            sys.stdout = old_stdout
-        
-        result = output.getvalue()
-        assert "requires a year argument" in result
-    
-    def test_render_tax_details_with_year(self, shell_with_plan):
+    def test_render_tax_details_with_year(self, shell_with_plan, capsys):
         """Test that TaxDetails renders correctly with a year argument."""
         first_year = shell_with_plan.plan_data.first_year
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
-            shell_with_plan.do_render(f'TaxDetails {first_year}')
-        finally:
-            sys.stdout = old_stdout
-        
-        result = output.getvalue()
+        shell_with_plan.do_render(f'TaxDetails {first_year}')
+        result = capsys.readouterr().out
         # Should contain tax-related information
         assert str(first_year) in result
     
-    def test_render_tax_details_invalid_year(self, shell_with_plan):
-        """Test that TaxDetails with invalid year shows error."""
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
-            shell_with_plan.do_render('TaxDetails notayear')
-        finally:
-            sys.stdout = old_stdout
-        
-        result = output.getvalue()
-        assert "Invalid year" in result
-    
-    def test_render_tax_details_out_of_range_year(self, shell_with_plan):
-        """Test that TaxDetails with out-of-range year shows error."""
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
-            shell_with_plan.do_render('TaxDetails 1900')
-        finally:
-            sys.stdout = old_stdout
-        
-        result = output.getvalue()
-        assert "must be between" in result
-    
     def test_complete_render_returns_modes(self, shell_with_plan):
         """Test that tab completion returns available render modes."""
         completions = shell_with_plan.complete_render('', 'render ', 7, 7)
@@ -465,70 +356,38 @@ class TestRenderCommand:
         assert 'TaxDetails' in completions
         assert 'Balances' not in completions
     
-    def test_render_with_program_argument(self, shell_with_plan):
+    def test_render_with_program_argument(self, shell_with_plan, capsys):
         """Test that render accepts a program name as first argument."""
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
-            # Use the loaded program name
-            shell_with_plan.do_render('testprogram Balances')
-        finally:
-            sys.stdout = old_stdout
-        
-        result = output.getvalue()
+        # Use the loaded program name
+        shell_with_plan.do_render('testprogram Balances')
+        result = capsys.readouterr().out
         # Should contain year data from the program
         assert str(shell_with_plan.plan_data.first_year) in result
         # Should show indication of which program is being rendered
         assert "Unknown render mode" not in result
     
-    def test_render_with_program_and_year_range(self, shell_with_plan):
+    def test_render_with_program_and_year_range(self, shell_with_plan, capsys):
         """Test that render accepts program, mode, and year range."""
         first_year = shell_with_plan.plan_data.first_year
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
-            shell_with_plan.do_render(f'testprogram Balances {first_year}-{first_year+2}')
-        finally:
-            sys.stdout = old_stdout
-        
-        result = output.getvalue()
+        shell_with_plan.do_render(f'testprogram Balances {first_year}-{first_year+2}')
+        result = capsys.readouterr().out
         assert str(first_year) in result
         assert "Unknown render mode" not in result
     
-    def test_render_with_program_taxdetails(self, shell_with_plan):
+    def test_render_with_program_taxdetails(self, shell_with_plan, capsys):
         """Test that render accepts program name for TaxDetails mode."""
         first_year = shell_with_plan.plan_data.first_year
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
-            shell_with_plan.do_render(f'testprogram TaxDetails {first_year}')
-        finally:
-            sys.stdout = old_stdout
-        
-        result = output.getvalue()
+        shell_with_plan.do_render(f'testprogram TaxDetails {first_year}')
+        result = capsys.readouterr().out
         assert str(first_year) in result
         assert "Unknown render mode" not in result
     
-    def test_render_program_only_lists_modes(self, shell_with_plan):
+    def test_render_program_only_lists_modes(self, shell_with_plan, capsys):
         """Test that render with only program name lists available modes."""
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
-            shell_with_plan.do_render('testprogram')
-        finally:
-            sys.stdout = old_stdout
-        
-        result = output.getvalue()
+        shell_with_plan.do_render('testprogram')
+        result = capsys.readouterr().out
         assert "Available render modes" in result
         assert "testprogram" in result
     
@@ -550,36 +409,20 @@ class TestRenderCommand:
         for mode in RENDERER_REGISTRY.keys():
             assert mode in completions
     
-    def test_render_header_includes_program_name(self, shell_with_plan):
+    def test_render_header_includes_program_name(self, shell_with_plan, capsys):
         """Test that rendered report header includes the program name."""
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
-            shell_with_plan.do_render('Balances')
-        finally:
-            sys.stdout = old_stdout
-        
-        result = output.getvalue()
+        shell_with_plan.do_render('Balances')
+        result = capsys.readouterr().out
         # Header should include program name
         assert 'testprogram' in result
         assert 'ACCUMULATED BALANCES - testprogram' in result
     
-    def test_render_taxdetails_header_includes_program_name(self, shell_with_plan):
+    def test_render_taxdetails_header_includes_program_name(self, shell_with_plan, capsys):
         """Test that TaxDetails header includes the program name."""
         first_year = shell_with_plan.plan_data.first_year
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
-            shell_with_plan.do_render(f'TaxDetails {first_year}')
-        finally:
-            sys.stdout = old_stdout
-        
-        result = output.getvalue()
+        shell_with_plan.do_render(f'TaxDetails {first_year}')
+        result = capsys.readouterr().out
         # Header should include program name
         assert 'testprogram' in result
         assert f'TAX SUMMARY FOR {first_year} - testprogram' in result
@@ -676,188 +519,82 @@ class TestTabCompletion:
         assert isinstance(programs, list)
 
 
+@pytest.fixture(scope="module")
+def completion_shell():
+    """Shell without a loaded plan, shared by the read-only completion tests."""
+    return FinancialPlanShell()
+
+
+CASE_INSENSITIVE_COMPLETIONS = [
+    # (method, text, line, expected matches, unexpected matches)
+    ('complete_get', 'tax', 'get tax', {'federal_tax', 'state_tax', 'total_taxes', 'medicare_tax'}, set()),
+    ('complete_get', 'TAX', 'get TAX', {'federal_tax', 'state_tax', 'total_taxes', 'medicare_tax'}, set()),
+    ('complete_get', 'TaX', 'get TaX', {'federal_tax', 'state_tax', 'total_taxes', 'medicare_tax'}, set()),
+    ('complete_get', 'income', 'get income', {'gross_income', 'adjusted_gross_income', 'other_income'},
+     {'federal_tax'}),
+    ('complete_fields', 'BALANCE', 'fields BALANCE',
+     {'balance_ira', 'balance_hsa', 'balance_taxable', 'balance_deferred_comp'}, set()),
+    ('complete_fields', 'ira', 'fields ira', {'balance_ira', 'appreciation_ira', 'ira_withdrawal'}, set()),
+    ('completedefault', 'SALARY', 'get SALARY', {'base_salary'}, set()),
+    ('completedefault', 'contribution', 'get contribution',
+     {'employee_401k_contribution', 'total_401k_contribution', 'hsa_contribution',
+      'deferred_comp_contribution', 'taxable_contribution', 'total_contributions'}, set()),
+]
+
+
 class TestCaseInsensitiveTabCompletion:
     """Test case-insensitive substring matching for tab completion."""
     
-    @pytest.fixture
-    def shell(self):
-        """Create a shell without a loaded plan."""
-        return FinancialPlanShell()
-    
-    def test_complete_get_case_insensitive_lowercase(self, shell):
-        """Test that get completion is case-insensitive with lowercase input."""
-        completions = shell.complete_get('tax', 'get tax', 4, 7)
-        
-        # Should match fields containing 'tax' anywhere
-        assert 'federal_tax' in completions
-        assert 'state_tax' in completions
-        assert 'total_taxes' in completions
-        assert 'medicare_tax' in completions
-    
-    def test_complete_get_case_insensitive_uppercase(self, shell):
-        """Test that get completion is case-insensitive with uppercase input."""
-        completions = shell.complete_get('TAX', 'get TAX', 4, 7)
-        
-        # Should match fields containing 'tax' anywhere (case-insensitive)
-        assert 'federal_tax' in completions
-        assert 'state_tax' in completions
-        assert 'total_taxes' in completions
-    
-    def test_complete_get_case_insensitive_mixed_case(self, shell):
-        """Test that get completion is case-insensitive with mixed case input."""
-        completions = shell.complete_get('TaX', 'get TaX', 4, 7)
-        
-        # Should match fields containing 'tax' anywhere (case-insensitive)
-        assert 'federal_tax' in completions
-        assert 'state_tax' in completions
-    
-    def test_complete_get_substring_match(self, shell):
-        """Test that get completion matches substrings, not just prefixes."""
-        completions = shell.complete_get('income', 'get income', 4, 10)
-        
-        # Should match fields containing 'income' anywhere
-        assert 'gross_income' in completions
-        assert 'adjusted_gross_income' in completions
-        assert 'other_income' in completions
-        # Should not include fields without 'income'
-        assert 'federal_tax' not in completions
-    
-    def test_complete_fields_case_insensitive(self, shell):
-        """Test that fields completion is case-insensitive."""
-        completions = shell.complete_fields('BALANCE', 'fields BALANCE', 7, 14)
-        
-        # Should match fields containing 'balance' (case-insensitive)
-        assert 'balance_ira' in completions
-        assert 'balance_hsa' in completions
-        assert 'balance_taxable' in completions
-        assert 'balance_deferred_comp' in completions
-    
-    def test_complete_fields_substring_match(self, shell):
-        """Test that fields completion matches substrings."""
-        completions = shell.complete_fields('ira', 'fields ira', 7, 10)
-        
-        # Should match fields containing 'ira' anywhere
-        assert 'balance_ira' in completions
-        assert 'appreciation_ira' in completions
-        assert 'ira_withdrawal' in completions
-    
-    def test_completedefault_case_insensitive(self, shell):
-        """Test that default completion is case-insensitive for get command."""
-        completions = shell.completedefault('SALARY', 'get SALARY', 4, 10)
+    @pytest.mark.parametrize("method, text, line, expected, unexpected", CASE_INSENSITIVE_COMPLETIONS,
+                             ids=[f"{case[0]}-{case[1]}" for case in CASE_INSENSITIVE_COMPLETIONS])
+    def test_completion_matches_substring_case_insensitive(self, completion_shell, method, text, line,
+                                                           expected, unexpected):
+        """Test that field completion matches the text anywhere, ignoring case."""
+        completions = getattr(completion_shell, method)(text, line, len(line) - len(text), len(line))
         
-        # Should match fields containing 'salary' (case-insensitive)
-        assert 'base_salary' in completions
+        assert expected <= set(completions)
+        assert not unexpected & set(completions)
     
-    def test_completedefault_substring_match(self, shell):
-        """Test that default completion matches substrings for get command."""
-        completions = shell.completedefault('contribution', 'get contribution', 4, 16)
-        
-        # Should match fields containing 'contribution' anywhere
-        assert 'employee_401k_contribution' in completions
-        assert 'total_401k_contribution' in completions
-        assert 'hsa_contribution' in completions
-        assert 'deferred_comp_contribution' in completions
-        assert 'taxable_contribution' in completions
-        assert 'total_contributions' in completions
-    
-    def test_complete_get_empty_returns_all_fields(self, shell):
+    @pytest.mark.parametrize("method, line", [('complete_get', 'get '), ('complete_fields', 'fields ')])
+    def test_empty_text_returns_all_fields(self, completion_shell, method, line):
         """Test that empty text returns all fields."""
-        completions = shell.complete_get('', 'get ', 4, 4)
-        
-        assert len(completions) == len(shell.available_fields)
-    
-    def test_complete_fields_empty_returns_all_fields(self, shell):
-        """Test that empty text returns all fields for fields command."""
-        completions = shell.complete_fields('', 'fields ', 7, 7)
+        completions = getattr(completion_shell, method)('', line, len(line), len(line))
         
-        assert len(completions) == len(shell.available_fields)
+        assert len(completions) == len(completion_shell.available_fields)
 
 
 class TestCaseInsensitiveRendererSearch:
     """Test case-insensitive matching for render command and tab completion."""
     
     @pytest.fixture
-    def shell_with_plan(self, test_base_path):
+    def shell_with_plan(self, testprogram_plan):
         """Create a shell with a loaded plan."""
-        plan_data = load_test_plan(test_base_path, 'testprogram')
-        return FinancialPlanShell(plan_data, 'testprogram')
-    
-    def test_render_mode_case_insensitive_lowercase(self, shell_with_plan):
-        """Test that render mode lookup is case-insensitive with lowercase input."""
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
-            shell_with_plan.do_render('balances')
-        finally:
-            sys.stdout = old_stdout
-        
-        result = output.getvalue()
-        # Should successfully render, not show error
-        assert "Unknown render mode" not in result
-        assert str(shell_with_plan.plan_data.first_year) in result
-    
-    def test_render_mode_case_insensitive_uppercase(self, shell_with_plan):
-        """Test that render mode lookup is case-insensitive with uppercase input."""
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
-            shell_with_plan.do_render('BALANCES')
-        finally:
-            sys.stdout = old_stdout
-        
-        result = output.getvalue()
-        # Should successfully render, not show error
-        assert "Unknown render mode" not in result
-        assert str(shell_with_plan.plan_data.first_year) in result
+        return FinancialPlanShell(testprogram_plan, 'testprogram')
     
-    def test_render_mode_case_insensitive_mixed_case(self, shell_with_plan):
-        """Test that render mode lookup is case-insensitive with mixed case input."""
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
+    @pytest.mark.parametrize("mode", ['balances', 'BALANCES', 'BaLaNcEs'])
+    def test_render_mode_case_insensitive(self, shell_with_plan, capsys, mode):
+        """Test that render mode lookup is case-insensitive."""
+        shell_with_plan.do_render(mode)
+        result = capsys.readouterr().out
         
-        try:
-            shell_with_plan.do_render('BaLaNcEs')
-        finally:
-            sys.stdout = old_stdout
-        
-        result = output.getvalue()
         # Should successfully render, not show error
         assert "Unknown render mode" not in result
         assert str(shell_with_plan.plan_data.first_year) in result
     
-    def test_render_taxdetails_case_insensitive(self, shell_with_plan):
+    def test_render_taxdetails_case_insensitive(self, shell_with_plan, capsys):
         """Test that TaxDetails mode is case-insensitive."""
         first_year = shell_with_plan.plan_data.first_year
         
-        output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        
-        try:
-            shell_with_plan.do_render(f'taxdetails {first_year}')
-        finally:
-            sys.stdout = old_stdout
-        
-        result = output.getvalue()
+        shell_with_plan.do_render(f'taxdetails {first_year}')
+        result = capsys.readouterr().out
         # Should successfully render, not show error
         assert "Unknown render mode" not in result
         assert str(first_year) in result
     
-    def test_complete_render_case_insensitive_lowercase(self, shell_with_plan):
-        """Test that render tab completion is case-insensitive with lowercase input."""
-        completions = shell_with_plan.complete_render('tax', 'render tax', 7, 10)
-        
-        # Should match TaxDetails (case-insensitive)
-        assert 'TaxDetails' in completions
-    
-    def test_complete_render_case_insensitive_uppercase(self, shell_with_plan):
-        """Test that render tab completion is case-insensitive with uppercase input."""
-        completions = shell_with_plan.complete_render('TAX', 'render TAX', 7, 10)
+    @pytest.mark.parametrize("text", ['tax', 'TAX'])
+    def test_complete_render_case_insensitive(self, shell_with_plan, text):
+        """Test that render tab completion is case-insensitive."""
+        completions = shell_with_plan.complete_render(text, f'render {text}', 7, 10)
         
         # Should match TaxDetails (case-insensitive)
         assert 'TaxDetails' in completions
@@ -894,124 +631,75 @@ class TestCompareCommand:
     """Test the compare command functionality."""
     
     @pytest.fixture
-    def shell_with_two_programs(self, test_base_path):
+    def shell_with_two_programs(self, testprogram_plan):
         """Create a shell with two programs loaded for comparison."""
         # Load the same test program twice as if they were different programs
         # This is just for testing the compare functionality
-        plan = load_test_plan(test_base_path)
-        shell = FinancialPlanShell(plan, 'testprogram')
+        shell = FinancialPlanShell(testprogram_plan, 'testprogram')
         # Add as second program with different name for comparison
-        shell.loaded_programs['testprogram2'] = plan
+        shell.loaded_programs['testprogram2'] = testprogram_plan
         return shell
     
-    def test_compare_no_args_shows_help(self, shell_with_two_programs):
+    def test_compare_no_args_shows_help(self, shell_with_two_programs, capsys):
         """Test that compare with no arguments shows help."""
-        output = StringIO()
-        sys.stdout = output
-        try:
-            shell_with_two_programs.do_compare('')
-        finally:
-            sys.stdout = sys.__stdout__
-        
-        result = output.getvalue()
+        shell_with_two_programs.do_compare('')
+        result = capsys.readouterr().out
         assert 'Usage:' in result
         assert 'compare' in result
         assert 'program1' in result
     
-    def test_compare_shows_loaded_programs(self, shell_with_two_programs):
+    def test_compare_shows_loaded_programs(self, shell_with_two_programs, capsys):
         """Test that compare shows loaded programs in help."""
-        output = StringIO()
-        sys.stdout = output
-        try:
-            shell_with_two_programs.do_compare('')
-        finally:
-            sys.stdout = sys.__stdout__
-        
-        result = output.getvalue()
+        shell_with_two_programs.do_compare('')
+        result = capsys.readouterr().out
         assert 'testprogram' in result
         assert 'testprogram2' in result
     
-    def test_compare_too_few_args_shows_error(self, shell_with_two_programs):
+    def test_compare_too_few_args_shows_error(self, shell_with_two_programs, capsys):
         """Test that compare with too few arguments shows error."""
-        output = StringIO()
-        sys.stdout = output
-        try:
-            shell_with_two_programs.do_compare('testprogram')
-        finally:
-            sys.stdout = sys.__stdout__
-        
-        result = output.getvalue()
+        shell_with_two_programs.do_compare('testprogram')
+        result = capsys.readouterr().out
         assert 'Error' in result
         assert 'two program names' in result
     
-    def test_compare_invalid_field_shows_error(self, shell_with_two_programs):
+    def test_compare_invalid_field_shows_error(self, shell_with_two_programs, capsys):
         """Test that compare with invalid field shows error."""
-        output = StringIO()
-        sys.stdout = output
-        try:
-            shell_with_two_programs.do_compare('testprogram testprogram2 invalid_field')
-        finally:
-            sys.stdout = sys.__stdout__
-        
-        result = output.getvalue()
+        shell_with_two_programs.do_compare('testprogram testprogram2 invalid_field')
+        result = capsys.readouterr().out
         assert 'Unknown field' in result
         assert 'invalid_field' in result
     
-    def test_compare_valid_single_field(self, shell_with_two_programs):
+    def test_compare_valid_single_field(self, shell_with_two_programs, capsys):
         """Test compare with a valid single field."""
-        output = StringIO()
-        sys.stdout = output
-        try:
-            shell_with_two_programs.do_compare('testprogram testprogram2 gross_income')
-        finally:
-            sys.stdout = sys.__stdout__
-        
-        result = output.getvalue()
+        shell_with_two_programs.do_compare('testprogram testprogram2 gross_income')
+        result = capsys.readouterr().out
         assert 'COMPARISON:' in result
         assert 'testprogram' in result
         assert 'testprogram2' in result
         assert 'Gross Income' in result
     
-    def test_compare_valid_multiple_fields(self, shell_with_two_programs):
+    def test_compare_valid_multiple_fields(self, shell_with_two_programs, capsys):
         """Test compare with multiple valid fields."""
-        output = StringIO()
-        sys.stdout = output
-        try:
-            shell_with_two_programs.do_compare('testprogram testprogram2 gross_income, total_taxes')
-        finally:
-            sys.stdout = sys.__stdout__
-        
-        result = output.getvalue()
+        shell_with_two_programs.do_compare('testprogram testprogram2 gross_income, total_taxes')
+        result = capsys.readouterr().out
         assert 'COMPARISON:' in result
         assert 'Gross Income' in result
         assert 'Total Taxes' in result
     
-    def test_compare_with_year_range(self, shell_with_two_programs):
+    def test_compare_with_year_range(self, shell_with_two_programs, capsys):
         """Test compare with year range."""
-        output = StringIO()
-        sys.stdout = output
-        try:
-            shell_with_two_programs.do_compare('testprogram testprogram2 gross_income 2026-2028')
-        finally:
-            sys.stdout = sys.__stdout__
-        
-        result = output.getvalue()
+        shell_with_two_programs.do_compare('testprogram testprogram2 gross_income 2026-2028')
+        result = capsys.readouterr().out
         assert 'COMPARISON:' in result
         # Should only show years in the range
         assert '2026' in result
         assert '2027' in result
         assert '2028' in result
     
-    def test_compare_shows_totals(self, shell_with_two_programs):
+    def test_compare_shows_totals(self, shell_with_two_programs, capsys):
         """Test that compare shows totals row."""
-        output = StringIO()
-        sys.stdout = output
-        try:
-            shell_with_two_programs.do_compare('testprogram testprogram2 gross_income')
-        finally:
-            sys.stdout = sys.__stdout__
-        
-        result = output.getvalue()
+        shell_with_two_programs.do_compare('testprogram testprogram2 gross_income')
+        result = capsys.readouterr().out
         assert 'Total' in result
     
     def test_complete_compare_returns_programs(self, shell_with_two_programs):
@@ -1039,16 +727,10 @@ class TestCompareCommand:
         assert 'total_taxes' in completions
         assert 'take_home_pay' in completions
     
-    def test_compare_column_headers_include_program_names(self, shell_with_two_programs):
+    def test_compare_column_headers_include_program_names(self, shell_with_two_programs, capsys):
         """Test that compare column headers include program names."""
-        output = StringIO()
-        sys.stdout = output
-        try:
-            shell_with_two_programs.do_compare('testprogram testprogram2 gross_income')
-        finally:
-            sys.stdout = sys.__stdout__
-        
-        result = output.getvalue()
+        shell_with_two_programs.do_compare('testprogram testprogram2 gross_income')
+        result = capsys.readouterr().out
         # Headers should include program names in parentheses
         assert '(testprogram)' in result
         assert '(testprogram2)' in result
@@ -1,13 +1,10 @@
 """Tests for the spec generator module."""
 
 import os
-import sys
 import json
 import tempfile
 import shutil
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
-
 from spec_generator import save_spec, load_existing_spec, get_nested, list_existing_programs
 
 
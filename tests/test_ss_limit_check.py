@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import MagicMock
+from dataclasses import replace
 from calc.plan_calculator import PlanCalculator
 from model.PlanData import YearlyData
 
@@ -7,36 +7,18 @@ class TestSSLimitCheck:
     """Test that Social Security tax calculations respect the annual limit."""
     
     @pytest.fixture
-    def calculator(self):
-        """Create a calculator instance with mocked dependencies."""
-        fed = MagicMock()
-        state = MagicMock()
-        espp = MagicMock()
-        ss = MagicMock()
-        medicare = MagicMock()
-        rsu = MagicMock()
-        
+    def calculator(self, plan_dependencies):
+        """Create a calculator instance with the shared fake dependencies."""
         # Setup SS data
         # 2026 limit: 184,500
         # Rate: 6.2%
         self.ss_limit = 184500
         self.ss_rate = 0.062
         
-        ss.get_data_for_year.return_value = {
-            "maximumTaxedIncome": self.ss_limit,
-            "employeePortion": self.ss_rate,
-            "maPFML": 0.0
-        }
-        # Set wage_base attribute for paycheck calculations
-        ss.wage_base = self.ss_limit
-        
-        # Setup Medicare data
-        medicare.medicare_rate = 0.0145
-        medicare.surcharge_threshold = 200000
-        medicare.surcharge_rate = 0.009
-        
-        calc = PlanCalculator(fed, state, espp, ss, medicare, rsu)
-        return calc
+        ss = replace(plan_dependencies['social_security'],
+                     wage_base=self.ss_limit, employee_portion=self.ss_rate, ma_pfml=0.0)
+        
+        return PlanCalculator(**{**plan_dependencies, 'social_security': ss})
     
     def test_ss_tax_sum_matches_limit_bonus_after_limit(self, calculator):
         """